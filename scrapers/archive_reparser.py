@@ -0,0 +1,138 @@
+# An Offline Re-parser -- datasets rebuilt from the HTML archive with a pool of lxml worker processes, no browser or network
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from lxml import html
+import asyncio
+import os
+import sys
+import time
+from campaign import CAMPAIGN_SITES
+from company_cache import CompanyCache
+from crawl_engine import setup_logging
+from date_normalizer import DateNormalizer
+from html_archive import ARCHIVE_DIR, HtmlArchive
+from record_journal import RecordJournal
+
+REPARSE_WORKERS = os.cpu_count() or 1
+REPARSE_CHUNK_SIZE = 500  # Archived job pages handed to a worker process at a time
+UTF8_HTML_PARSER = html.HTMLParser(encoding="utf-8")  # Archived pages are stored as UTF-8
+
+
+class ArchiveFetcher:
+    """Stands in for HttpFetcher, answering fetch_document from the archive so an adapter's HTTP path re-parses it"""
+
+    def __init__(self, archive):
+        self.archive = archive
+        self.job_pages = {}  # Job URL -> content hash of the fetch being re-parsed
+        self.stats = {"fetched": 0, "failed": 0}
+
+    async def fetch_document(self, url, kind=None, site=None, job_id=None):
+        content_hash = self.job_pages.get(url)
+        page_html = self.archive.read(content_hash) if content_hash else self.archive.latest_by_url(url)
+        if page_html is None:
+            self.stats["failed"] += 1
+            return None
+        self.stats["fetched"] += 1
+        return html.fromstring(page_html.encode("utf-8"), parser=UTF8_HTML_PARSER, base_url=url)
+
+
+def silence_worker():
+    # The scrapers print a line per job, the parent process reports progress instead
+    sys.stdout = open(os.devnull, "w")
+
+
+def can_reparse(adapter):
+    return adapter.supports_http or adapter.reparses_archive
+
+
+def reparse_chunk(name, archive_root, pages):
+    """Worker process entry point: re-parse (url, fetched_at, content_hash) pages into (link, record) pairs and (url, reason) failures"""
+    adapter = CAMPAIGN_SITES[name]("", 1)
+    archive = HtmlArchive(archive_root)
+    fetcher = ArchiveFetcher(archive)
+    # In memory only: company profiles come from the archived company pages, never from a live run's cache
+    company_cache = CompanyCache(name, cache_dir=os.path.join(archive_root, "reparse"))
+    normalizers = {}
+    parsed = []
+    failed = []
+
+    async def parse_pages():
+        for url, fetched_at, content_hash in pages:
+            # Relative dates resolve against the hour the page was fetched, not today
+            reference_time = datetime.fromtimestamp(fetched_at).replace(minute=0, second=0, microsecond=0)
+            if reference_time not in normalizers:
+                normalizers[reference_time] = DateNormalizer(reference_time, adapter.short_date_units)
+            adapter.date_normalizer = normalizers[reference_time]
+            fetcher.job_pages = {url: content_hash}
+            link = adapter.link_from_url(url)
+            try:
+                record = await adapter.scrape_job_http(fetcher, link, company_cache)
+            except Exception as e:
+                failed.append((url, str(e)))
+                continue
+            if record is None:
+                failed.append((url, "required fields missing"))
+            else:
+                parsed.append((link, record))
+
+    try:
+        asyncio.run(parse_pages())
+    finally:
+        archive.close()
+    return parsed, failed
+
+
+def reparse_archive(name, archive_root=ARCHIVE_DIR, since=None, until=None, workers=REPARSE_WORKERS,
+                    chunk_size=REPARSE_CHUNK_SIZE):
+    """Rebuild one portal's dataset from the newest archived fetch of every job page, written like a crawl's final CSV"""
+    adapter = CAMPAIGN_SITES[name]("", 1)
+    if not can_reparse(adapter):
+        print(f"{name} has no lxml field extraction, its pages cannot be re-parsed")
+        return None
+    started = time.perf_counter()
+    archive = HtmlArchive(archive_root)
+    try:
+        rows = archive.pages(name, "job", since, until)
+    finally:
+        archive.close()
+    pages = [(row["url"], row["fetched_at"], row["content_hash"]) for row in rows]
+    if not pages:
+        print(f"No archived job pages for {name}")
+        return None
+    chunks = [pages[start:start + chunk_size] for start in range(0, len(pages), chunk_size)]
+    print(f"Re-parsing {len(pages)} archived {name} job pages in {len(chunks)} chunks on {workers} worker processes")
+    journal = RecordJournal(f"data/{name}_reparsed_journal.jsonl")
+    failed = []
+    with ProcessPoolExecutor(max_workers=workers, initializer=silence_worker) as executor:
+        futures = [executor.submit(reparse_chunk, name, archive_root, chunk) for chunk in chunks]
+        # Collected in archive order, so the same archive always gives the same file
+        for done, future in enumerate(futures, start=1):
+            chunk_parsed, chunk_failed = future.result()
+            for link, record in chunk_parsed:
+                journal.append(link, record)
+            failed.extend(chunk_failed)
+            print(f"Chunk {done}/{len(chunks)}: {journal.count} parsed, {len(failed)} failed")
+    final_filename = f"data/{name}_reparsed_final.csv"
+    journal.to_csv(final_filename)
+    seconds = time.perf_counter() - started
+    print(f"\nRe-parsed {journal.count} of {len(pages)} job pages in {seconds:.1f}s ({len(pages) / seconds:.0f} pages/s)")
+    print(f"Dataset saved to: {final_filename}")
+    if failed:
+        print(f"{len(failed)} pages could not be re-parsed, e.g. {failed[0][0]}: {failed[0][1]}")
+    return final_filename
+
+
+def parse_day(text):
+    return datetime.strptime(text, "%Y-%m-%d").timestamp() if text else None
+
+
+if __name__ == "__main__":
+    print("| = | = | = | Archive Re-parser | = | = | = |")
+    print(f"Portals with an lxml path: {', '.join(name for name, build in CAMPAIGN_SITES.items() if can_reparse(build('', 1)))}")
+    site_input = input("Portals, comma separated: ").strip()
+    since = parse_day(input("Pages fetched since (YYYY-MM-DD, blank for all): ").strip())
+    until = parse_day(input("Pages fetched before (YYYY-MM-DD, blank for all): ").strip())
+    workers = int(input(f"Worker processes (default {REPARSE_WORKERS}): ") or str(REPARSE_WORKERS))
+    log_file = setup_logging("archive_reparse")
+    for name in [site.strip() for site in site_input.split(",") if site.strip()]:
+        reparse_archive(name, since=since, until=until, workers=workers)
@@ -0,0 +1,126 @@
+# A Browser Memory Monitor -- recycle Chromium when its measured memory or page error rate says so
+import asyncio
+import collections
+import os
+import time
+import psutil
+
+BROWSER_RSS_CEILING_MB = 2048  # Browser, renderer and helper processes together
+RECYCLE_ERROR_WINDOW = 50  # Page attempts the error rate is measured over
+RECYCLE_ERROR_RATE = 0.5  # Failure share of a full window that recycles the browser
+RECYCLE_MAX_JOBS = 0  # Fixed job cap per browser, 0 leaves recycling to memory and errors
+MEMORY_SAMPLE_INTERVAL = 15  # Seconds between memory samples
+MEMORY_LOG_COLUMNS = "time,run,generation,jobs,browser_mb,renderer_mb,other_mb,processes,error_rate,recycle_reason\n"
+
+
+class BrowserMonitor:
+    """Samples one browser's process memory and its page outcomes, and names the reason to recycle it"""
+
+    def __init__(self, browser, run_name, generation, ceiling_mb=BROWSER_RSS_CEILING_MB, max_jobs=RECYCLE_MAX_JOBS,
+                 log_path=None):
+        self.browser = browser
+        self.run_name = run_name
+        self.generation = generation
+        self.ceiling_mb = ceiling_mb
+        self.max_jobs = max_jobs
+        self.log_path = log_path or f"data/memory_{run_name}.csv"
+        self.outcomes = collections.deque(maxlen=RECYCLE_ERROR_WINDOW)
+        self.jobs = 0
+        self.cdp_session = None
+        self.sampler = None
+        self.recycle_reason = None
+        self.memory_exceeded = False  # The browser itself has to go, a fresh context on it would not help
+        self.peak_mb = 0.0
+
+    async def start(self):
+        try:
+            # Chromium reports the pid and type of every process that belongs to this browser
+            self.cdp_session = await self.browser.new_browser_cdp_session()
+        except Exception as e:
+            print(f"Browser process info unavailable, measuring every Chromium process instead: {e}")
+        if not os.path.exists(self.log_path):
+            with open(self.log_path, "w", encoding="utf-8") as f:
+                f.write(MEMORY_LOG_COLUMNS)
+        self.sampler = asyncio.create_task(self.sample_forever())
+        return self
+
+    async def browser_processes(self):
+        if self.cdp_session is not None:
+            try:
+                info = await self.cdp_session.send("SystemInfo.getProcessInfo")
+                return [(process["type"], process["id"]) for process in info["processInfo"]]
+            except Exception:
+                self.cdp_session = None
+        processes = []
+        for process in psutil.Process().children(recursive=True):
+            try:
+                name = process.name().lower()
+                if "chrom" not in name and "headless_shell" not in name:
+                    continue
+                cmdline = " ".join(process.cmdline())
+            except psutil.Error:
+                continue
+            if "--type=renderer" in cmdline:
+                processes.append(("renderer", process.pid))
+            elif "--type=" in cmdline:
+                processes.append(("other", process.pid))
+            else:
+                processes.append(("browser", process.pid))
+        return processes
+
+    async def sample(self):
+        usage = {"browser": 0.0, "renderer": 0.0, "other": 0.0}
+        processes = await self.browser_processes()
+        for process_type, pid in processes:
+            try:
+                rss_mb = psutil.Process(pid).memory_info().rss / (1024 * 1024)
+            except psutil.Error:
+                continue
+            usage[process_type if process_type in usage else "other"] += rss_mb
+        total_mb = sum(usage.values())
+        self.peak_mb = max(self.peak_mb, total_mb)
+        if total_mb > self.ceiling_mb and self.recycle_reason is None:
+            self.memory_exceeded = True
+            self.recycle_reason = f"memory {total_mb:.0f} MB above the {self.ceiling_mb} MB ceiling"
+        error_rate = self.error_rate()
+        with open(self.log_path, "a", encoding="utf-8") as f:
+            f.write(f"{time.time():.0f},{self.run_name},{self.generation},{self.jobs},{usage['browser']:.1f},"
+                    f"{usage['renderer']:.1f},{usage['other']:.1f},{len(processes)},{error_rate:.2f},"
+                    f"{self.recycle_reason or ''}\n")
+        print(f"Memory [{self.run_name} #{self.generation}]: {total_mb:.0f} MB (browser {usage['browser']:.0f}, "
+              f"renderers {usage['renderer']:.0f}, other {usage['other']:.0f}) in {len(processes)} processes "
+              f"after {self.jobs} jobs, page error rate {error_rate:.0%}")
+
+    async def sample_forever(self):
+        while True:
+            await asyncio.sleep(MEMORY_SAMPLE_INTERVAL)
+            try:
+                await self.sample()
+            except Exception as e:
+                print(f"Memory sample failed: {e}")
+
+    def error_rate(self):
+        return self.outcomes.count(False) / len(self.outcomes) if self.outcomes else 0.0
+
+    def record(self, success):
+        self.jobs += 1
+        self.outcomes.append(success)
+        if self.recycle_reason is not None:
+            return
+        if len(self.outcomes) == self.outcomes.maxlen and self.error_rate() >= RECYCLE_ERROR_RATE:
+            self.recycle_reason = f"page error rate {self.error_rate():.0%} over the last {len(self.outcomes)} attempts"
+        elif self.max_jobs and self.jobs >= self.max_jobs:
+            self.recycle_reason = f"{self.jobs} jobs served"
+
+    async def stop(self):
+        if self.sampler is not None:
+            self.sampler.cancel()
+        try:
+            await self.sample()
+        except Exception:
+            pass
+        if self.cdp_session is not None:
+            try:
+                await self.cdp_session.detach()
+            except Exception:
+                pass
@@ -0,0 +1,73 @@
+# A Shared Browser Pool -- the runs of a campaign open their contexts on a few long-lived browsers
+from playwright.async_api import async_playwright
+import asyncio
+
+BROWSER_POOL_SIZE = 2  # Browsers shared by every run of a campaign
+
+
+class BrowserPool:
+    """Launches up to size browsers and hands out the one with the fewest open contexts"""
+
+    def __init__(self, size=BROWSER_POOL_SIZE, headless=False):
+        self.size = size
+        self.headless = headless
+        self.playwright = None
+        self.browsers = {}  # Browser -> contexts currently opened on it by runs
+        self.retiring = {}  # Browser out of rotation -> contexts still open on it, closed once none are left
+        self.lock = asyncio.Lock()
+        self.stats = {"launches": 0, "relaunches": 0, "retired": 0, "acquired": 0, "peak_contexts": 0}
+
+    async def start(self):
+        self.playwright = await async_playwright().start()
+        return self
+
+    async def acquire(self):
+        async with self.lock:
+            for browser in [browser for browser in self.browsers if not browser.is_connected()]:
+                # A crashed browser is replaced, runs on it already failed their pages
+                del self.browsers[browser]
+                self.stats["relaunches"] += 1
+            if len(self.browsers) < self.size:
+                browser = await self.playwright.chromium.launch(headless=self.headless)
+                self.browsers[browser] = 0
+                self.stats["launches"] += 1
+            browser = min(self.browsers, key=self.browsers.get)
+            self.browsers[browser] += 1
+            self.stats["acquired"] += 1
+            self.stats["peak_contexts"] = max(self.stats["peak_contexts"], sum(self.browsers.values()))
+        return browser
+
+    async def release(self, browser):
+        async with self.lock:
+            if browser in self.browsers:
+                self.browsers[browser] -= 1
+                return
+            if browser not in self.retiring:
+                return
+            self.retiring[browser] -= 1
+            if self.retiring[browser] > 0:
+                return
+            del self.retiring[browser]
+        await browser.close()
+
+    async def retire(self, browser):
+        """Release a context and take its browser out of rotation, the next acquire launches a fresh one in its place"""
+        async with self.lock:
+            if browser in self.browsers:
+                self.retiring[browser] = self.browsers.pop(browser)
+                self.stats["retired"] += 1
+        # Closed here, or by the release of the last run still using it
+        await self.release(browser)
+
+    async def close(self):
+        for browser in list(self.browsers) + list(self.retiring):
+            await browser.close()
+        self.browsers = {}
+        self.retiring = {}
+        await self.playwright.stop()
+
+    def print_stats(self):
+        stats = self.stats
+        print(f"Browser pool: {stats['launches']} browsers launched ({stats['relaunches']} after crashes, "
+              f"{stats['retired']} retired on memory), "
+              f"{stats['acquired']} contexts opened, peak {stats['peak_contexts']} at once")
@@ -0,0 +1,206 @@
+# A Campaign Scheduler -- every portal x keyword combination in one run, interleaved over shared browsers
+import asyncio
+import time
+import pandas as pd
+from browser_pool import BrowserPool
+from crawl_engine import HEADLESS, CrawlEngine, setup_logging
+from job_registry import JobRegistry
+from record_journal import RecordJournal, read_entries
+from careerviet_scraper_new import CareerVietAdapter
+from job_street_scraper import JobStreetAdapter
+from jobnet_scraper_new import JobNetAdapter
+from vietnamworks_scraper_new import VietnamWorksAdapter
+
+CAMPAIGN_PARALLEL_RUNS = 4  # Combinations crawled at once
+CAMPAIGN_RUNS_PER_SITE = 1  # Combinations of the same portal at once, so no single host carries the campaign
+CAMPAIGN_PROGRESS_INTERVAL = 30  # Seconds between progress reports
+
+# Adapter per portal, keywords are given with spaces and formatted the way each portal's search URL expects
+CAMPAIGN_SITES = {
+    "jobstreet_id": lambda keyword, max_pages: JobStreetAdapter("id", "jobstreet", "", keyword.replace(" ", "-"), max_pages),
+    "jobstreet_my": lambda keyword, max_pages: JobStreetAdapter("my", "jobstreet", "", keyword.replace(" ", "-"), max_pages),
+    "jobstreet_ph": lambda keyword, max_pages: JobStreetAdapter("ph", "jobstreet", "", keyword.replace(" ", "-"), max_pages),
+    "jobstreet_sg": lambda keyword, max_pages: JobStreetAdapter("sg", "jobstreet", "", keyword.replace(" ", "-"), max_pages),
+    "jobsdb_th": lambda keyword, max_pages: JobStreetAdapter("th", "jobsdb", "", keyword.replace(" ", "-"), max_pages),
+    "jobnet_mm": lambda keyword, max_pages: JobNetAdapter("mm", keyword.replace(" ", "+"), max_pages),
+    "jobnet_kh": lambda keyword, max_pages: JobNetAdapter("kh", keyword.replace(" ", "+"), max_pages),
+    "vietnamworks_vn": lambda keyword, max_pages: VietnamWorksAdapter(keyword.replace(" ", "-"), max_pages),
+    "careerviet_vn": lambda keyword, max_pages: CareerVietAdapter(keyword.replace(" ", "-"), max_pages),
+}
+
+
+class CampaignRun:
+    """One portal x keyword combination and its progress"""
+
+    def __init__(self, site, keyword, adapter):
+        self.site = site
+        self.keyword = keyword
+        self.adapter = adapter
+        self.engine = None
+        self.status = "queued"
+        self.scraped = 0
+        self.failed = 0
+        self.seconds = 0.0
+        self.error = ""
+
+    def record_progress(self, link, success):
+        if success:
+            self.scraped += 1
+        else:
+            self.failed += 1
+
+    def describe(self):
+        total = self.engine.total_links if self.engine is not None else 0
+        return f"{self.site} '{self.keyword}': {self.scraped + self.failed}/{total} ({self.failed} failed)"
+
+
+class Campaign:
+    """Runs a portal x keyword matrix concurrently on one browser pool and the process-wide rate limiter"""
+
+    def __init__(self, name, sites, keywords, max_pages=50, max_retries=2, incremental=False,
+                 parallel_runs=CAMPAIGN_PARALLEL_RUNS, runs_per_site=CAMPAIGN_RUNS_PER_SITE):
+        self.name = name
+        self.max_retries = max_retries
+        self.incremental = incremental
+        self.parallel_runs = parallel_runs
+        self.runs_per_site = runs_per_site
+        self.browser_pool = None
+        self.job_registry = JobRegistry()
+        # Keyword-major order, so the runs started next to each other are on different portals
+        self.runs = [
+            CampaignRun(site, keyword, CAMPAIGN_SITES[site](keyword, max_pages))
+            for keyword in keywords for site in sites
+        ]
+
+    def next_run(self, running):
+        busy_sites = [run.site for run in running]
+        for run in self.runs:
+            if run.status == "queued" and busy_sites.count(run.site) < self.runs_per_site:
+                return run
+        return None
+
+    async def crawl_combination(self, run):
+        started = time.perf_counter()
+        run.engine = CrawlEngine(run.adapter, self.max_retries, self.incremental)
+        run.engine.browser_pool = self.browser_pool
+        run.engine.job_registry = self.job_registry
+        run.engine.on_progress = run.record_progress
+        print(f"\n[Campaign] Starting {run.site} '{run.keyword}'")
+        try:
+            await run.engine.run()
+            run.status = "done"
+        except Exception as e:
+            # One broken portal or keyword does not stop the rest of the campaign
+            run.status = "failed"
+            run.error = str(e)
+            print(f"[Campaign] {run.site} '{run.keyword}' failed: {e}")
+        run.seconds = time.perf_counter() - started
+        print(f"[Campaign] Finished {run.describe()} in {run.seconds:.1f}s")
+
+    async def report_progress(self):
+        while True:
+            await asyncio.sleep(CAMPAIGN_PROGRESS_INTERVAL)
+            finished = sum(run.status in ("done", "failed") for run in self.runs)
+            scraped = sum(run.scraped for run in self.runs)
+            failed = sum(run.failed for run in self.runs)
+            print(f"\n[Campaign] {finished}/{len(self.runs)} combinations finished, {scraped} jobs scraped, {failed} failed")
+            for run in self.runs:
+                if run.status == "running":
+                    print(f"[Campaign]   {run.describe()}")
+
+    async def run(self):
+        print(f"Campaign {self.name}: {len(self.runs)} combinations, {self.parallel_runs} at once, "
+              f"{self.runs_per_site} per portal")
+        started = time.perf_counter()
+        self.browser_pool = await BrowserPool(headless=HEADLESS).start()
+        monitor = asyncio.create_task(self.report_progress())
+        tasks = {}
+        try:
+            while True:
+                while len(tasks) < self.parallel_runs:
+                    run = self.next_run(tasks.values())
+                    if run is None:
+                        break
+                    run.status = "running"
+                    tasks[asyncio.create_task(self.crawl_combination(run))] = run
+                if not tasks:
+                    break
+                finished, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in finished:
+                    del tasks[task]
+        finally:
+            monitor.cancel()
+            for task in tasks:
+                task.cancel()
+            await self.browser_pool.close()
+        self.print_summary(time.perf_counter() - started)
+        self.save_summary()
+        self.save_jobs()
+
+    def print_summary(self, seconds):
+        print(f"\n{'='*60}")
+        print(f"CAMPAIGN SUMMARY: {self.name}")
+        print(f"{'='*60}")
+        for run in self.runs:
+            print(f"{run.status:>7} | {run.describe()} in {run.seconds:.1f}s {run.error}")
+        done = sum(run.status == "done" for run in self.runs)
+        print(f"\nCombinations finished: {done} of {len(self.runs)}")
+        print(f"Jobs scraped: {sum(run.scraped for run in self.runs)}")
+        print(f"Jobs failed: {sum(run.failed for run in self.runs)}")
+        print(f"Campaign time: {seconds:.1f}s")
+        self.browser_pool.print_stats()
+        self.job_registry.print_stats()
+
+    def save_summary(self):
+        filename = f"data/campaign_{self.name}_summary.csv"
+        pd.DataFrame([
+            {
+                "site": run.site,
+                "keyword": run.keyword,
+                "status": run.status,
+                "job_links": run.engine.total_links if run.engine is not None else 0,
+                "scraped": run.scraped,
+                "failed": run.failed,
+                "seconds": round(run.seconds, 1),
+                "error": run.error,
+            }
+            for run in self.runs
+        ]).to_csv(filename, index=False, encoding='utf-8-sig')
+        print(f"Campaign summary saved to: {filename}")
+
+    def save_jobs(self):
+        """One CSV per portal with every posting once and the campaign keywords that matched it"""
+        journals = {}
+        for run in self.runs:
+            if run.engine is None or run.engine.journal is None:
+                continue
+            journal = journals.get(run.adapter.name)
+            if journal is None:
+                journal = journals[run.adapter.name] = RecordJournal(f"data/campaign_{self.name}_{run.adapter.name}_journal.jsonl")
+            for entry in read_entries(run.engine.journal.path):
+                key = run.adapter.job_id_from_link(entry["job_link"])
+                if key in journal.links:
+                    continue
+                record = dict(entry["record"])
+                record["matched_keywords"] = self.job_registry.matched_keywords(run.adapter, entry["job_link"])
+                journal.append(key, record)
+        for name, journal in journals.items():
+            filename = f"data/campaign_{self.name}_{name}_jobs.csv"
+            journal.to_csv(filename)
+            print(f"Campaign jobs for {name} saved to: {filename} ({journal.count} postings)")
+
+
+if __name__ == "__main__":
+    print("| = | = | = | Campaign Scraper | = | = | = |")
+    print(f"Available portals: {', '.join(CAMPAIGN_SITES)}")
+    name = input("Campaign name: ").strip().replace(" ", "-")
+    site_input = input("Portals, comma separated (blank for all): ").strip()
+    sites = [site.strip() for site in site_input.split(",") if site.strip()] or list(CAMPAIGN_SITES)
+    keywords = [keyword.strip() for keyword in input("Keywords, comma separated: ").split(",") if keyword.strip()]
+    max_pages = int(input("Maximum pages per combination (default 50): ") or "50")
+    max_retries = int(input("Maximum retry attempts for failed links (default 2): ") or "2")
+    incremental_input = input("Only scrape new or stale postings? (Y/N): ").lower().strip()
+    incremental = True if incremental_input == "y" else False
+    parallel_runs = int(input(f"Combinations at once (default {CAMPAIGN_PARALLEL_RUNS}): ") or str(CAMPAIGN_PARALLEL_RUNS))
+    log_file = setup_logging(f"campaign_{name}")
+    asyncio.run(Campaign(name, sites, keywords, max_pages, max_retries, incremental, parallel_runs).run())
@@ -1,41 +1,61 @@
-# A Career Viet Scraper with Batch Processing and Auto-Retry Logic
-from playwright.async_api import async_playwright
+# A Career Viet Scraper -- site adapter for the shared crawl engine
 import asyncio
 import pandas as pd
 from pandas import NA
-from datetime import datetime, timedelta
 import re
-import sys
-import os
-
-# -----------------------------
-# Logging setup for cmd terminal
-class Tee:
-    def __init__(self, *files):
-        self.files = files
-    def write(self, obj):
-        for f in self.files:
-            f.write(obj)
-            f.flush()
-    def flush(self):
-        for f in self.files:
-            f.flush()
-
-def setup_logging(is_rescraping, keyword, retry_attempt=0):
-    os.makedirs("data", exist_ok=True)
-    if is_rescraping:
-        log_file_name = f"terminal_output_careerviet_vn_{keyword}_rescraped.txt"
-    elif retry_attempt > 0:
-        log_file_name = f"terminal_output_careerviet_vn_{keyword}_retry_{retry_attempt}.txt"
-    else:
-        log_file_name = f"terminal_output_careerviet_vn_{keyword}.txt"
-    log_file = open(f"data/{log_file_name}", "w", encoding="utf-8")
-    sys.stdout = sys.stderr = Tee(sys.stdout, log_file)
-    return log_file
+from link_extractor import extract_paginated_links
+from content_expander import expand_content
+from page_capture import capture_page
+from salary_parser import SalaryRules, parse_salary_text
+from dom_extractor import EXTRACTION_MODE, extract_raw_fields, report_differences
+from http_fetcher import extract_raw_fields_from_html, has_required_fields
+from crawl_engine import CrawlEngine, SiteAdapter, setup_logging
 
-# -----------------------------
-CONCURRENCY_LIMIT = 10
-BATCH_LIMIT = 3000
+CURRENCY_VALUES = {
+    "đ": "VND",
+    "₫": "VND",
+    "vnd": "VND",
+    "$": "USD",
+    "usd": "USD"
+}
+SALARY_RULES = SalaryRules(CURRENCY_VALUES.items())
+
+# Selectors for every field read from a job page per template, shared by the bulk and per-field extraction
+JOB_FIELDS = {
+    "A": {
+        "title": "//div[@class='apply-now-content']/div[1]/div[1]",
+        "location": "//strong[contains(., 'Location')]/following-sibling::p",
+        "date_posted": "//strong[contains(., 'Updated')]/following-sibling::p",
+        "job_type": "//strong[contains(., 'Job type')]/following-sibling::p",
+        "salary": "//strong[contains(., 'Salary')]/following-sibling::p",
+        "job_level": "//strong[contains(., 'Job level')]/following-sibling::p",
+        "job_function": "//strong[contains(., 'Industry')]/following-sibling::p",
+        "year_of_experience": "//strong[contains(., 'Experience')]/following-sibling::p",
+        "skill": ("//h2[contains(., 'Job tags / skills')]/following-sibling::ul/li", "texts"),
+        "description": "//h2[contains(., 'Job Description')]/parent::div[@class='detail-row reset-bullet']",
+        "requirement": "//h2[contains(., 'Job Requirement')]/parent::div[@class='detail-row reset-bullet']",
+        "company": "//div[@class='apply-now-content']/div[1]/a",
+        "company_url": ("//div[@class='apply-now-content']/div[1]/a", "attr", "href"),
+    },
+    "B": {
+        "title": "//a[@class='company']/preceding-sibling::div[@class='title']",
+        "location": "//h3[contains(., 'Work location')]/following-sibling::div/span",
+        "date_posted": "//p[contains(., 'Updated')]/parent::td/following-sibling::td",
+        "job_type": "//p[contains(., 'Job type')]/parent::td/following-sibling::td",
+        "salary": "//p[contains(., 'Salary')]/parent::td/following-sibling::td",
+        "job_level": "//p[contains(., 'Job level')]/parent::td/following-sibling::td",
+        "job_function": "//p[contains(., 'Industry')]/parent::td/following-sibling::td",
+        "year_of_experience": "//p[contains(., 'Experience')]/parent::td/following-sibling::td",
+        "skill": ("//h3[contains(., 'JOB TAGS / SKILLS:') and @class='detail-title']/following-sibling::ul/li", "texts"),
+        "description": "//h3[contains(., 'Job Description') and @class='detail-title']/following-sibling::div[@class='content']",
+        "requirement": "//h3[contains(., 'Job Requirement') and @class='detail-title']/following-sibling::div[@class='content']",
+        "company": "//div[@class='title']/following-sibling::a[@class='company']",
+        "company_url": ("//div[@class='title']/following-sibling::a[@class='company']", "attr", "href"),
+    },
+}
+COMPANY_PROFILE_FIELDS = ["company_logo", "company_url_direct", "company_addresses", "company_num_emp", "company_description"]
+# Fields a server-rendered job page must have, otherwise the link is scraped with the browser
+HTTP_REQUIRED_FIELDS = ["title", "company", "description"]
 
 async def scroll_to_bottom(page, pause=1):
     last_height = await page.evaluate("document.body.scrollHeight")
@@ -54,110 +74,13 @@ async def parse_text_content(page, selector):
     else:
         return NA
 
-async def parse_date_posted(page, selector):
-    date_posted_text = await parse_text_content(page, selector)
-    if not pd.isna(date_posted_text):
-        date_posted_text = date_posted_text.lower()
-        try:
-            date_posted_object = datetime.strptime(date_posted_text, "%d %b %Y")
-            return date_posted_object.strftime("%Y-%m-%d")
-        except ValueError:
-            pass
-        match = re.search(
-            r"(\d+)\s*(second|minute|hour|day|week|month|year)",
-            date_posted_text
-        )
-        if match:
-            num = int(match.group(1))
-            unit = match.group(2)
-            delta = timedelta()
-            if unit == "second":
-                delta = timedelta(seconds = num)
-            elif unit == "minute":
-                delta = timedelta(minutes = num)
-            elif unit == "hour":
-                delta = timedelta(hours = num)
-            elif unit == "day":
-                delta = timedelta(days = num)
-            elif unit == "week":
-                delta = timedelta(weeks = num)
-            elif unit == "month":
-                delta = timedelta(days = 30 * num)
-            elif unit == "year":
-                delta = timedelta(days = 365 * num)
-            date_posted_object = datetime.today() - delta
-            return date_posted_object.strftime("%Y-%m-%d")
-        if "yesterday" in date_posted_text:
-            return (datetime.today() - timedelta(days = 1)).strftime("%Y-%m-%d")
-        elif "today" in date_posted_text:
-            return datetime.today().strftime("%Y-%m-%d")
-        return date_posted_text
-    else:
-        return NA
+async def parse_date_posted(page, selector, date_normalizer):
+    return date_normalizer.normalize(await parse_text_content(page, selector))
 
-async def parse_salary(page, selector, currency_values):
-    salary_text = (await parse_text_content(page, selector))
-    print(salary_text)
-    if not pd.isna(salary_text):
-        salary_text_lower = salary_text.strip().lower()
-        if salary_text_lower not in ["negotiable", "competitive"]:
-            salary_source = "direct_data"
-            numbers = re.findall(r"\d+(?:,\d+)*(?:\.\d+)?\s*(?:million|mil|m|k|thousand|thousands)?\b", salary_text_lower, re.IGNORECASE)
-            parsed_numbers = []
-            for n in numbers:
-                n = n.replace(",","").strip()
-                if re.search(r"(million|mil|m)\b", n):
-                    num_part = re.sub(r"(million|mil|m)\b", "", n).strip()
-                    parsed_numbers.append(int(float(num_part) * 1_000_000))
-                elif re.search(r"(k|thousand|thousands)\b", n):
-                    num_part = re.sub(r"(k|thousand|thousands)\b", "", n).strip()
-                    parsed_numbers.append(int(float(num_part) * 1_000))
-                else:
-                    parsed_numbers.append(int(float(n)))
-            # Assigning min and max salary:
-            if len(parsed_numbers) > 1:
-                min_amount = min(parsed_numbers)
-                max_amount = max(parsed_numbers)
-            elif "up to" in salary_text_lower:
-                min_amount = 0
-                max_amount = parsed_numbers[0]
-            elif "starting from" in salary_text_lower:
-                min_amount = parsed_numbers[0]
-                max_amount = 0
-            elif len(parsed_numbers) == 1:
-                min_amount = parsed_numbers[0]
-                max_amount = parsed_numbers[0]
-            else:
-                min_amount = NA
-                max_amount = NA
-            print(min_amount, max_amount)
-            currency = NA
-            for c in currency_values:
-                if c.lower() in salary_text_lower:
-                    currency = currency_values[c]
-                    break
-            if "year" in salary_text_lower:
-                interval = "yearly"
-            elif "month" in salary_text_lower:
-                interval = "monthly"
-            elif "week" in salary_text_lower:
-                interval = "weekly"
-            elif "day" in salary_text_lower:
-                interval = "daily"
-            elif "hour" in salary_text_lower:
-                interval = "hourly"
-            else:
-                interval = NA
-            print(f"Salary: {salary_text_lower}")
-            print(f"Min Amount: {min_amount}")
-            print(f"Max Amount: {max_amount}")
-            print(f"Currency: {currency}")
-            print(f"Interval: {interval}")
-            return salary_source, interval, min_amount, max_amount, currency
-    return NA, NA, NA, NA, NA
+async def parse_salary(page, selector, salary_rules):
+    return parse_salary_text(await parse_text_content(page, selector), salary_rules)
 
-async def parse_job_function(page, selector):
-    job_function_raw_text = await parse_text_content(page, selector)
+def clean_job_function(job_function_raw_text):
     if not pd.isna(job_function_raw_text):
         job_function_text = re.sub(r'\s+', ' ', job_function_raw_text)
         job_function = [item.strip() for item in job_function_text.split(",") if item.strip()]
@@ -166,395 +89,323 @@ async def parse_job_function(page, selector):
     else:
         return NA
 
-async def parse_year_of_experience(page, selector):
-    year_of_experience_raw = await parse_text_content(page, selector)
+async def parse_job_function(page, selector):
+    return clean_job_function(await parse_text_content(page, selector))
+
+def clean_year_of_experience(year_of_experience_raw):
     if not pd.isna(year_of_experience_raw):
         year_of_experience = re.sub(r"\s+", " ", year_of_experience_raw).lstrip(", ")
         return year_of_experience
     else:
         return NA
 
+async def parse_year_of_experience(page, selector):
+    return clean_year_of_experience(await parse_text_content(page, selector))
+
+def clean_skill(skill_raw):
+    return re.sub(r"\s+", " ", skill_raw.strip()).lstrip(", ")
+
 async def parse_skill(page, selector):
     skill_li =  page.locator(selector)
     skill_count = await skill_li.count()
     if skill_count > 0:
         skills = []
         for i in range(skill_count):
-            skill_raw = (await skill_li.nth(i).text_content()).strip()
-            skill = re.sub(r"\s+", " ", skill_raw).lstrip(", ")
-            skills.append(skill)
+            skills.append(clean_skill(await skill_li.nth(i).text_content()))
         return skills
     else:
         return NA
 
-async def parse_company_info(page, job_template_type):
-    print(f"Job Template Type: {job_template_type}")
-    match job_template_type:
-        case "A":
-            company = await parse_text_content(page, "//div[@class='apply-now-content']/div[1]/a")
-        case "B":
-            company = await parse_text_content(page, "//div[@class='title']/following-sibling::a[@class='company']")
-    if not pd.isna(company):
-        match job_template_type:
-            case "A":
-                company_url = await page.locator("//div[@class='apply-now-content']/div[1]/a").get_attribute("href")
-            case "B":
-                company_url = await page.locator("//div[@class='title']/following-sibling::a[@class='company']").get_attribute("href")
-        await page.goto(company_url, wait_until="domcontentloaded", timeout=40000)
-        print(f"Company URL: {company_url}")
-        if await page.locator("header.header-premium").count() > 0:
-            company_template_type = "C"
-        elif await page.locator("div.section-page.cp_basic_info").count() > 0:
-            company_template_type = "B"
-        else:
-            company_template_type = "A"
-        print(f"Company Template Type: {company_template_type}")
-        match company_template_type:
-            case "A":
-                load_more_button_locator = page.locator(
-                    "//h2[contains(., 'About Us')]/following-sibling::div[@class='box-text more-less']/div[@class='view-style']/a[@class='read-more']"
-                )
-                while await load_more_button_locator.is_visible():
-                    await load_more_button_locator.click()
-                    await page.wait_for_timeout(500)
-                company_logo_src = page.locator(
-                    "//div[@class='company-info']/div/div[@class='img']/img"
-                )
-                company_logo = await company_logo_src.get_attribute("src") if await company_logo_src.count() > 0 else NA
-                company_url_direct_text = await parse_text_content(
-                    page,
-                    "//strong[contains(., 'Company Information')]/following-sibling::ul/li[span[@class='mdi mdi-link']]"
-                )
-                company_url_direct = company_url_direct_text.split("Website:")[1].strip() if not pd.isna(company_url_direct_text) and "Website:" in company_url_direct_text else NA
-                company_addresses = await parse_text_content(
-                    page,
-                    "//div[@class='content']/strong[contains(., 'Location')]/following-sibling::p"
-                )
-                company_num_emp_text = await parse_text_content(
-                    page,
-                    "//strong[contains(., 'Company Information')]/following-sibling::ul/li[span[@class='mdi mdi-account-supervisor']]"
-                )
-                company_num_emp = company_num_emp_text.split("Company size:")[1].strip() if not pd.isna(company_num_emp_text) and "Company size:" in company_num_emp_text else NA
-                company_description = await parse_text_content(
-                    page,
-                    "//h2[contains(., 'About us')]/following-sibling::div[contains(@class, 'box-text')]/div[@class='main-text']"
-                )
-            case "B":
-                company_logo_src = page.locator(
-                    "//span[@class='logoJobs']/table/tbody/tr/td/a/img"
-                )
-                company_logo = await company_logo_src.get_attribute("src") if await company_logo_src.count() > 0 else NA
-                company_url_direct_text = await parse_text_content(
-                    page,
-                    "//h2[@id='cp_company_name']/following-sibling::ul/li[span[contains(text(),'Website:')]]/span[contains(text(),'Website:')]"
-                )
-                company_url_direct = company_url_direct_text.split("Website:")[1].strip() if not pd.isna(company_url_direct_text) and "Website:" in company_url_direct_text else NA
-                company_addresses = await parse_text_content(
-                    page,
-                    "//h2[@id='cp_company_name']/following-sibling::ul/li[1]"
-                )
-                company_num_emp_text = await parse_text_content(
-                    page,
-                    "//h2[@id='cp_company_name']/following-sibling::ul/li[span[contains(text(),'Company size:')]]/span[contains(text(),'Company size:')]"
-                )
-                company_num_emp = company_num_emp_text.split("Company size:")[1].strip() if not pd.isna(company_num_emp_text) and "Company size:" in company_num_emp_text else NA
-                company_description = await parse_text_content(
-                    page,
-                    "//h2[contains(@class,'section-title') and contains(., 'About us')]/parent::header/following-sibling::div[@class='container']"
-                )
-            case "C":
-                company_logo_src = page.locator(
-                    "//div[@class='profile-intro-wrap']/div[@class='img']/img"
-                )
-                company_logo = await company_logo_src.get_attribute("src") if await company_logo_src.count() > 0 else NA
-                company_url_direct_text = await parse_text_content(
-                    page,
-                    "//strong[contains(., 'Information')]/following-sibling::ul/li[span[@class='mdi mdi-link']]"
-                )
-                company_url_direct = company_url_direct_text.split("Website:")[1].strip() if not pd.isna(company_url_direct_text) and "Website:" in company_url_direct_text else NA
-                company_addresses_text = await parse_text_content(
-                    page,
-                    "//p[@class='company-location']"
-                )
-                company_addresses = company_addresses_text.split("Location")[1].strip() if not pd.isna(company_addresses_text) and "Location" in company_addresses_text else NA
-                company_num_emp_text = await parse_text_content(
-                    page,
-                    "//strong[contains(., 'Information')]/following-sibling::ul/li[span[@class='mdi mdi-account']]"
-                )
-                company_num_emp = company_num_emp_text.split("Company size:")[1].strip() if not pd.isna(company_num_emp_text) and "Company size:" in company_num_emp_text else NA
-                company_description = await parse_text_content(
-                    page,
-                    "//h2[contains(., 'About us')]/parent::div[@class='cb-title']/h2"
-                )
-        return company, company_url, company_logo, company_url_direct, company_addresses, company_num_emp, company_description
-    else:
-        return NA, NA, NA, NA, NA, NA, NA
-
-# --- Batch/Retry/Save Error Links Functions ---
+# Selectors for every field read from a company page per company template
+COMPANY_FIELDS = {
+    "A": {
+        "company_logo": ("//div[@class='company-info']/div/div[@class='img']/img", "attr", "src"),
+        "company_url_direct": "//strong[contains(., 'Company Information')]/following-sibling::ul/li[span[@class='mdi mdi-link']]",
+        "company_addresses": "//div[@class='content']/strong[contains(., 'Location')]/following-sibling::p",
+        "company_num_emp": "//strong[contains(., 'Company Information')]/following-sibling::ul/li[span[@class='mdi mdi-account-supervisor']]",
+        "company_description": "//h2[contains(., 'About us')]/following-sibling::div[contains(@class, 'box-text')]/div[@class='main-text']",
+    },
+    "B": {
+        "company_logo": ("//span[@class='logoJobs']/table/tbody/tr/td/a/img", "attr", "src"),
+        "company_url_direct": "//h2[@id='cp_company_name']/following-sibling::ul/li[span[contains(text(),'Website:')]]/span[contains(text(),'Website:')]",
+        "company_addresses": "//h2[@id='cp_company_name']/following-sibling::ul/li[1]",
+        "company_num_emp": "//h2[@id='cp_company_name']/following-sibling::ul/li[span[contains(text(),'Company size:')]]/span[contains(text(),'Company size:')]",
+        "company_description": "//h2[contains(@class,'section-title') and contains(., 'About us')]/parent::header/following-sibling::div[@class='container']",
+    },
+    "C": {
+        "company_logo": ("//div[@class='profile-intro-wrap']/div[@class='img']/img", "attr", "src"),
+        "company_url_direct": "//strong[contains(., 'Information')]/following-sibling::ul/li[span[@class='mdi mdi-link']]",
+        "company_addresses": "//p[@class='company-location']",
+        "company_num_emp": "//strong[contains(., 'Information')]/following-sibling::ul/li[span[@class='mdi mdi-account']]",
+        "company_description": "//h2[contains(., 'About us')]/parent::div[@class='cb-title']/h2",
+    },
+}
+COMPANY_TEMPLATE_MARKERS = {
+    "C": "//header[contains(concat(' ', normalize-space(@class), ' '), ' header-premium ')]",
+    "B": "//div[contains(concat(' ', normalize-space(@class), ' '), ' section-page ') and contains(concat(' ', normalize-space(@class), ' '), ' cp_basic_info ')]",
+}
+JOB_TEMPLATE_A_MARKER = "//div[contains(concat(' ', normalize-space(@class), ' '), ' apply-now-content ')]"
 
-def save_error_links(error_links, keyword, retry_attempt=0):
-    if not error_links:
-        return None
-    os.makedirs("data", exist_ok=True)
-    if retry_attempt > 0:
-        filename = f"data/careerviet_vn_{keyword}_retry_{retry_attempt}_errors.csv"
-    else:
-        filename = f"data/careerviet_vn_{keyword}_errors.csv"
-    error_df = pd.DataFrame(error_links, columns=['job_link'])
-    error_df.to_csv(filename, index=False, encoding='utf-8-sig')
-    print(f"Error links saved to: {filename}")
-    return filename
-
-def save_job_data(job_data, keyword, retry_attempt=0, is_rescraping=False):
-    if not job_data:
-        print("No job data to save")
-        return None
-    data_frame = pd.DataFrame(job_data)
-    if is_rescraping:
-        filename = f"data/careerviet_vn_{keyword}_rescraped.csv"
-    elif retry_attempt > 0:
-        filename = f"data/careerviet_vn_{keyword}_retry_{retry_attempt}.csv"
-    else:
-        filename = f"data/careerviet_vn_{keyword}.csv"
-    data_frame.to_csv(
-        filename,
-        index=False,
-        quotechar='"',
-        escapechar='\\',
-        encoding='utf-8-sig'
-    )
-    print(f"Data saved to: {filename} ({len(job_data)} records)")
-    return filename
-
-async def scrape_single_job(page, link, currency_values):
-    try:
-        job_id = link.split(".html")[0].rsplit(".", 1)[1]
-        job_url = link
-        await page.goto(job_url, wait_until="domcontentloaded")
-        print(f"Scraping job: {job_url}")
-        job_template_type = "A" if await page.locator("div.apply-now-content").count() > 0 else "B"
-        match job_template_type:
-            case "A":
-                title = await parse_text_content(page, "//div[@class='apply-now-content']/div[1]/div[1]")
-                location = await parse_text_content(page, "//strong[contains(., 'Location')]/following-sibling::p")
-                date_posted = await parse_date_posted(page, "//strong[contains(., 'Updated')]/following-sibling::p")
-                job_type = await parse_text_content(page, "//strong[contains(., 'Job type')]/following-sibling::p")
-                salary_source, interval, min_amount, max_amount, currency  = await parse_salary(page, "//strong[contains(., 'Salary')]/following-sibling::p", currency_values)
-                job_level = await parse_text_content(page, "//strong[contains(., 'Job level')]/following-sibling::p")
-                job_function = await parse_job_function(page, "//strong[contains(., 'Industry')]/following-sibling::p")
-                year_of_experience = await parse_year_of_experience(page,"//strong[contains(., 'Experience')]/following-sibling::p")
-                skill = await parse_skill(page, "//h2[contains(., 'Job tags / skills')]/following-sibling::ul/li")
-                description = await parse_text_content(page, "//h2[contains(., 'Job Description')]/parent::div[@class='detail-row reset-bullet']")
-                requirement = await parse_text_content(page, "//h2[contains(., 'Job Requirement')]/parent::div[@class='detail-row reset-bullet']")
-                company, company_url, company_logo, company_url_direct, company_addresses, company_num_emp, company_description = await parse_company_info(page, job_template_type)
-            case "B":
-                title = await parse_text_content(page, "//a[@class='company']/preceding-sibling::div[@class='title']")
-                location = await parse_text_content(page, "//h3[contains(., 'Work location')]/following-sibling::div/span")
-                date_posted = await parse_text_content(page, "//p[contains(., 'Updated')]/parent::td/following-sibling::td")
-                job_type = await parse_text_content(page, "//p[contains(., 'Job type')]/parent::td/following-sibling::td")
-                salary_source, interval, min_amount, max_amount, currency  = await parse_salary(page, "//p[contains(., 'Salary')]/parent::td/following-sibling::td", currency_values)
-                job_level = await parse_text_content(page, "//p[contains(., 'Job level')]/parent::td/following-sibling::td")
-                job_function = await parse_job_function(page, "//p[contains(., 'Industry')]/parent::td/following-sibling::td")
-                year_of_experience = await parse_year_of_experience(page, "//p[contains(., 'Experience')]/parent::td/following-sibling::td")
-                skill = await parse_skill(page, "//h3[contains(., 'JOB TAGS / SKILLS:') and @class='detail-title']/following-sibling::ul/li")
-                description = await parse_text_content(page, "//h3[contains(., 'Job Description') and @class='detail-title']/following-sibling::div[@class='content']")
-                requirement = await parse_text_content(page, "//h3[contains(., 'Job Requirement') and @class='detail-title']/following-sibling::div[@class='content']")
-                company, company_url, company_logo, company_url_direct, company_addresses, company_num_emp, company_description = await parse_company_info(page, job_template_type)
-        return {
-            "id": job_id,
-            "site": "careerviet",
-            "job_url": job_url,
-            "job_url_direct": NA,
-            "title": title,
-            "company": company,
-            "location": location,
-            "date_posted": date_posted,
-            "job_type": job_type,
-            "salary_source": salary_source,
-            "interval": interval,
-            "min_amount": min_amount,
-            "max_amount": max_amount,
-            "currency": currency,
-            "is_remote": NA,
-            "work_setup": NA,
-            "job_level": job_level,
-            "job_function": job_function,
-            "year_of_experience": year_of_experience,
-            "skill": skill,
-            "listing_type": NA,
-            "emails": NA,
-            "description": description,
-            "requirement": requirement,
-            "company_industry": NA,
-            "company_url": company_url,
-            "company_logo": company_logo,
-            "company_url_direct": company_url_direct,
-            "company_addresses": company_addresses,
-            "company_num_emp": company_num_emp,
-            "company_description": company_description,
-        }
-    except Exception as e:
-        print(f"Error scraping {link}: {e}")
-        return None
+def text_after(text, label):
+    return text.split(label)[1].strip() if not pd.isna(text) and label in text else NA
 
-async def process_job_links(job_links, currency_values, retry_attempt=0):
-    job_data = []
-    error_links = []
-    total_processed = 0
-    async with async_playwright() as pw:
-        async def start_browser():
-            browser = await pw.chromium.launch(headless=False)
-            context = await browser.new_context()
-            return browser, context
-        browser, context = await start_browser()
-        while total_processed < len(job_links):
-            batch_links = job_links[total_processed: total_processed + BATCH_LIMIT]
-            print(f"\n--- Processing batch: {len(batch_links)} jobs ---")
-            sem = asyncio.Semaphore(CONCURRENCY_LIMIT)
-            async def bound_scrape(link):
-                async with sem:
-                    page = await context.new_page()
-                    data = await scrape_single_job(page, link, currency_values)
-                    await page.close()
-                    if data:
-                        job_data.append(data)
-                    else:
-                        error_links.append(link)
-            await asyncio.gather(*(bound_scrape(link) for link in batch_links))
-            total_processed += len(batch_links)
-            await browser.close()
-            if total_processed < len(job_links):
-                print(f"\n--- Restarting browser after {total_processed} jobs ---")
-                browser, context = await start_browser()
-        await browser.close()
-    return job_data, error_links
-
-async def web_scraper(is_rescraping, link_file_name, keyword="data-mining", max_pages=50, max_retries=2):
-    print("Initiating Career Viet Scraper with Batch/Retry Logic")
-    print(f"{keyword} {max_pages}")
-    os.makedirs("data", exist_ok=True)
-    currency_values = {
-        "đ": "VND",
-        "₫": "VND",
-        "vnd": "VND",
-        "$": "USD",
-        "usd": "USD"
+def clean_company_profile(raw, company_template_type):
+    return {
+        "company_logo": raw["company_logo"],
+        "company_url_direct": text_after(raw["company_url_direct"], "Website:"),
+        # Template C prefixes the address with a "Location" label
+        "company_addresses": text_after(raw["company_addresses"], "Location") if company_template_type == "C" else raw["company_addresses"],
+        "company_num_emp": text_after(raw["company_num_emp"], "Company size:"),
+        "company_description": raw["company_description"],
     }
-    if is_rescraping:
-        job_links_df = pd.read_csv(f"data/{link_file_name}", header=None)
-        job_links = job_links_df[0].tolist()
-        print(f"Loaded {len(job_links)} links from file for re-scraping")
+
+async def fetch_company_profile(page, company_url):
+    await page.goto(company_url, wait_until="domcontentloaded", timeout=40000)
+    print(f"Company URL: {company_url}")
+    if await page.locator("header.header-premium").count() > 0:
+        company_template_type = "C"
+    elif await page.locator("div.section-page.cp_basic_info").count() > 0:
+        company_template_type = "B"
     else:
-        async with async_playwright() as pw:
-            browser = await pw.chromium.launch(headless=False)
-            context = await browser.new_context()
-            page = await context.new_page()
-            job_links = []
-            seen_links = set()
-            current_page = 1
-            consecutive_empty_pages = 0
-            max_consecutive_empty = 3
-            print("Extracting Job Links")
-            while current_page <= max_pages and consecutive_empty_pages < max_consecutive_empty:
-                url = f"https://careerviet.vn/jobs/{keyword}-k-page-{current_page}-en.html"
-                print(f"Scraping page {current_page}: {url}")
-                try:
-                    await page.goto(url, timeout=30000)
-                    await scroll_to_bottom(page, pause=2)
-                    job_item_links = page.locator("//div[@class='figcaption']/div[contains(@class, 'title')]/h2/a[@class='job_link']")
-                    link_count = await job_item_links.count()
-                    if link_count == 0:
-                        consecutive_empty_pages += 1
-                        print(f"No job links found on page {current_page}. Empty pages count: {consecutive_empty_pages}")
-                        no_result_indicator = page.locator("//div[@class='no-search']/div[@class='image']/figure/figcaption")
-                        if await no_result_indicator.count() > 0:
-                            consecutive_empty_pages += 1
-                            print(f"End of results detected on page {current_page}")
-                            print("Reached end of job listings")
-                            break
-                    else:
-                        consecutive_empty_pages = 0
-                        page_job_links = []
-                        for link_index in range(link_count):
-                            job_link = await job_item_links.nth(link_index).get_attribute("href")
-                            
-                            # Ensure all job links are in English
-                            if "/vi/" in job_link and 'tim-viec-lam/' in job_link:
-                                job_link = job_link.replace("/vi/", "/en/")
-                                job_link = job_link.replace("tim-viec-lam/", "search-job/")
-                            
-                            if job_link and job_link not in seen_links:
-                                job_links.append(job_link)
-                                seen_links.add(job_link)
-                                page_job_links.append(job_link)
-                        print(f"Found {len(page_job_links)} new job links on page {current_page}")
-                except Exception as e:
-                    print(e)
-                    consecutive_empty_pages += 1
-                current_page += 1
-            print(f"\nTotal Job Links collected: {len(job_links)} from {current_page - 1} pages")
-            print(f"Unique job links: {len(set(job_links))}")
-            await browser.close()
-        if not job_links:
-            print("No job links found. Exiting.")
-            return
-    all_job_data = []
-    current_links = job_links
-    retry_attempt = 0
-    while current_links and retry_attempt <= max_retries:
-        print(f"\n{'='*60}")
-        if retry_attempt == 0:
-            print("INITIAL SCRAPING ATTEMPT")
-        else:
-            print(f"RETRY ATTEMPT {retry_attempt}")
-        print(f"{'='*60}")
-        job_data, error_links = await process_job_links(
-            current_links, currency_values, retry_attempt
+        company_template_type = "A"
+    print(f"Company Template Type: {company_template_type}")
+    if company_template_type == "A":
+        await expand_content(
+            page,
+            "//h2[contains(., 'About Us')]/following-sibling::div[@class='box-text more-less']/div[@class='view-style']/a[@class='read-more']",
+            "careerviet",
+            full_text_selector=COMPANY_FIELDS["A"]["company_description"]
         )
-        all_job_data.extend(job_data)
-        if job_data:
-            save_job_data(job_data, keyword, retry_attempt, is_rescraping)
-        if error_links:
-            print(f"\nFound {len(error_links)} failed links")
-            error_file = save_error_links(error_links, keyword, retry_attempt)
-            if retry_attempt < max_retries:
-                print(f"Will retry {len(error_links)} failed links in next attempt...")
-                current_links = error_links
-                retry_attempt += 1
-            else:
-                print(f"Max retries ({max_retries}) reached. {len(error_links)} links still failed.")
-                break
+    await capture_page(page, "company", "careerviet_vn", company_url)
+    raw = {}
+    for name, selector in COMPANY_FIELDS[company_template_type].items():
+        if isinstance(selector, tuple):
+            locator = page.locator(selector[0])
+            raw[name] = await locator.first.get_attribute(selector[2]) if await locator.count() > 0 else NA
         else:
-            print("No error links found. All jobs processed successfully!")
+            raw[name] = await parse_text_content(page, selector)
+    return clean_company_profile(raw, company_template_type)
+
+async def fetch_company_profile_http(fetcher, company_url):
+    document = await fetcher.fetch_document(company_url, "company", "careerviet_vn")
+    if document is None:
+        raise RuntimeError(f"Company page unavailable over HTTP: {company_url}")
+    print(f"Company URL: {company_url}")
+    company_template_type = "A"
+    for template_type, marker in COMPANY_TEMPLATE_MARKERS.items():
+        if document.xpath(marker):
+            company_template_type = template_type
             break
-    if all_job_data:
-        print(f"\n{'='*60}")
-        print("FINAL CONSOLIDATION")
-        print(f"{'='*60}")
-        if is_rescraping:
-            final_filename = f"data/careerviet_vn_{keyword}_rescraped_final.csv"
-        else:
-            final_filename = f"data/careerviet_vn_{keyword}_final.csv"
-        final_df = pd.DataFrame(all_job_data)
-        final_df.to_csv(
-            final_filename,
-            index=False,
-            quotechar='"',
-            escapechar='\\',
-            encoding='utf-8-sig'
+    print(f"Company Template Type: {company_template_type}")
+    raw = extract_raw_fields_from_html(document, COMPANY_FIELDS[company_template_type])
+    return clean_company_profile(raw, company_template_type)
+
+async def lookup_company_profile(page, company_url, company_cache):
+    if pd.isna(company_url):
+        return {field: NA for field in COMPANY_PROFILE_FIELDS}
+    return await company_cache.get_or_fetch(
+        company_url,
+        lambda: fetch_company_profile(page, company_url)
+    )
+
+async def parse_job_fields(page, job_template_type, salary_rules, date_normalizer):
+    # Per-field fallback: one browser round-trip per selector
+    job_fields = JOB_FIELDS[job_template_type]
+    salary_source, interval, min_amount, max_amount, currency = await parse_salary(page, job_fields["salary"], salary_rules)
+    company = await parse_text_content(page, job_fields["company"])
+    company_url = await page.locator(job_fields["company_url"][0]).first.get_attribute("href") if not pd.isna(company) else NA
+    return {
+        "title": await parse_text_content(page, job_fields["title"]),
+        "location": await parse_text_content(page, job_fields["location"]),
+        # Template B shows the date as-is
+        "date_posted": await parse_date_posted(page, job_fields["date_posted"], date_normalizer) if job_template_type == "A" else await parse_text_content(page, job_fields["date_posted"]),
+        "job_type": await parse_text_content(page, job_fields["job_type"]),
+        "salary_source": salary_source,
+        "interval": interval,
+        "min_amount": min_amount,
+        "max_amount": max_amount,
+        "currency": currency,
+        "job_level": await parse_text_content(page, job_fields["job_level"]),
+        "job_function": await parse_job_function(page, job_fields["job_function"]),
+        "year_of_experience": await parse_year_of_experience(page, job_fields["year_of_experience"]),
+        "skill": await parse_skill(page, job_fields["skill"][0]),
+        "description": await parse_text_content(page, job_fields["description"]),
+        "requirement": await parse_text_content(page, job_fields["requirement"]),
+        "company": company,
+        "company_url": company_url,
+    }
+
+def post_process_job_fields(raw, job_template_type, salary_rules, date_normalizer):
+    salary_source, interval, min_amount, max_amount, currency = parse_salary_text(raw["salary"], salary_rules)
+    has_company = not pd.isna(raw["company"])
+    return {
+        "title": raw["title"],
+        "location": raw["location"],
+        "date_posted": date_normalizer.normalize(raw["date_posted"]) if job_template_type == "A" else raw["date_posted"],
+        "job_type": raw["job_type"],
+        "salary_source": salary_source,
+        "interval": interval,
+        "min_amount": min_amount,
+        "max_amount": max_amount,
+        "currency": currency,
+        "job_level": raw["job_level"],
+        "job_function": clean_job_function(raw["job_function"]),
+        "year_of_experience": clean_year_of_experience(raw["year_of_experience"]),
+        "skill": [clean_skill(skill) for skill in raw["skill"]] if not pd.isna(raw["skill"]) else NA,
+        "description": raw["description"],
+        "requirement": raw["requirement"],
+        "company": raw["company"],
+        "company_url": raw["company_url"] if has_company else NA,
+    }
+
+async def extract_job_fields(page, job_template_type, salary_rules, date_normalizer):
+    # Bulk extraction: every selector of the template resolved by one page.evaluate
+    raw = await extract_raw_fields(page, JOB_FIELDS[job_template_type])
+    return post_process_job_fields(raw, job_template_type, salary_rules, date_normalizer)
+
+async def detect_job_template(page):
+    return "A" if await page.locator("div.apply-now-content").count() > 0 else "B"
+
+def job_id_from_link(link):
+    return link.split(".html")[0].rsplit(".", 1)[1]
+
+async def scrape_single_job(page, link, salary_rules, date_normalizer, company_cache):
+    job_id = job_id_from_link(link)
+    job_url = link
+    await page.goto(job_url, wait_until="domcontentloaded")
+    print(f"Scraping job: {job_url}")
+    await capture_page(page, "job", "careerviet_vn", job_url, job_id)
+    job_template_type = await detect_job_template(page)
+    print(f"Job Template Type: {job_template_type}")
+    if EXTRACTION_MODE == "per_field":
+        fields = await parse_job_fields(page, job_template_type, salary_rules, date_normalizer)
+    else:
+        fields = await extract_job_fields(page, job_template_type, salary_rules, date_normalizer)
+        if EXTRACTION_MODE == "compare":
+            report_differences(job_url, fields, await parse_job_fields(page, job_template_type, salary_rules, date_normalizer))
+    profile = await lookup_company_profile(page, fields["company_url"], company_cache)
+    return build_job_record(job_id, job_url, fields, profile)
+
+def build_job_record(job_id, job_url, fields, profile):
+    return {
+        "id": job_id,
+        "site": "careerviet",
+        "job_url": job_url,
+        "job_url_direct": NA,
+        "title": fields["title"],
+        "company": fields["company"],
+        "location": fields["location"],
+        "date_posted": fields["date_posted"],
+        "job_type": fields["job_type"],
+        "salary_source": fields["salary_source"],
+        "interval": fields["interval"],
+        "min_amount": fields["min_amount"],
+        "max_amount": fields["max_amount"],
+        "currency": fields["currency"],
+        "is_remote": NA,
+        "work_setup": NA,
+        "job_level": fields["job_level"],
+        "job_function": fields["job_function"],
+        "year_of_experience": fields["year_of_experience"],
+        "skill": fields["skill"],
+        "listing_type": NA,
+        "emails": NA,
+        "description": fields["description"],
+        "requirement": fields["requirement"],
+        "company_industry": NA,
+        "company_url": fields["company_url"],
+        "company_logo": profile["company_logo"],
+        "company_url_direct": profile["company_url_direct"],
+        "company_addresses": profile["company_addresses"],
+        "company_num_emp": profile["company_num_emp"],
+        "company_description": profile["company_description"],
+    }
+
+async def scrape_single_job_http(fetcher, link, salary_rules, date_normalizer, company_cache):
+    # Returns None when the link has to be scraped with the browser instead
+    job_id = job_id_from_link(link)
+    job_url = link
+    document = await fetcher.fetch_document(job_url, "job", "careerviet_vn", job_id)
+    if document is None:
+        return None
+    print(f"Scraping job over HTTP: {job_url}")
+    job_template_type = "A" if document.xpath(JOB_TEMPLATE_A_MARKER) else "B"
+    raw = extract_raw_fields_from_html(document, JOB_FIELDS[job_template_type])
+    if not has_required_fields(raw, HTTP_REQUIRED_FIELDS):
+        print(f"Job page looks client-rendered, falling back to the browser: {job_url}")
+        return None
+    fields = post_process_job_fields(raw, job_template_type, salary_rules, date_normalizer)
+    if pd.isna(fields["company_url"]):
+        profile = {field: NA for field in COMPANY_PROFILE_FIELDS}
+    else:
+        profile = await company_cache.get_or_fetch(
+            fields["company_url"],
+            lambda: fetch_company_profile_http(fetcher, fields["company_url"])
         )
-        print(f"Final consolidated data saved to: {final_filename}")
-        print(f"Total successful jobs scraped: {len(all_job_data)}")
-        initial_links = len(job_links)
-        successful_jobs = len(all_job_data)
-        failed_jobs = initial_links - successful_jobs
-        success_rate = (successful_jobs / initial_links) * 100 if initial_links > 0 else 0
-        print(f"\nSCRAPING SUMMARY:")
-        print(f"Initial job links: {initial_links}")
-        print(f"Successfully scraped: {successful_jobs}")
-        print(f"Failed to scrape: {failed_jobs}")
-        print(f"Success rate: {success_rate:.1f}%")
-        print(f"Total retry attempts: {retry_attempt}")
+    return build_job_record(job_id, job_url, fields, profile)
+
+def normalize_job_link(job_link):
+    # Ensure all job links are in English
+    if job_link and "/vi/" in job_link and 'tim-viec-lam/' in job_link:
+        job_link = job_link.replace("/vi/", "/en/")
+        job_link = job_link.replace("tim-viec-lam/", "search-job/")
+    return job_link
+
+async def harvest_result_page(page, url, page_number):
+    await page.goto(url, timeout=30000)
+    await scroll_to_bottom(page, pause=2)
+    job_item_links = page.locator("//div[@class='figcaption']/div[contains(@class, 'title')]/h2/a[@class='job_link']")
+    if await job_item_links.count() == 0:
+        no_result_indicator = page.locator("//div[@class='no-search']/div[@class='image']/figure/figcaption")
+        if await no_result_indicator.count() > 0:
+            return None
+        return []
+    await capture_page(page, "listing", "careerviet_vn", url)
+    hrefs = await job_item_links.evaluate_all("links => links.map(link => link.getAttribute('href'))")
+    return [normalize_job_link(href) for href in hrefs]
+
+
+class CareerVietAdapter(SiteAdapter):
+    """careerviet.vn: keyword search pages, job pages in two templates, company pages in three"""
+
+    title = "Career Viet"
+    site = "careerviet"
+    supports_http = True
+
+    def __init__(self, keyword="data-mining", max_pages=50):
+        super().__init__("careerviet_vn", keyword, max_pages)
+
+    def job_id_from_link(self, link):
+        return job_id_from_link(link)
+
+    def search_url(self, page_number):
+        return f"https://careerviet.vn/jobs/{self.keyword}-k-page-{page_number}-en.html"
+
+    async def extract_job_links(self, context):
+        return await extract_paginated_links(context, self.search_url, harvest_result_page, self.max_pages)
+
+    async def job_fields(self, page):
+        return JOB_FIELDS[await detect_job_template(page)]
+
+    async def parse_job_page(self, page, per_field=False):
+        job_template_type = await detect_job_template(page)
+        return await (parse_job_fields if per_field else extract_job_fields)(page, job_template_type, SALARY_RULES, self.date_normalizer)
+
+    async def fetch_company_page(self, page, company_url):
+        return await fetch_company_profile(page, company_url)
+
+    async def harvest_listing(self, page, url):
+        return await harvest_result_page(page, url, 1)
+
+    async def scrape_job(self, page, link, company_cache):
+        return await scrape_single_job(page, link, SALARY_RULES, self.date_normalizer, company_cache)
+
+    async def scrape_job_http(self, fetcher, link, company_cache):
+        return await scrape_single_job_http(fetcher, link, SALARY_RULES, self.date_normalizer, company_cache)
+
+async def web_scraper(is_rescraping, link_file_name, keyword="data-mining", max_pages=50, max_retries=2, incremental=False, resume=False, shards=1, distributed=False):
+    engine = CrawlEngine(CareerVietAdapter(keyword, max_pages), max_retries, incremental, resume, shards, distributed)
+    await engine.run(is_rescraping, link_file_name)
 
 if __name__ == "__main__":
     print("| = | = | = | Career Viet Web Scraper with Batch/Retry | = | = | = |")
@@ -563,13 +414,21 @@ if __name__ == "__main__":
     if is_rescraping:
         print("Note: The filename format is careerviet_vn_{keyword}_errors.csv")
         link_file_name = input("File name the CSV file from the data folder: ").strip()
-        keyword = link_file_name.replace("careerviet_vn_", "").replace("_errors.csv", "").replace("_retry_", "_")
+        keyword = link_file_name.replace("careerviet_vn_", "").replace("_errors.csv", "")
         max_pages = 0
+        incremental = False
         max_retries = int(input("Maximum retry attempts (default 2): ") or "2")
     else:
         keyword = input("Keyword (e.g., data analyst): ").strip().replace(" ", "-")
         max_pages = int(input("Maximum pages to scrape (default 50): ") or "50")
         max_retries = int(input("Maximum retry attempts for failed links (default 2): ") or "2")
+        incremental_input = input("Only scrape new or stale postings? (Y/N): ").lower().strip()
+        incremental = True if incremental_input == "y" else False
         link_file_name = ""
-    log_file = setup_logging(is_rescraping, keyword)
-    asyncio.run(web_scraper(is_rescraping, link_file_name, keyword, max_pages, max_retries))
\ No newline at end of file
+    resume_input = input("Resume from the last run's journal? (Y/N): ").lower().strip()
+    resume = True if resume_input == "y" else False
+    shards = int(input("Worker processes for scraping (default 1): ") or "1")
+    distributed_input = input("Share the links through a work queue other workers can join? (Y/N): ").lower().strip()
+    distributed = True if distributed_input == "y" else False
+    log_file = setup_logging(f"careerviet_vn_{keyword}", is_rescraping)
+    asyncio.run(web_scraper(is_rescraping, link_file_name, keyword, max_pages, max_retries, incremental, resume, shards, distributed))
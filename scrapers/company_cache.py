@@ -0,0 +1,91 @@
+# A Company Profile Cache shared by all concurrent workers and persisted across runs
+from pandas import NA
+import asyncio
+import json
+import os
+import time
+
+COMPANY_CACHE_TTL = 7 * 24 * 60 * 60  # Seconds before a cached company profile is fetched again
+
+
+class CompanyCache:
+    """Company profiles keyed by company URL, with one in-flight fetch per company"""
+
+    def __init__(self, site, ttl=COMPANY_CACHE_TTL, cache_dir="data"):
+        self.path = os.path.join(cache_dir, f"company_cache_{site}.json")
+        self.ttl = ttl
+        self.entries = {}
+        self.in_flight = {}
+        self.hits = 0
+        self.misses = 0
+        self.load()
+
+    def load(self):
+        self.entries = self.read_entries()
+        if self.entries:
+            print(f"Loaded {len(self.entries)} cached company profiles from {self.path}")
+
+    def read_entries(self):
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Could not load company cache {self.path}: {e}")
+            return {}
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        # Keep profiles other processes (e.g. crawl shards) saved since this cache was loaded
+        for company_url, entry in self.read_entries().items():
+            current = self.entries.get(company_url)
+            if current is None or current["fetched_at"] < entry["fetched_at"]:
+                self.entries[company_url] = entry
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(self.entries, f, ensure_ascii=False)
+        os.replace(temp_path, self.path)
+
+    def get(self, company_url):
+        entry = self.entries.get(company_url)
+        if entry is None or time.time() - entry["fetched_at"] > self.ttl:
+            return None
+        # NA is stored as null in the JSON file
+        return {key: NA if value is None else value for key, value in entry["profile"].items()}
+
+    def put(self, company_url, profile):
+        self.entries[company_url] = {
+            "fetched_at": time.time(),
+            "profile": {key: None if value is NA else value for key, value in profile.items()},
+        }
+
+    async def get_or_fetch(self, company_url, fetch_profile):
+        profile = self.get(company_url)
+        if profile is not None:
+            self.hits += 1
+            return profile
+        # Another worker is already fetching this company, wait for its result
+        if company_url in self.in_flight:
+            self.hits += 1
+            return dict(await asyncio.shield(self.in_flight[company_url]))
+        future = asyncio.get_running_loop().create_future()
+        self.in_flight[company_url] = future
+        try:
+            profile = await fetch_profile()
+        except BaseException as e:
+            future.set_exception(e if isinstance(e, Exception) else RuntimeError("Company fetch cancelled"))
+            future.exception()  # Mark as retrieved when no other worker is waiting
+            raise
+        else:
+            self.misses += 1
+            self.put(company_url, profile)
+            future.set_result(profile)
+            return profile
+        finally:
+            del self.in_flight[company_url]
+
+    def print_stats(self):
+        total = self.hits + self.misses
+        hit_rate = (self.hits / total) * 100 if total > 0 else 0
+        print(f"Company cache: {self.hits} hits, {self.misses} fetches ({hit_rate:.1f}% hit rate), {len(self.entries)} profiles stored")
@@ -0,0 +1,88 @@
+# An Adaptive Concurrency Controller -- additive increase while healthy, multiplicative decrease on trouble
+import asyncio
+import os
+import time
+
+ADAPTIVE_MIN_CONCURRENCY = 2
+ADAPTIVE_MAX_CONCURRENCY = max(16, (os.cpu_count() or 4) * 2)  # Upper bound scales with the machine
+ADAPTIVE_WINDOW = 20  # Completed jobs per decision
+ADAPTIVE_ERROR_RATE = 0.2  # Failure share of a window that counts as an error spike
+ADAPTIVE_LATENCY_FACTOR = 2.0  # Window latency above baseline * factor counts as overload
+ADAPTIVE_BACKOFF = 0.5  # Multiplier applied to the limit when backing off
+THROTTLE_STATUSES = {429, 500, 502, 503, 504}
+
+
+class AdaptiveConcurrency:
+    """Resizable semaphore whose limit follows the latency, failures and throttling responses of a window of jobs"""
+
+    def __init__(self, name, initial, minimum=ADAPTIVE_MIN_CONCURRENCY, maximum=ADAPTIVE_MAX_CONCURRENCY, window=ADAPTIVE_WINDOW):
+        self.name = name
+        self.minimum = minimum
+        self.maximum = max(maximum, initial)
+        self.limit = initial
+        self.window = window
+        self.active = 0
+        self.condition = asyncio.Condition()
+        self.baseline_latency = None
+        self.window_latencies = []
+        self.window_failures = 0
+        self.window_throttled = 0
+        self.stats = {"increases": 0, "decreases": 0, "peak_limit": initial, "throttled_responses": 0}
+
+    async def acquire(self):
+        async with self.condition:
+            while self.active >= self.limit:
+                await self.condition.wait()
+            self.active += 1
+        return time.perf_counter()
+
+    async def release(self, started, success):
+        self.window_latencies.append(time.perf_counter() - started)
+        if not success:
+            self.window_failures += 1
+        if len(self.window_latencies) >= self.window:
+            self.adjust()
+        async with self.condition:
+            self.active -= 1
+            self.condition.notify_all()
+
+    def record_status(self, status):
+        if status in THROTTLE_STATUSES:
+            self.window_throttled += 1
+            self.stats["throttled_responses"] += 1
+
+    def watch(self, context):
+        # Count throttling responses to page navigations of a browser context
+        context.on("response", lambda response: self.record_status(response.status) if response.request.resource_type == "document" else None)
+
+    def adjust(self):
+        completed = len(self.window_latencies)
+        latency = sum(self.window_latencies) / completed
+        error_rate = self.window_failures / completed
+        previous = self.limit
+        if self.window_throttled > 0 or error_rate > ADAPTIVE_ERROR_RATE:
+            reason = f"{self.window_throttled} throttled responses, {error_rate:.0%} failures"
+            self.limit = max(self.minimum, int(self.limit * ADAPTIVE_BACKOFF))
+        elif self.baseline_latency is not None and latency > self.baseline_latency * ADAPTIVE_LATENCY_FACTOR:
+            reason = f"latency {latency:.1f}s against a {self.baseline_latency:.1f}s baseline"
+            self.limit = max(self.minimum, int(self.limit * ADAPTIVE_BACKOFF))
+        else:
+            reason = f"latency {latency:.1f}s, {error_rate:.0%} failures"
+            self.limit = min(self.maximum, self.limit + 1)
+            # Baseline follows the best healthy latency seen so far
+            self.baseline_latency = latency if self.baseline_latency is None else min(self.baseline_latency, latency)
+        if self.limit > previous:
+            self.stats["increases"] += 1
+            self.stats["peak_limit"] = max(self.stats["peak_limit"], self.limit)
+            print(f"[{self.name}] Concurrency {previous} -> {self.limit} ({reason})")
+        elif self.limit < previous:
+            self.stats["decreases"] += 1
+            print(f"[{self.name}] Concurrency backed off {previous} -> {self.limit} ({reason})")
+        self.window_latencies = []
+        self.window_failures = 0
+        self.window_throttled = 0
+
+    def print_stats(self):
+        stats = self.stats
+        print(f"Concurrency [{self.name}]: limit {self.limit} (peak {stats['peak_limit']}, range {self.minimum}-{self.maximum}), "
+              f"{stats['increases']} increases, {stats['decreases']} back-offs, {stats['throttled_responses']} throttled responses")
@@ -0,0 +1,72 @@
+# Event-Driven Content Expansion -- "View more" / "Read more" clicks that wait on the DOM instead of fixed sleeps
+from collections import defaultdict
+import time
+
+EXPANSION_TIMEOUT_MS = 1500  # Ceiling for one click to change the DOM or remove its button
+EXPANSION_MAX_CLICKS = 20
+
+# Resolves once the clicked button is detached or hidden, or the page markup changed size
+EXPANSION_SETTLED_JS = """
+([button, before]) => !button.isConnected || button.offsetParent === null || document.body.innerHTML.length !== before
+"""
+
+# Text already in the markup and only clipped by CSS can be read without clicking
+FULL_TEXT_PRESENT_JS = """
+(element) => {
+    const text = element.textContent.trim();
+    if (text.length === 0 || text.endsWith("...") || text.endsWith("…")) {
+        return false;
+    }
+    const nodes = [element, ...element.querySelectorAll("*")];
+    return nodes.some((node) => node.scrollHeight > node.clientHeight + 1 && getComputedStyle(node).overflowY === "hidden");
+}
+"""
+
+EXPANSION_STATS = defaultdict(lambda: {"expansions": 0, "clicks": 0, "skipped": 0, "timeouts": 0, "seconds": 0.0})
+
+
+async def full_text_present(page, selector):
+    content = page.locator(selector).first
+    if await content.count() == 0:
+        return False
+    return await content.evaluate(FULL_TEXT_PRESENT_JS)
+
+
+async def expand_content(page, button_selector, site, full_text_selector=None, hover=False):
+    """Click the expand button until it is gone, returning the number of clicks"""
+    stats = EXPANSION_STATS[site]
+    start = time.perf_counter()
+    clicks = 0
+    try:
+        if full_text_selector is not None and await full_text_present(page, full_text_selector):
+            stats["skipped"] += 1
+            return 0
+        button = page.locator(button_selector).first
+        while clicks < EXPANSION_MAX_CLICKS and await button.is_visible():
+            handle = await button.element_handle()
+            before = await page.evaluate("document.body.innerHTML.length")
+            if hover:
+                await button.hover()
+            await button.click(force=True)
+            clicks += 1
+            try:
+                await page.wait_for_function(EXPANSION_SETTLED_JS, arg=[handle, before], timeout=EXPANSION_TIMEOUT_MS)
+            except Exception:
+                # Nothing changed within the ceiling, stop instead of clicking a dead button
+                stats["timeouts"] += 1
+                break
+        return clicks
+    finally:
+        stats["expansions"] += 1
+        stats["clicks"] += clicks
+        stats["seconds"] += time.perf_counter() - start
+
+
+def print_expansion_stats(site):
+    stats = EXPANSION_STATS[site]
+    if stats["expansions"] == 0:
+        return
+    average = stats["seconds"] / stats["expansions"]
+    print(f"Content expansion ({site}): {stats['expansions']} expansions, {stats['clicks']} clicks, "
+          f"{stats['skipped']} read from hidden markup, {stats['timeouts']} timeouts, "
+          f"{stats['seconds']:.1f}s total ({average:.2f}s average)")
@@ -0,0 +1,652 @@
+# A Shared Crawl Engine -- browser lifecycle, concurrency, retries, persistence and metrics for every portal adapter
+from playwright.async_api import async_playwright
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+import contextlib
+import collections
+import asyncio
+import pandas as pd
+import glob
+import sys
+import os
+import time
+from company_cache import CompanyCache
+from date_normalizer import DateNormalizer
+from request_blocker import RequestBlocker
+from rate_limiter import RATE_LIMITER
+from page_pool import PagePool
+from concurrency_controller import AdaptiveConcurrency
+from browser_monitor import BrowserMonitor
+from crawl_frontier import CrawlFrontier
+from record_journal import RecordJournal, read_entries
+from retry_policy import LINK_MAX_RETRIES, RetryPolicy
+from content_expander import print_expansion_stats
+from http_fetcher import FETCH_MODE, HttpFetcher, cookies_from_context
+import html_archive
+from work_queue import LEASE_BATCH_SIZE, QUEUE_POLL_INTERVAL, open_work_queue, worker_id
+
+CONCURRENCY_LIMIT = 10  # Starting point, AdaptiveConcurrency moves it with latency and errors
+HEADLESS = False
+SHARD_COUNT = 1  # Worker processes for the scraping pass, each with its own browser and page pool
+SHARD_PROGRESS_INTERVAL = 10  # Seconds between aggregated progress lines in sharded mode
+
+
+# Logging setup for cmd terminal
+class Tee:
+    def __init__(self, *files):
+        self.files = files
+
+    def write(self, obj):
+        for f in self.files:
+            f.write(obj)
+            f.flush()
+
+    def flush(self):
+        for f in self.files:
+            f.flush()
+
+
+def setup_logging(run_name, is_rescraping=False):
+    os.makedirs("data", exist_ok=True)
+    suffix = "_rescraped" if is_rescraping else ""
+    log_file = open(f"data/terminal_output_{run_name}{suffix}.txt", "w", encoding="utf-8")
+    sys.stdout = sys.stderr = Tee(sys.stdout, log_file)
+    return log_file
+
+
+class SiteAdapter:
+    """Portal-specific parts of a crawl: search URLs, link harvesting and job page extraction"""
+
+    title = None  # Shown in the engine's log lines
+    site = None  # "site" column of the records, also selects the request blocking and expansion profiles
+    concurrency_limit = CONCURRENCY_LIMIT
+    supports_http = False  # True when scrape_job_http can read the portal's server-rendered pages
+    reparses_archive = False  # True when scrape_job_http can read archived pages though live ones need the browser
+    short_date_units = False  # True when posted dates are abbreviated, e.g. "Posted 3d ago"
+
+    def __init__(self, name, keyword, max_pages):
+        self.name = name  # Prefix of the cache, frontier, journal and output files, e.g. "careerviet_vn"
+        self.keyword = keyword
+        self.max_pages = max_pages
+        # Every posted date of the run is resolved against the time the run was set up
+        self.date_normalizer = DateNormalizer(short_units=self.short_date_units)
+        # Link -> fingerprint of its search result card, filled by extract_job_links on portals whose cards show enough
+        self.card_fingerprints = {}
+
+    def job_id_from_link(self, link):
+        raise NotImplementedError
+
+    def link_from_url(self, url):
+        # Inverse of the job URL scrape_job builds from a link, used to re-parse archived pages
+        return url
+
+    def context_options(self):
+        # Extra browser.new_context() arguments, e.g. a saved storage_state
+        return {}
+
+    async def prepare_context(self, context):
+        # Runs on every new browser context before the crawl uses it, e.g. to log in
+        pass
+
+    async def extract_job_links(self, context):
+        raise NotImplementedError
+
+    async def scrape_job(self, page, link, company_cache):
+        # Returns the job record, raises when the page could not be read
+        raise NotImplementedError
+
+    async def scrape_job_http(self, fetcher, link, company_cache):
+        # Returns the job record, or None when the link has to be scraped with the browser instead
+        return None
+
+    async def job_fields(self, page):
+        # Field selectors of the job page loaded in page
+        raise NotImplementedError
+
+    async def parse_job_page(self, page, per_field=False):
+        # Job fields of the page as it is loaded, without navigating, used by the parser benchmark
+        raise NotImplementedError
+
+    async def fetch_company_page(self, page, company_url):
+        raise NotImplementedError
+
+    async def harvest_listing(self, page, url):
+        # Job links of one search result page, None when the portal pages its results some other way
+        return None
+
+    def print_stats(self):
+        pass
+
+
+class CrawlEngine:
+    """Runs one adapter's crawl: link extraction, HTTP and browser passes, journaling and the final CSV"""
+
+    def __init__(self, adapter, max_retries=LINK_MAX_RETRIES, incremental=False, resume=False, shards=SHARD_COUNT,
+                 distributed=False):
+        self.adapter = adapter
+        self.incremental = incremental
+        self.resume = resume
+        self.shards = shards
+        self.distributed = distributed  # Links go through the work queue so other workers can join the run
+        self.is_rescraping = False
+        self.run_name = f"{adapter.name}_{adapter.keyword}"
+        self.company_cache = CompanyCache(adapter.name)
+        self.request_blocker = RequestBlocker(adapter.site)
+        self.retry_policy = RetryPolicy(max_retries)
+        self.crawl_frontier = None
+        self.journal = None
+        self.on_progress = None  # Called with (link, success) as each link finishes, set in shard workers and campaigns
+        self.browser_pool = None  # Shared browsers of a campaign, otherwise every pass launches its own
+        self.job_registry = None  # Postings already owned by other runs of a campaign
+        self.playwright = None
+        self.total_links = 0
+        self.browser_generation = 0
+        self.recycle_stats = {"recycled": 0, "peak_mb": 0.0}
+
+    @contextlib.asynccontextmanager
+    async def playwright_session(self):
+        # Every pass goes through here, local, sharded, pooled or a queue worker, so each process archives its pages
+        if html_archive.ARCHIVE_PAGES:
+            html_archive.enable_archive()
+        if self.browser_pool is not None:
+            yield
+            return
+        async with async_playwright() as pw:
+            self.playwright = pw
+            try:
+                yield
+            finally:
+                self.playwright = None
+
+    async def start_browser(self, concurrency=None):
+        # A context of its own on a pooled browser, or a browser of its own
+        if self.browser_pool is not None:
+            browser = await self.browser_pool.acquire()
+        else:
+            browser = await self.playwright.chromium.launch(headless=HEADLESS)
+        context = await self.new_context(browser, concurrency)
+        return browser, context
+
+    async def start_scraping(self, browser, context, concurrency):
+        """Warm page pool and memory monitor for one browser generation of the scraping pass"""
+        self.browser_generation += 1
+        page_pool = await PagePool(context, concurrency.maximum).start(concurrency.limit)
+        monitor = await BrowserMonitor(browser, self.run_name, self.browser_generation).start()
+        return page_pool, monitor
+
+    async def recycle_scraping_browser(self, browser, context, page_pool, monitor):
+        await monitor.stop()
+        self.recycle_stats["peak_mb"] = max(self.recycle_stats["peak_mb"], monitor.peak_mb)
+        if monitor.recycle_reason is not None:
+            self.recycle_stats["recycled"] += 1
+        page_pool.print_stats()
+        await page_pool.close()
+        self.company_cache.save()
+        if self.journal is not None:
+            self.journal.flush()
+        await self.close_browser(browser, context, retire=monitor.memory_exceeded)
+
+    async def close_browser(self, browser, context, retire=False):
+        if self.browser_pool is not None:
+            await context.close()
+            # A pooled browser over the memory ceiling is shared, closing this run's context alone frees nothing
+            if retire:
+                await self.browser_pool.retire(browser)
+            else:
+                await self.browser_pool.release(browser)
+        else:
+            await browser.close()
+
+    async def new_context(self, browser, concurrency=None):
+        context = await browser.new_context(**self.adapter.context_options())
+        await self.request_blocker.install(context)
+        await RATE_LIMITER.install(context)
+        if concurrency is not None:
+            concurrency.watch(context)
+        await self.adapter.prepare_context(context)
+        return context
+
+    async def extract_job_links(self):
+        async with self.playwright_session():
+            browser, context = await self.start_browser()
+            print("Extracting Job Links")
+            try:
+                job_links = await self.adapter.extract_job_links(context)
+            finally:
+                await self.close_browser(browser, context)
+        return job_links
+
+    def load_job_links(self, link_file_name):
+        job_links = pd.read_csv(f"data/{link_file_name}", header=None)[0].tolist()
+        # Error files written by save_error_links carry a "job_link" header row
+        return [link for link in job_links if link != "job_link"]
+
+    async def scrape_once(self, page_pool, concurrency, monitor, link):
+        started = await concurrency.acquire()
+        page = await page_pool.acquire()
+        try:
+            data = await self.adapter.scrape_job(page, link, self.company_cache)
+        except Exception as e:
+            print(f"Error scraping {link}: {e}")
+            data = None
+        await page_pool.release(page, failed=data is None)
+        await concurrency.release(started, success=data is not None)
+        monitor.record(data is not None)
+        return data
+
+    def report_progress(self, link, success):
+        if self.on_progress is not None:
+            self.on_progress(link, success)
+
+    async def process_job_links_http(self, job_links, context):
+        # HTTP pass reusing the browser session's cookies, returns the journaled links and the links left for the browser
+        scraped_links = []
+        fallback_links = []
+        fetcher = HttpFetcher(self.adapter.site, cookies=cookies_from_context(await context.cookies()))
+        async def bound_scrape(link):
+            try:
+                data = await self.adapter.scrape_job_http(fetcher, link, self.company_cache)
+            except Exception as e:
+                print(f"HTTP scrape failed for {link}, falling back to the browser: {e}")
+                data = None
+            if data:
+                self.journal.append(link, data)
+                scraped_links.append(link)
+                self.report_progress(link, True)
+            else:
+                fetcher.stats["fallbacks"] += 1
+                fallback_links.append(link)
+        try:
+            await asyncio.gather(*(bound_scrape(link) for link in job_links))
+        finally:
+            await fetcher.close()
+        fetcher.print_stats()
+        self.company_cache.save()
+        self.journal.flush()
+        return scraped_links, fallback_links
+
+    async def process_job_links(self, job_links):
+        scraped_links = []
+        error_links = []
+        if not job_links:
+            return scraped_links, error_links
+        concurrency = AdaptiveConcurrency(self.adapter.site, self.adapter.concurrency_limit)
+        async with self.playwright_session():
+            browser, context = await self.start_browser(concurrency)
+            if FETCH_MODE == "http" and self.adapter.supports_http:
+                scraped_links, job_links = await self.process_job_links_http(job_links, context)
+                if job_links:
+                    print(f"\n--- Scraping {len(job_links)} remaining jobs with the browser ---")
+            pending_links = collections.deque(job_links)
+            while pending_links:
+                if browser is None:
+                    print(f"\n--- Restarting browser, {len(pending_links)} jobs left ---")
+                    browser, context = await self.start_browser(concurrency)
+                page_pool, monitor = await self.start_scraping(browser, context, concurrency)
+                async def bound_scrape(link):
+                    data = await self.retry_policy.run(link, lambda: self.scrape_once(page_pool, concurrency, monitor, link))
+                    if data:
+                        self.journal.append(link, data)
+                        scraped_links.append(link)
+                    else:
+                        error_links.append(link)
+                    self.report_progress(link, data is not None)
+                running = set()
+                # New links stop going to a browser that is due for recycling, the ones it holds finish on it
+                while pending_links and monitor.recycle_reason is None:
+                    running.add(asyncio.create_task(bound_scrape(pending_links.popleft())))
+                    if len(running) >= concurrency.maximum:
+                        _, running = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                if monitor.recycle_reason is not None:
+                    print(f"\n--- Recycling browser: {monitor.recycle_reason}, draining {len(running)} jobs in flight ---")
+                await asyncio.gather(*running)
+                await self.recycle_scraping_browser(browser, context, page_pool, monitor)
+                browser = context = None
+            if browser is not None:
+                await self.close_browser(browser, context)
+        concurrency.print_stats()
+        self.journal.flush()
+        return scraped_links, error_links
+
+    async def process_job_links_sharded(self, job_links):
+        """Split the links round-robin across worker processes and merge their journals into this run's journal"""
+        shards = min(self.shards, len(job_links))
+        shard_links = [job_links[shard::shards] for shard in range(shards)]
+        print(f"\n--- Scraping {len(job_links)} jobs in {shards} worker processes ---")
+        context = multiprocessing.get_context("spawn")  # Playwright does not survive a fork
+        manager = context.Manager()
+        progress = manager.Queue()
+        totals = {"scraped": [0] * shards, "failed": [0] * shards}
+        monitor = asyncio.create_task(self.monitor_shards(progress, totals, len(job_links)))
+        loop = asyncio.get_running_loop()
+        try:
+            with ProcessPoolExecutor(max_workers=shards, mp_context=context) as executor:
+                futures = [
+                    loop.run_in_executor(
+                        executor, run_shard, self.adapter, shard, shards, links,
+                        self.output_filename(f"shard_{shard}_journal.jsonl", self.is_rescraping),
+                        self.retry_policy.max_attempts - 1, progress
+                    )
+                    for shard, links in enumerate(shard_links)
+                ]
+                results = await asyncio.gather(*futures, return_exceptions=True)
+        finally:
+            monitor.cancel()
+            self.drain_progress(progress, totals)
+            self.merge_shard_journals()
+            manager.shutdown()
+        for shard, result in enumerate(results):
+            if isinstance(result, BaseException):
+                print(f"Shard {shard} crashed: {result}")
+                continue
+            print(f"Shard {shard}: {result['scraped']} scraped, {result['failed']} failed in {result['seconds']:.1f}s")
+            for key, value in result["retries"].items():
+                self.retry_policy.stats[key] += value
+            self.company_cache.hits += result["cache_hits"]
+            self.company_cache.misses += result["cache_misses"]
+            self.request_blocker.blocked_counts.update(result["blocked"])
+            self.request_blocker.allowed_count += result["allowed"]
+        # The reloaded cache holds every shard's profiles, the journal decides what was scraped
+        self.company_cache.entries = self.company_cache.read_entries()
+        scraped_links = [link for link in job_links if link in self.journal.links]
+        error_links = [link for link in job_links if link not in self.journal.links]
+        return scraped_links, error_links
+
+    async def process_work_queue(self, queue, worker):
+        """Lease links from the work queue until it is drained, acknowledging each scraped record"""
+        scraped_links = []
+        error_links = []
+        in_flight = set()
+        concurrency = AdaptiveConcurrency(self.adapter.site, self.adapter.concurrency_limit)
+        async def keep_leases():
+            # Leases are renewed while a slow batch is still running, so only dead workers lose them
+            while True:
+                await asyncio.sleep(queue.lease_timeout / 3)
+                queue.extend(worker, list(in_flight))
+        heartbeat = asyncio.create_task(keep_leases())
+        try:
+            async with self.playwright_session():
+                browser, context = await self.start_browser(concurrency)
+                page_pool, monitor = await self.start_scraping(browser, context, concurrency)
+                while True:
+                    batch_links = queue.lease(worker, max(LEASE_BATCH_SIZE, concurrency.maximum))
+                    if not batch_links:
+                        if not queue.counts().get("leased"):
+                            break
+                        # Other workers still hold leases, wait for them to finish or expire
+                        await asyncio.sleep(QUEUE_POLL_INTERVAL)
+                        continue
+                    in_flight.update(batch_links)
+                    print(f"\n--- Processing {len(batch_links)} leased jobs ---")
+                    async def bound_scrape(link):
+                        data = await self.retry_policy.run(link, lambda: self.scrape_once(page_pool, concurrency, monitor, link))
+                        if data:
+                            queue.ack(worker, link, data)
+                            scraped_links.append(link)
+                        else:
+                            queue.fail(worker, link)
+                            error_links.append(link)
+                        in_flight.discard(link)
+                        self.report_progress(link, data is not None)
+                    await asyncio.gather(*(bound_scrape(link) for link in batch_links))
+                    self.company_cache.save()
+                    if monitor.recycle_reason is not None:
+                        print(f"\n--- Recycling browser: {monitor.recycle_reason} ---")
+                        await self.recycle_scraping_browser(browser, context, page_pool, monitor)
+                        browser, context = await self.start_browser(concurrency)
+                        page_pool, monitor = await self.start_scraping(browser, context, concurrency)
+                await self.recycle_scraping_browser(browser, context, page_pool, monitor)
+        finally:
+            heartbeat.cancel()
+            # Interrupted: hand the unfinished links back instead of waiting for the lease to expire
+            if in_flight:
+                queue.release(worker, list(in_flight))
+            self.company_cache.save()
+        concurrency.print_stats()
+        return scraped_links, error_links
+
+    async def process_distributed(self, job_links):
+        """Queue the links, work on them alongside any joined workers and collect every acknowledged record"""
+        queue = open_work_queue(f"{self.run_name}_rescraped" if self.is_rescraping else self.run_name)
+        try:
+            if not self.resume:
+                queue.clear()
+            queue.publish(self.adapter, self.retry_policy.max_attempts - 1)
+            pending = queue.put(job_links)
+            print(f"\n--- {pending} jobs in work queue {queue.name}, more workers can join with queue_worker.py ---")
+            try:
+                await self.process_work_queue(queue, worker_id())
+            finally:
+                merged = 0
+                for link, record in queue.results():
+                    if link not in self.journal.links:
+                        self.journal.append(link, record)
+                        merged += 1
+                self.journal.flush()
+                print(f"Collected {merged} records from work queue {queue.name}")
+                queue.print_stats()
+        finally:
+            queue.close()
+        # Records acked by other workers never touched this process's company cache
+        self.company_cache.entries = self.company_cache.read_entries()
+        scraped_links = [link for link in job_links if link in self.journal.links]
+        error_links = [link for link in job_links if link not in self.journal.links]
+        return scraped_links, error_links
+
+    async def process_links(self, job_links):
+        if self.distributed:
+            return await self.process_distributed(job_links)
+        if self.shards > 1 and len(job_links) > 1:
+            return await self.process_job_links_sharded(job_links)
+        return await self.process_job_links(job_links)
+
+    async def process_registered_links(self, job_links):
+        """Scrape the postings this campaign run owns and copy the rest from the runs that fetched them first"""
+        own_links, shared_links = self.job_registry.claim(self, job_links)
+        try:
+            await self.process_links(own_links)
+        finally:
+            self.journal.flush()
+            self.job_registry.finish(self)
+        remaining_links = await self.job_registry.resolve(self, shared_links)
+        for link in shared_links:
+            if link not in remaining_links:
+                self.report_progress(link, True)
+        if remaining_links:
+            print(f"\n--- Scraping {len(remaining_links)} shared postings the first run failed ---")
+            await self.process_links(remaining_links)
+        self.journal.flush()
+        scraped_links = [link for link in job_links if link in self.journal.links]
+        error_links = [link for link in job_links if link not in self.journal.links]
+        return scraped_links, error_links
+
+    def drain_progress(self, progress, totals):
+        while not progress.empty():
+            shard, success = progress.get_nowait()
+            totals["scraped" if success else "failed"][shard] += 1
+
+    async def monitor_shards(self, progress, totals, total_links):
+        while True:
+            await asyncio.sleep(SHARD_PROGRESS_INTERVAL)
+            self.drain_progress(progress, totals)
+            scraped = sum(totals["scraped"])
+            failed = sum(totals["failed"])
+            per_shard = ", ".join(
+                f"#{shard} {totals['scraped'][shard]}/{totals['failed'][shard]}" for shard in range(len(totals["scraped"]))
+            )
+            print(f"[Shards] {scraped + failed}/{total_links} done, {scraped} scraped, {failed} failed (scraped/failed per shard: {per_shard})")
+
+    def merge_shard_journals(self):
+        # Shard journals left by this run, or by an interrupted one when resuming, are folded into the main journal
+        for path in sorted(glob.glob(self.output_filename("shard_*_journal.jsonl", self.is_rescraping))):
+            merged = 0
+            for entry in read_entries(path):
+                if entry["job_link"] not in self.journal.links:
+                    self.journal.append(entry["job_link"], entry["record"], entry["round"])
+                    merged += 1
+            self.journal.flush()
+            os.remove(path)
+            print(f"Merged {merged} records from {path}")
+
+    def output_filename(self, kind, is_rescraping=False):
+        suffix = "_rescraped" if is_rescraping else ""
+        return f"data/{self.run_name}{suffix}_{kind}"
+
+    def save_error_links(self, error_links):
+        if not error_links:
+            return None
+        filename = self.output_filename("errors.csv")
+        error_df = pd.DataFrame(error_links, columns=['job_link'])
+        error_df.to_csv(filename, index=False, encoding='utf-8-sig')
+        print(f"Error links saved to: {filename}")
+        return filename
+
+    async def run(self, is_rescraping=False, link_file_name=""):
+        adapter = self.adapter
+        print(f"Initiating {adapter.title} Scraper with Batch/Retry Logic")
+        print(f"Parameters: {adapter.name} {adapter.keyword} {adapter.max_pages}")
+        os.makedirs("data", exist_ok=True)
+        self.crawl_frontier = CrawlFrontier(adapter.name)
+        try:
+            await self.crawl(is_rescraping, link_file_name)
+        finally:
+            self.crawl_frontier.close()
+
+    async def crawl(self, is_rescraping, link_file_name):
+        adapter = self.adapter
+        crawl_frontier = self.crawl_frontier
+        self.is_rescraping = is_rescraping
+        if is_rescraping:
+            job_links = self.load_job_links(link_file_name)
+            print(f"Loaded {len(job_links)} links from file for re-scraping")
+        else:
+            job_links = await self.extract_job_links()
+            if not job_links:
+                print("No job links found. Exiting.")
+                return
+            crawl_frontier.record_seen(job_links, adapter.job_id_from_link)
+            if self.incremental:
+                job_links = crawl_frontier.select_due(job_links, adapter.job_id_from_link, adapter.card_fingerprints)
+                if not job_links:
+                    print("Every posting was scraped recently. Exiting.")
+                    crawl_frontier.print_stats()
+                    return
+        # Completed records go straight to the journal, a resumed run skips what it already holds
+        self.journal = RecordJournal(self.output_filename("journal.jsonl", is_rescraping), self.resume)
+        journal = self.journal
+        if self.resume:
+            self.merge_shard_journals()
+        current_links = journal.pending_links(job_links)
+        self.total_links = len(current_links)
+        retry_policy = self.retry_policy
+        print(f"\n{'='*60}")
+        print(f"SCRAPING {len(current_links)} JOBS (up to {retry_policy.max_attempts} attempts per link)")
+        print(f"{'='*60}")
+        try:
+            if self.job_registry is not None:
+                scraped_links, error_links = await self.process_registered_links(current_links)
+            else:
+                scraped_links, error_links = await self.process_links(current_links)
+        except BaseException:
+            # Interrupted or crashed: keep what the journal holds and write the rest out for a rescrape
+            journal.flush()
+            self.company_cache.save()
+            crawl_frontier.mark_scraped([link for link in current_links if link in journal.links], adapter.job_id_from_link,
+                                        adapter.card_fingerprints)
+            self.save_error_links(journal.pending_links(current_links))
+            raise
+        crawl_frontier.mark_scraped(scraped_links, adapter.job_id_from_link, adapter.card_fingerprints)
+        crawl_frontier.mark_failed(error_links, adapter.job_id_from_link)
+        if error_links:
+            print(f"\n{len(error_links)} links still failed after {retry_policy.max_attempts} attempts, the crawl frontier keeps them for the next run")
+        else:
+            print("No error links found. All jobs processed successfully!")
+        if journal.count:
+            print(f"\n{'='*60}")
+            print("FINAL CONSOLIDATION")
+            print(f"{'='*60}")
+            final_filename = self.output_filename("final.csv", is_rescraping)
+            journal.to_csv(final_filename)
+            print(f"Final consolidated data saved to: {final_filename}")
+            print(f"Total successful jobs scraped: {journal.count}")
+            initial_links = len(job_links)
+            successful_jobs = journal.count
+            failed_jobs = initial_links - successful_jobs
+            success_rate = (successful_jobs / initial_links) * 100 if initial_links > 0 else 0
+            print(f"\nSCRAPING SUMMARY:")
+            print(f"Initial job links: {initial_links}")
+            print(f"Successfully scraped: {successful_jobs}")
+            print(f"Failed to scrape: {failed_jobs}")
+            print(f"Success rate: {success_rate:.1f}%")
+            print(f"Total retry attempts: {retry_policy.stats['retries']}")
+        self.print_stats()
+
+    def print_recycle_stats(self):
+        print(f"Browser recycling: {self.browser_generation} browser generations, {self.recycle_stats['recycled']} recycled "
+              f"on memory or errors, peak {self.recycle_stats['peak_mb']:.0f} MB (log in data/memory_{self.run_name}.csv)")
+
+    def print_stats(self):
+        self.print_recycle_stats()
+        self.retry_policy.print_stats()
+        self.company_cache.print_stats()
+        self.request_blocker.print_stats()
+        RATE_LIMITER.print_stats()
+        print_expansion_stats(self.adapter.site)
+        if html_archive.HTML_ARCHIVE is not None:
+            html_archive.HTML_ARCHIVE.print_stats()
+        self.adapter.print_stats()
+        self.crawl_frontier.print_stats()
+
+
+def run_shard(adapter, shard, shards, job_links, journal_path, max_retries, progress):
+    """Worker process entry point: scrape one shard of the links with its own browser into its own journal"""
+    started = time.perf_counter()
+    engine = CrawlEngine(adapter, max_retries)
+    stdout, stderr = sys.stdout, sys.stderr
+    log_file = setup_logging(f"{engine.run_name}_shard_{shard}", False)
+    # Every shard crawls the same hosts, so each gets its share of the per-host rates
+    RATE_LIMITER.share(shards)
+    engine.journal = RecordJournal(journal_path)
+    engine.on_progress = lambda link, success: progress.put((shard, success))
+    try:
+        scraped_links, error_links = asyncio.run(engine.process_job_links(job_links))
+        engine.retry_policy.print_stats()
+        engine.company_cache.print_stats()
+        RATE_LIMITER.print_stats()
+        if html_archive.HTML_ARCHIVE is not None:
+            html_archive.HTML_ARCHIVE.print_stats()
+    finally:
+        engine.journal.flush()
+        engine.company_cache.save()
+        sys.stdout, sys.stderr = stdout, stderr
+        log_file.close()
+    return {
+        "scraped": len(scraped_links),
+        "failed": len(error_links),
+        "seconds": time.perf_counter() - started,
+        "retries": engine.retry_policy.stats,
+        "cache_hits": engine.company_cache.hits,
+        "cache_misses": engine.company_cache.misses,
+        "blocked": dict(engine.request_blocker.blocked_counts),
+        "allowed": engine.request_blocker.allowed_count,
+    }
+
+
+async def run_queue_worker(queue_name):
+    """Join a distributed crawl: build the adapter the run published and scrape from its queue until it is drained"""
+    queue = open_work_queue(queue_name)
+    try:
+        adapter, max_retries = queue.load_adapter()
+        engine = CrawlEngine(adapter, max_retries)
+        print(f"Joining work queue {queue_name} as {worker_id()}")
+        scraped_links, error_links = await engine.process_work_queue(queue, worker_id())
+        print(f"\nWorker finished: {len(scraped_links)} scraped, {len(error_links)} failed")
+        engine.retry_policy.print_stats()
+        engine.company_cache.print_stats()
+        engine.request_blocker.print_stats()
+        RATE_LIMITER.print_stats()
+        if html_archive.HTML_ARCHIVE is not None:
+            html_archive.HTML_ARCHIVE.print_stats()
+        queue.print_stats()
+    finally:
+        queue.close()
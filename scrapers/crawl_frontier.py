@@ -0,0 +1,121 @@
+# A Persistent Crawl Frontier -- every posting seen per site, kept in SQLite across runs
+import os
+import sqlite3
+import time
+
+FRONTIER_PATH = "data/crawl_frontier.sqlite3"
+FRONTIER_STALE_AFTER = 7 * 24 * 60 * 60  # Seconds before a scraped posting is due again in incremental mode
+FRONTIER_REFRESH_AFTER = 30 * 24 * 60 * 60  # Seconds before a posting whose search card is unchanged is scraped again anyway
+
+
+class CrawlFrontier:
+    """Postings keyed by site and job id with first-seen, last-scraped, status and search card fingerprint"""
+
+    def __init__(self, site, path=FRONTIER_PATH, stale_after=FRONTIER_STALE_AFTER, refresh_after=FRONTIER_REFRESH_AFTER):
+        self.site = site
+        self.stale_after = stale_after
+        self.refresh_after = refresh_after
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("""
+            CREATE TABLE IF NOT EXISTS postings (
+                site TEXT NOT NULL,
+                job_id TEXT NOT NULL,
+                job_link TEXT NOT NULL,
+                first_seen REAL NOT NULL,
+                last_seen REAL NOT NULL,
+                last_scraped REAL,
+                status TEXT NOT NULL DEFAULT 'new',
+                fingerprint TEXT,
+                PRIMARY KEY (site, job_id)
+            )
+        """)
+        # Frontiers created before card fingerprints were stored
+        columns = [row[1] for row in self.connection.execute("PRAGMA table_info(postings)")]
+        if "fingerprint" not in columns:
+            self.connection.execute("ALTER TABLE postings ADD COLUMN fingerprint TEXT")
+        self.connection.commit()
+        self.stats = {"seen": 0, "new": 0, "changed": 0, "skipped": 0, "scraped": 0, "failed": 0}
+
+    def record_seen(self, job_links, job_id_from_link):
+        """Upsert every discovered link, returning the number of postings never seen before"""
+        now = time.time()
+        rows = [(self.site, job_id_from_link(link), link, now, now) for link in job_links]
+        before = self.count()
+        self.connection.executemany("""
+            INSERT INTO postings (site, job_id, job_link, first_seen, last_seen) VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT (site, job_id) DO UPDATE SET job_link = excluded.job_link, last_seen = excluded.last_seen
+        """, rows)
+        self.connection.commit()
+        new_postings = self.count() - before
+        self.stats["seen"] += len(rows)
+        self.stats["new"] += new_postings
+        return new_postings
+
+    def select_due(self, job_links, job_id_from_link, fingerprints=None):
+        """
+        Keep the links that were never scraped, failed last time, or were scraped too long ago
+
+        A link whose search card fingerprint was stored when it was scraped is also due
+        when its card changed since, and while the card is unchanged it is only refreshed
+        after refresh_after instead of stale_after.
+        """
+        fingerprints = fingerprints or {}
+        now = time.time()
+        due_links = []
+        for link in job_links:
+            row = self.connection.execute(
+                "SELECT status, last_scraped, fingerprint FROM postings WHERE site = ? AND job_id = ?",
+                (self.site, job_id_from_link(link))
+            ).fetchone()
+            fingerprint = fingerprints.get(link)
+            if row is None or row[0] != "scraped" or row[1] is None:
+                due_links.append(link)
+            elif fingerprint is None or row[2] is None:
+                # No card to compare, or none stored yet (frontiers from before fingerprints, rescrape files)
+                if row[1] < now - self.stale_after:
+                    due_links.append(link)
+            elif fingerprint != row[2]:
+                self.stats["changed"] += 1
+                due_links.append(link)
+            elif row[1] < now - self.refresh_after:
+                due_links.append(link)
+        self.stats["skipped"] += len(job_links) - len(due_links)
+        print(f"Incremental crawl: {len(due_links)} of {len(job_links)} postings are new, changed or stale")
+        return due_links
+
+    def mark(self, job_ids, status, fingerprints=None):
+        now = time.time()
+        if status == "scraped":
+            fingerprints = fingerprints or [None] * len(job_ids)
+            rows = [(status, now, fingerprint, self.site, str(job_id)) for job_id, fingerprint in zip(job_ids, fingerprints)]
+            # A link scraped without its card, e.g. from a rescrape file, keeps the fingerprint it had
+            self.connection.executemany(
+                "UPDATE postings SET status = ?, last_scraped = ?, fingerprint = COALESCE(?, fingerprint) WHERE site = ? AND job_id = ?",
+                rows
+            )
+        else:
+            rows = [(status, self.site, str(job_id)) for job_id in job_ids]
+            self.connection.executemany(
+                "UPDATE postings SET status = ? WHERE site = ? AND job_id = ?", rows
+            )
+        self.connection.commit()
+        self.stats[status] += len(rows)
+
+    def mark_scraped(self, job_links, job_id_from_link, fingerprints=None):
+        fingerprints = fingerprints or {}
+        self.mark([job_id_from_link(link) for link in job_links], "scraped", [fingerprints.get(link) for link in job_links])
+
+    def mark_failed(self, job_links, job_id_from_link):
+        self.mark([job_id_from_link(link) for link in job_links], "failed")
+
+    def count(self):
+        return self.connection.execute("SELECT COUNT(*) FROM postings WHERE site = ?", (self.site,)).fetchone()[0]
+
+    def close(self):
+        self.connection.close()
+
+    def print_stats(self):
+        stats = self.stats
+        print(f"Crawl frontier: {stats['seen']} postings seen ({stats['new']} new, {stats['changed']} changed), {stats['skipped']} skipped as fresh, "
+              f"{stats['scraped']} marked scraped, {stats['failed']} marked failed, {self.count()} stored for {self.site}")
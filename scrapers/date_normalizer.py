@@ -0,0 +1,64 @@
+# A Date Normalizer -- posted-date texts turned into YYYY-MM-DD against one fixed scrape time, each text parsed once
+from datetime import datetime, timedelta
+import re
+import pandas as pd
+from pandas import NA
+
+DATE_FORMAT = "%Y-%m-%d"
+ABSOLUTE_DATE_FORMATS = ["%d %b %Y"]  # Tried in order before the text is read as a relative date
+UNIT_DELTAS = {
+    "second": timedelta(seconds=1),
+    "minute": timedelta(minutes=1),
+    "hour": timedelta(hours=1),
+    "day": timedelta(days=1),
+    "week": timedelta(weeks=1),
+    "month": timedelta(days=30),
+    "year": timedelta(days=365),
+}
+# "3 days ago", "Posted 30+ days ago"
+RELATIVE_DATE_PATTERN = re.compile(r"(\d+)\+?\s*(second|minute|hour|day|week|month|year)")
+# Also JobStreet's abbreviated "Posted 3d ago", "Posted 5h ago", "Posted 16m ago" (m is minutes there)
+SHORT_RELATIVE_DATE_PATTERN = re.compile(r"(\d+)\+?\s*(second|minute|min|hour|day|week|month|year|s|m|h|d|w|y)(?:s)?\b")
+SHORT_UNITS = {"s": "second", "min": "minute", "m": "minute", "h": "hour", "d": "day", "w": "week", "y": "year"}
+DAY_OFFSETS = [("yesterday", 1), ("today", 0), ("just now", 0)]
+
+
+class DateNormalizer:
+    """Normalizes posted-date texts against one reference time, remembering the result of every text it has seen"""
+
+    def __init__(self, reference_time=None, short_units=False):
+        self.reference_time = reference_time or datetime.now()
+        self.pattern = SHORT_RELATIVE_DATE_PATTERN if short_units else RELATIVE_DATE_PATTERN
+        self.cache = {}
+
+    def parse(self, date_posted_text):
+        text = date_posted_text.strip().lower()
+        for date_format in ABSOLUTE_DATE_FORMATS:
+            try:
+                return datetime.strptime(text, date_format).strftime(DATE_FORMAT)
+            except ValueError:
+                pass
+        match = self.pattern.search(text)
+        if match:
+            unit = SHORT_UNITS.get(match.group(2), match.group(2))
+            return (self.reference_time - int(match.group(1)) * UNIT_DELTAS[unit]).strftime(DATE_FORMAT)
+        for word, days in DAY_OFFSETS:
+            if word in text:
+                return (self.reference_time - timedelta(days=days)).strftime(DATE_FORMAT)
+        # Unrecognised texts are kept as they are
+        return date_posted_text.lower()
+
+    def normalize(self, date_posted_text):
+        if pd.isna(date_posted_text):
+            return NA
+        date_posted = self.cache.get(date_posted_text)
+        if date_posted is None:
+            date_posted = self.cache[date_posted_text] = self.parse(date_posted_text)
+        return date_posted
+
+    def normalize_column(self, date_posted_texts):
+        """A whole Series of posted-date texts, each distinct text normalized once and broadcast to its rows"""
+        codes, distinct_texts = pd.factorize(date_posted_texts)
+        dates = pd.Series([self.normalize(text) for text in distinct_texts] + [NA], dtype=object)
+        # Missing texts have code -1, the last value
+        return pd.Series(dates.to_numpy()[codes], index=date_posted_texts.index, dtype=object)
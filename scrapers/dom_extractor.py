@@ -0,0 +1,84 @@
+# Single Round-Trip DOM Extraction -- every declared field is read by one page.evaluate call
+from pandas import NA
+import pandas as pd
+
+# "bulk" reads all fields in one page.evaluate, "per_field" uses the original
+# parse_* functions, "compare" runs both and prints any field that differs
+EXTRACTION_MODE = "bulk"
+
+EXTRACT_FIELDS_JS = """
+(fields) => {
+    const resolve = (selector) => {
+        if (selector.startsWith("xpath=")) {
+            selector = selector.slice(6);
+        }
+        if (selector.startsWith("/") || selector.startsWith("(")) {
+            const snapshot = document.evaluate(selector, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            const nodes = [];
+            for (let i = 0; i < snapshot.snapshotLength; i++) {
+                nodes.push(snapshot.snapshotItem(i));
+            }
+            return nodes;
+        }
+        return Array.from(document.querySelectorAll(selector));
+    };
+    const record = {};
+    for (const [name, selector, mode, attribute] of fields) {
+        const nodes = resolve(selector);
+        if (mode === "count") {
+            record[name] = nodes.length;
+        } else if (mode === "texts") {
+            record[name] = nodes.map((node) => node.textContent.trim());
+        } else if (nodes.length === 0) {
+            record[name] = null;
+        } else if (mode === "attr") {
+            record[name] = nodes[0].getAttribute(attribute);
+        } else {
+            record[name] = nodes[0].textContent.trim();
+        }
+    }
+    return record;
+}
+"""
+
+
+def field_args(fields):
+    # A field is a selector string (text of the first match) or a (selector, mode[, attribute]) tuple
+    args = []
+    for name, field in fields.items():
+        if isinstance(field, str):
+            field = (field, "text")
+        selector, mode = field[0], field[1]
+        attribute = field[2] if len(field) > 2 else None
+        args.append([name, selector, mode, attribute])
+    return args
+
+
+async def extract_raw_fields(page, fields):
+    raw = await page.evaluate(EXTRACT_FIELDS_JS, field_args(fields))
+    for name, value in raw.items():
+        if value is None or value == []:
+            raw[name] = NA
+    return raw
+
+
+def is_same_value(first, second):
+    if isinstance(first, list) or isinstance(second, list):
+        return first == second
+    if pd.isna(first) and pd.isna(second):
+        return True
+    return first == second
+
+
+def report_differences(link, bulk_record, per_field_record):
+    differences = [
+        key for key in per_field_record
+        if not is_same_value(bulk_record.get(key, NA), per_field_record[key])
+    ]
+    if differences:
+        print(f"Extraction mismatch on {link}:")
+        for key in differences:
+            print(f"  {key}: bulk={bulk_record.get(key, NA)!r} per_field={per_field_record[key]!r}")
+    else:
+        print(f"Extraction match on {link}")
+    return differences
@@ -0,0 +1,62 @@
+# An Offline Fixture Corpus -- listing, job and company pages saved per portal for parser benchmarks
+import hashlib
+import json
+import os
+import time
+
+FIXTURE_DIR = "fixtures"
+FIXTURES_PER_KIND = 25  # Pages kept per kind ("listing", "job", "company") and portal
+
+
+def fixture_key(url):
+    return hashlib.sha1(url.encode("utf-8")).hexdigest()[:16]
+
+
+class FixtureCorpus:
+    """Pages of one portal in fixtures/<name>/, listed in a manifest with their kind, URL and capture time"""
+
+    def __init__(self, name, root=FIXTURE_DIR, limit=FIXTURES_PER_KIND):
+        self.name = name
+        self.directory = os.path.join(root, name)
+        self.manifest_path = os.path.join(self.directory, "manifest.json")
+        self.limit = limit
+        os.makedirs(self.directory, exist_ok=True)
+        self.manifest = self.load_manifest()
+        self.urls = {entry["url"] for entry in self.manifest}
+
+    def load_manifest(self):
+        if not os.path.exists(self.manifest_path):
+            return []
+        with open(self.manifest_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def save_manifest(self):
+        temp_path = f"{self.manifest_path}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(self.manifest, f, ensure_ascii=False, indent=1)
+        os.replace(temp_path, self.manifest_path)
+
+    def record(self, kind, site, url, html, job_id=None):
+        # Page recorder for page_capture, keeps the first `limit` pages of each kind
+        if url in self.urls or len(self.entries(kind)) >= self.limit:
+            return
+        filename = f"{kind}_{fixture_key(url)}.html"
+        with open(os.path.join(self.directory, filename), "w", encoding="utf-8") as f:
+            f.write(html)
+        self.manifest.append({
+            "kind": kind,
+            "site": site,
+            "url": url,
+            "job_id": job_id,
+            "file": filename,
+            "captured_at": time.time(),
+        })
+        self.urls.add(url)
+        self.save_manifest()
+
+    def entries(self, kind=None):
+        return [entry for entry in self.manifest if kind is None or entry["kind"] == kind]
+
+    def read(self, entry):
+        with open(os.path.join(self.directory, entry["file"]), "r", encoding="utf-8") as f:
+            return f.read()
@@ -0,0 +1,143 @@
+# A Raw HTML Archive -- every fetched job and company page kept zstd-compressed, once per content hash, for offline re-parsing
+import hashlib
+import os
+import sqlite3
+import time
+import zstandard
+from page_capture import PAGE_RECORDERS
+
+ARCHIVE_PAGES = False  # Keep the HTML of every job and company page the crawls load
+ARCHIVE_DIR = "data/archive"
+ARCHIVE_KINDS = ["job", "company"]  # Listing pages are not archived
+ARCHIVE_COMPRESSION_LEVEL = 10  # zstd level, job pages share most of their markup and compress well
+
+ARCHIVE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    site TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    job_id TEXT,
+    url TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    content_hash TEXT NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS pages_by_job ON pages (site, job_id, fetched_at);
+CREATE INDEX IF NOT EXISTS pages_by_url ON pages (url, fetched_at);
+CREATE INDEX IF NOT EXISTS pages_by_kind ON pages (site, kind, fetched_at);
+"""
+
+
+class HtmlArchive:
+    """Page HTML stored as objects/<hash[:2]>/<hash>.zst, with a SQLite index by site, job id, URL and fetch time"""
+
+    def __init__(self, root=ARCHIVE_DIR, level=ARCHIVE_COMPRESSION_LEVEL):
+        self.root = root
+        self.objects_dir = os.path.join(root, "objects")
+        os.makedirs(self.objects_dir, exist_ok=True)
+        # Sharded runs and queue workers on the same machine write to one archive
+        self.db = sqlite3.connect(os.path.join(root, "index.sqlite3"), timeout=60)
+        self.db.row_factory = sqlite3.Row
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.executescript(ARCHIVE_SCHEMA)
+        self.compressor = zstandard.ZstdCompressor(level=level)
+        self.decompressor = zstandard.ZstdDecompressor()
+        self.stats = {"pages": 0, "stored": 0, "duplicates": 0, "html_bytes": 0, "stored_bytes": 0}
+
+    def object_path(self, content_hash):
+        return os.path.join(self.objects_dir, content_hash[:2], f"{content_hash}.zst")
+
+    def put(self, html):
+        """Store the HTML unless the same content is already archived, returning its content hash"""
+        content = html.encode("utf-8")
+        content_hash = hashlib.sha256(content).hexdigest()
+        path = self.object_path(content_hash)
+        if os.path.exists(path):
+            self.stats["duplicates"] += 1
+            return content_hash
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        compressed = self.compressor.compress(content)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(compressed)
+        os.replace(temp_path, path)
+        self.stats["stored"] += 1
+        self.stats["html_bytes"] += len(content)
+        self.stats["stored_bytes"] += len(compressed)
+        return content_hash
+
+    def record(self, kind, site, url, html, job_id=None):
+        # Page recorder for page_capture
+        if kind not in ARCHIVE_KINDS:
+            return
+        content_hash = self.put(html)
+        with self.db:
+            self.db.execute(
+                "INSERT INTO pages (site, kind, job_id, url, fetched_at, content_hash, size) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (site, kind, None if job_id is None else str(job_id), url, time.time(), content_hash, len(html)),
+            )
+        self.stats["pages"] += 1
+
+    def read(self, content_hash):
+        with open(self.object_path(content_hash), "rb") as f:
+            return self.decompressor.decompress(f.read()).decode("utf-8")
+
+    def history(self, site, job_id):
+        """Every archived fetch of one job page, oldest first"""
+        return self.db.execute(
+            "SELECT * FROM pages WHERE site = ? AND job_id = ? ORDER BY fetched_at", (site, str(job_id))
+        ).fetchall()
+
+    def latest(self, site, job_id):
+        """HTML of the newest archived fetch of one job page, None when it was never archived"""
+        row = self.db.execute(
+            "SELECT content_hash FROM pages WHERE site = ? AND job_id = ? ORDER BY fetched_at DESC LIMIT 1", (site, str(job_id))
+        ).fetchone()
+        return None if row is None else self.read(row["content_hash"])
+
+    def latest_by_url(self, url):
+        row = self.db.execute(
+            "SELECT content_hash FROM pages WHERE url = ? ORDER BY fetched_at DESC LIMIT 1", (url,)
+        ).fetchone()
+        return None if row is None else self.read(row["content_hash"])
+
+    def pages(self, site, kind="job", since=None, until=None, latest_only=True):
+        """Index rows of one site's archived pages, by default the newest fetch of each job id or URL"""
+        conditions = ["site = ?", "kind = ?"]
+        params = [site, kind]
+        if since is not None:
+            conditions.append("fetched_at >= ?")
+            params.append(since)
+        if until is not None:
+            conditions.append("fetched_at < ?")
+            params.append(until)
+        rows = self.db.execute(
+            f"SELECT * FROM pages WHERE {' AND '.join(conditions)} ORDER BY fetched_at", params
+        ).fetchall()
+        if not latest_only:
+            return rows
+        newest = {}
+        for row in rows:
+            newest[row["job_id"] or row["url"]] = row
+        return list(newest.values())
+
+    def close(self):
+        self.db.close()
+
+    def print_stats(self):
+        stats = self.stats
+        ratio = stats["html_bytes"] / stats["stored_bytes"] if stats["stored_bytes"] else 0
+        print(f"HTML archive: {stats['pages']} pages archived, {stats['stored']} new objects, "
+              f"{stats['duplicates']} identical to an archived page, {stats['stored_bytes'] / 1e6:.1f} MB written "
+              f"({ratio:.1f}x compression) in {self.root}")
+
+
+HTML_ARCHIVE = None  # This process's archive, registered as a page recorder once ARCHIVE_PAGES turns it on
+
+
+def enable_archive(root=ARCHIVE_DIR):
+    global HTML_ARCHIVE
+    if HTML_ARCHIVE is None:
+        HTML_ARCHIVE = HtmlArchive(root)
+        PAGE_RECORDERS.append(HTML_ARCHIVE)
+    return HTML_ARCHIVE
@@ -0,0 +1,107 @@
+# An HTTP-only Fetch Path for server-rendered job pages, parsed with lxml instead of a browser
+from pandas import NA
+from lxml import html
+from concurrency_controller import AdaptiveConcurrency
+from rate_limiter import RATE_LIMITER
+from page_capture import record_page
+import httpx
+
+# "browser" always uses Playwright, "http" tries a plain HTTP fetch first and
+# falls back to Playwright for links whose page is incomplete or client-rendered
+FETCH_MODE = "browser"
+HTTP_CONCURRENCY_LIMIT = 40  # Starting point, AdaptiveConcurrency moves it with latency and errors
+HTTP_TIMEOUT = 30
+
+HTTP_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/139.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+}
+
+
+def select_nodes(document, selector):
+    # Same resolution as dom_extractor: XPath when the selector looks like one, CSS (through cssselect) otherwise
+    if selector.startswith("xpath="):
+        selector = selector[6:]
+    if selector.startswith("/") or selector.startswith("("):
+        return document.xpath(selector)
+    return document.cssselect(selector)
+
+
+def extract_raw_fields_from_html(document, fields):
+    # Mirrors dom_extractor.EXTRACT_FIELDS_JS so both paths feed the same post-processing
+    raw = {}
+    for name, field in fields.items():
+        if isinstance(field, str):
+            field = (field, "text")
+        selector, mode = field[0], field[1]
+        nodes = select_nodes(document, selector)
+        if mode == "count":
+            raw[name] = len(nodes)
+        elif mode == "texts":
+            raw[name] = [node.text_content().strip() for node in nodes] or NA
+        elif not nodes:
+            raw[name] = NA
+        elif mode == "attr":
+            value = nodes[0].get(field[2])
+            raw[name] = NA if value is None else value
+        else:
+            raw[name] = nodes[0].text_content().strip()
+    return raw
+
+
+def has_required_fields(raw, required_fields):
+    return all(not (raw.get(field) is NA or raw.get(field) == "") for field in required_fields)
+
+
+class HttpFetcher:
+    """Pooled async HTTP client shared by every link of a run"""
+
+    def __init__(self, name, cookies=None, concurrency=HTTP_CONCURRENCY_LIMIT):
+        self.client = httpx.AsyncClient(
+            headers=HTTP_HEADERS,
+            cookies=cookies,
+            timeout=HTTP_TIMEOUT,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=concurrency * 4, max_keepalive_connections=concurrency * 4),
+        )
+        self.concurrency = AdaptiveConcurrency(f"{name} http", concurrency, maximum=concurrency * 4)
+        self.stats = {"fetched": 0, "failed": 0, "fallbacks": 0}
+
+    async def fetch_document(self, url, kind=None, site=None, job_id=None):
+        # kind, site and job_id describe the page to the page recorders, e.g. the HTML archive
+        await RATE_LIMITER.wait(url)
+        started = await self.concurrency.acquire()
+        try:
+            response = await self.client.get(url)
+        except httpx.HTTPError as e:
+            print(f"HTTP fetch failed for {url}: {e}")
+            self.stats["failed"] += 1
+            await self.concurrency.release(started, success=False)
+            return None
+        self.concurrency.record_status(response.status_code)
+        await self.concurrency.release(started, success=response.status_code == 200)
+        if response.status_code != 200 or "html" not in response.headers.get("content-type", ""):
+            print(f"HTTP fetch returned {response.status_code} for {url}")
+            self.stats["failed"] += 1
+            return None
+        self.stats["fetched"] += 1
+        if kind is not None:
+            record_page(kind, site, url, response.text, job_id)
+        return html.fromstring(response.content, base_url=str(response.url))
+
+    async def close(self):
+        await self.client.aclose()
+
+    def print_stats(self):
+        print(f"HTTP fetch: {self.stats['fetched']} pages fetched, {self.stats['failed']} failed, "
+              f"{self.stats['fallbacks']} links sent to the browser")
+        self.concurrency.print_stats()
+
+
+def cookies_from_context(context_cookies):
+    # Playwright context cookies -> httpx cookie jar, so logged-in sessions carry over
+    jar = httpx.Cookies()
+    for cookie in context_cookies:
+        jar.set(cookie["name"], cookie["value"], domain=cookie["domain"], path=cookie["path"])
+    return jar
@@ -0,0 +1,69 @@
+# A Campaign Job Registry -- one detail fetch per posting across every keyword of a campaign
+import asyncio
+from record_journal import read_entries
+
+
+class JobRegistry:
+    """Owner run of every (portal, canonical job id) in a campaign and the keywords that found it"""
+
+    def __init__(self):
+        self.owners = {}  # (portal, job id) -> (owning run, its journal path, the link it scraped)
+        self.keywords = {}  # (portal, job id) -> keywords whose search listed the posting, in discovery order
+        self.finished = {}  # Run name -> event set once the run's own links are journaled
+        self.stats = {"claimed": 0, "shared": 0, "reused": 0, "rescraped": 0}
+
+    def key(self, adapter, link):
+        return adapter.name, adapter.job_id_from_link(link)
+
+    def claim(self, engine, job_links):
+        """Split a run's links into those it scrapes itself and those another run already owns"""
+        adapter = engine.adapter
+        self.finished[engine.run_name] = asyncio.Event()
+        own_links = []
+        shared_links = []
+        for link in job_links:
+            key = self.key(adapter, link)
+            keywords = self.keywords.setdefault(key, [])
+            if adapter.keyword not in keywords:
+                keywords.append(adapter.keyword)
+            owner = self.owners.get(key)
+            if owner is None or owner[0] == engine.run_name:
+                self.owners[key] = (engine.run_name, engine.journal.path, link)
+                own_links.append(link)
+            else:
+                shared_links.append(link)
+        self.stats["claimed"] += len(own_links)
+        self.stats["shared"] += len(shared_links)
+        if shared_links:
+            print(f"{len(shared_links)} of {len(job_links)} postings were already found by other runs of the campaign")
+        return own_links, shared_links
+
+    def finish(self, engine):
+        self.finished[engine.run_name].set()
+
+    async def resolve(self, engine, shared_links):
+        """Journal the owners' records for shared links, returning the links the owners failed to scrape"""
+        adapter = engine.adapter
+        wanted = {}  # Owner journal path -> {owner's link: this run's link}
+        for link in shared_links:
+            owner_run, journal_path, owner_link = self.owners[self.key(adapter, link)]
+            await self.finished[owner_run].wait()
+            wanted.setdefault(journal_path, {})[owner_link] = link
+        missing = set(shared_links)
+        for journal_path, links in wanted.items():
+            for entry in read_entries(journal_path):
+                link = links.get(entry["job_link"])
+                if link in missing:
+                    engine.journal.append(link, entry["record"])
+                    missing.discard(link)
+        self.stats["reused"] += len(shared_links) - len(missing)
+        self.stats["rescraped"] += len(missing)
+        return [link for link in shared_links if link in missing]
+
+    def matched_keywords(self, adapter, link):
+        return self.keywords.get(self.key(adapter, link), [adapter.keyword])
+
+    def print_stats(self):
+        stats = self.stats
+        print(f"Job registry: {stats['claimed']} postings fetched once, {stats['reused']} duplicate fetches avoided, "
+              f"{stats['rescraped']} duplicates scraped again after their first run failed them")
@@ -1,10 +1,70 @@
-# A Job Street Scraper
-from playwright.async_api import async_playwright
+# A Job Street Scraper -- site adapter for the shared crawl engine
 import asyncio
 import pandas as pd
 from pandas import NA
-from datetime import datetime, timedelta
 import re
+from urllib.parse import urlparse
+from link_extractor import card_fingerprint, extract_paginated_links, harvest_cards
+from page_capture import capture_page
+from salary_parser import SalaryRules, parse_salary_text, portal_currencies
+from dom_extractor import EXTRACTION_MODE, extract_raw_fields, report_differences
+from http_fetcher import extract_raw_fields_from_html, has_required_fields
+from crawl_engine import CrawlEngine, SiteAdapter, setup_logging
+
+# Currency names and symbols of each portal's own currency
+CURRENCY_COUNTRY_DICTIONARY = {
+    "ph": ["PHP", "₱"],
+    "th": ["THB", "฿"],
+    "my": ["MYR", "RM"],
+    "id": ["IDR", "Rp"],
+    "sg": ["SGD", "$", "S$"],
+    "vn": ["VND", "₫"],
+}
+CURRENCY_DICTIONARY = {
+    "IDR": "IDR", "MYR": "MYR", "PHP": "PHP", "THB": "THB", "USD": "USD", "SGD": "SGD", "VND": "VND",
+    "Rp": "IDR", "RM": "MYR", "₱": "PHP", "฿": "THB", "$": "SGD", "S$": "SGD", "₫": "VND",
+}
+# Indonesian salaries use a period as the thousands separator and no decimals
+SALARY_RULES = {
+    portal: SalaryRules(portal_currencies(tokens, CURRENCY_DICTIONARY), "dotted" if portal == "id" else "comma")
+    for portal, tokens in CURRENCY_COUNTRY_DICTIONARY.items()
+}
+
+# Selectors for every field read from a job page, shared by the bulk and per-field extraction
+JOB_FIELDS = {
+    "title": "//h1[@data-automation='job-detail-title']",
+    "company": "//span[@data-automation='advertiser-name']",
+    "location": "span[data-automation='job-detail-location']",
+    "date_posted": "xpath=(//span[contains(text(),'Posted')])[1]",
+    "job_type": "//span[@data-automation='job-detail-work-type']",
+    "salary": "span[data-automation='job-detail-salary']",
+    "job_function": "//span[@data-automation='job-detail-classifications']",
+    "description": "//div[@data-automation='jobAdDetails']/div",
+    "company_logo": ("div[data-testid='bx-logo-image'] img", "attr", "src"),
+    "company_url": ("a[data-automation='company-profile-profile-link']", "attr", "href"),
+}
+# Search result card texts fingerprinted to tell whether a posting changed since the last crawl
+CARD_SELECTOR = "article"
+CARD_FIELDS = {
+    "title": "[data-automation='jobTitle']",
+    "company": "[data-automation='jobCompany']",
+    "salary": "[data-automation='jobSalary']",
+    "date_posted": "[data-automation='jobListingDate']",
+}
+COMPANY_FIELDS = {
+    "company_url_direct": ("a[id='website-value']", "attr", "href"),
+    "company_industry": "//h3[contains(text(), 'Industry')]/parent::div/following-sibling::div//span",
+    "company_addresses": "//h3[contains(text(), 'Primary location')]/parent::div/following-sibling::div//span",
+    "company_num_emp": "//h3[contains(text(), 'Company size')]/parent::div/following-sibling::div//span",
+    "company_description": "//h2[contains(text(), 'Company overview')]/ancestor::div[3]/following-sibling::div[1]/div/div[last()]",
+}
+COMPANY_PROFILE_FIELDS = ["company_industry", "company_url_direct", "company_addresses", "company_num_emp", "company_description"]
+HTTP_REQUIRED_FIELDS = ["title", "location"]
+
+def portal_name_from_url(url):
+    # "https://my.jobstreet.com/..." -> "jobstreet_my", the adapter name
+    portal, site = urlparse(url).hostname.split(".")[:2]
+    return f"{site}_{portal}"
 
 async def parse_text_content(page, selector):
     # Check if the element exists
@@ -14,25 +74,10 @@ async def parse_text_content(page, selector):
     else:
         return NA
 
-async def parse_date_posted(page, selector):
-    date_text = await parse_text_content(page, selector)
-
-    current_date = datetime.now()
-    relative_date_text = date_text.replace(
-        "Posted", "").replace("ago", "").strip()
-    print(f"Relative date text: {relative_date_text!r}")
-
-    if "day" in relative_date_text: # if the date is in days
-        days = int(re.sub(r"[^\d]", "", relative_date_text))
-        return (current_date - timedelta(days=days)).strftime(r"%Y-%m-%d")
-    elif "hour" in relative_date_text: # If the date is in hour(s) ago
-        return current_date.strftime(r"%Y-%m-%d")
-    else:  # If the date is in minute(s) or second(s)
-        return current_date.strftime(r"%Y-%m-%d")
-
-async def parse_location(page, selector):
-    location_section = await parse_text_content(page, selector)
+async def parse_date_posted(page, selector, date_normalizer):
+    return date_normalizer.normalize(await parse_text_content(page, selector))
 
+def split_location(location_section):
     if re.search("(hybrid)", location_section.lower()):
         location = location_section.split("(hybrid)")[0].strip()
         work_setup = "hybrid"
@@ -48,113 +93,12 @@ async def parse_location(page, selector):
 
     return location, is_remote, work_setup
 
+async def parse_location(page, selector):
+    return split_location(await parse_text_content(page, selector))
 
-async def parse_salary(page, selector, currency_values, currency_dictionary, portal):
-    # salary_locator = page.locator(selector)
-    salary_text = (await parse_text_content(page, selector))
-
-    # Checks if the salary is present on the page
-    if not pd.isna(salary_text):
-        salary_text = salary_text.lower()
-        salary_source = "direct_data"
-        
-        # Select the salary value
-        if portal == "id":
-            # Designed for Indoensian Portal where the salary separator is a period or a comma -- does not consider decimal
-            numbers = re.findall(
-                r"(?:\d{1,3}(?:[.,]\d{3})*|\d+)\s*(?:million|mil|m|k|thousand|thousands)?\b",
-                salary_text,
-                re.IGNORECASE
-            )
-
-            # Parse the numbers (conversion & formatting)
-            parsed_numbers = []
-            for n in numbers:
-                n = n.replace(",","").replace(".","").strip()
-                print("n:", n)
-
-                if re.search(r"(million|mil|m)\b", n):
-                    num_part = re.sub(r"(million|mil|m)\b", "", n).strip()
-                    parsed_numbers.append(int(float(num_part) * 1_000_000))   
-                elif re.search(r"(k|thousand|thousands)\b", n):
-                    num_part = re.sub(r"(k|thousand|thousands)\b", "", n).strip()
-                    parsed_numbers.append(int(float(num_part) * 1_000))   
-                else:
-                    print("parsed n:", n)
-                    parsed_numbers.append(int(float(n)))
-
-        else:
-            # Designed for Others Portals where the salary separator is a comma -- considers decimal (if present)
-            numbers = re.findall(
-                r"\d+(?:,\d+)*(?:\.\d+)?\s*(?:million|mil|m|k|thousand|thousands)?\b",
-                salary_text,
-                re.IGNORECASE
-            )
-
-            # Parse the numbers (conversion & formatting)
-            parsed_numbers = []
-            for n in numbers:
-                n = n.replace(",","").strip()
-
-                if re.search(r"(million|mil|m)\b", n):
-                    num_part = re.sub(r"(million|mil|m)\b", "", n).strip()
-                    parsed_numbers.append(int(float(num_part) * 1_000_000))   
-                elif re.search(r"(k|thousand|thousands)\b", n):
-                    num_part = re.sub(r"(k|thousand|thousands)\b", "", n).strip()
-                    parsed_numbers.append(int(float(num_part) * 1_000))   
-                else:
-                    parsed_numbers.append(int(float(n)))
-
-        # Assigning min and max sallary:
-        if len(parsed_numbers) > 1:
-            min_amount = parsed_numbers[0] if parsed_numbers[0] < parsed_numbers[1] else parsed_numbers[1]
-            max_amount = parsed_numbers[0] if parsed_numbers[0] > parsed_numbers[1] else parsed_numbers[1]
-        elif "up to" in salary_text:
-            min_amount = 0
-            max_amount = parsed_numbers[0]
-        elif "starting from" in salary_text:
-            min_amount = parsed_numbers[0]
-            max_amount = 0
-        elif len(parsed_numbers) == 1:
-            min_amount = parsed_numbers[0]
-            max_amount = parsed_numbers[0]
-        else:
-            min_amount = NA
-            max_amount = NA
-        print(min_amount, max_amount)
-
-        # Setting the currency
-        for c in currency_values:
-            if re.search(c.lower(), salary_text):
-                currency = currency_values[0]
-                break
-
-        # Fallback if the currency of the country portal is not found
-        if "currency" not in locals():
-            for c in currency_dictionary:
-                if c.lower() in salary_text:
-                    currency = currency_dictionary[c]
-                    break
-
-        # Last Falback for currency
-        if "currency" not in locals():
-            currency = NA
-
-        # Determining salary interval
-        if re.search("year", salary_text):
-            interval = "yearly"
-        elif re.search("month", salary_text):
-            interval = "monthly"
-        elif re.search("week", salary_text):
-            interval = "weekly"
-        elif re.search("hour", salary_text):
-            interval = "hourly"
-        else:
-            interval = NA
-    else:
-        return NA, NA, NA, NA, NA
 
-    return salary_source, interval, min_amount, max_amount, currency
+async def parse_salary(page, selector, salary_rules):
+    return parse_salary_text(await parse_text_content(page, selector), salary_rules)
 
 async def parse_company_logo(page, selector):
     logo = page.locator(selector)
@@ -165,305 +109,284 @@ async def parse_company_logo(page, selector):
     else:
         return NA
 
-async def parse_company_info(portal, site, page):
-    link_locator = page.locator(
-        "a[data-automation='company-profile-profile-link']"
-    )
+async def fetch_company_profile(page, company_url):
+    await page.goto(company_url)
+    await capture_page(page, "company", portal_name_from_url(company_url), company_url)
 
-    if await link_locator.count() > 0:
-        company_url_href = await link_locator.get_attribute("href")
+    company_url_direct_locator = page.locator(COMPANY_FIELDS["company_url_direct"][0])
+    if await company_url_direct_locator.count() > 0:
+        company_url_direct = await company_url_direct_locator.get_attribute("href")
     else:
-        company_url_href = NA
-
-    if not pd.isna(company_url_href):
-        company_url = f"https://{portal}.{site}.com{company_url_href}"
-        print(company_url)
-        await page.goto(company_url)
-
-        company_url_direct_locator = page.locator("a[id='website-value']")
-        if await company_url_direct_locator.count() > 0:
-            company_url_direct = await company_url_direct_locator.get_attribute("href")
-        else:
-            company_url_direct = NA
-
-        company_industry = await parse_text_content(
-            page,
-            "//h3[contains(text(), 'Industry')]/parent::div/following-sibling::div//span"
-        )
+        company_url_direct = NA
+
+    company_industry = await parse_text_content(page, COMPANY_FIELDS["company_industry"])
+    company_addresses = await parse_text_content(page, COMPANY_FIELDS["company_addresses"])
+    company_num_emp = await parse_text_content(page, COMPANY_FIELDS["company_num_emp"])
+    company_description = await parse_text_content(page, COMPANY_FIELDS["company_description"])
+
+    return {
+        "company_industry": company_industry,
+        "company_url_direct": company_url_direct,
+        "company_addresses": company_addresses,
+        "company_num_emp": company_num_emp,
+        "company_description": company_description,
+    }
+
+async def fetch_company_profile_http(fetcher, company_url):
+    document = await fetcher.fetch_document(company_url, "company", portal_name_from_url(company_url))
+    if document is None:
+        raise RuntimeError(f"Company page unavailable over HTTP: {company_url}")
+    print(f"Company URL: {company_url}")
+    return extract_raw_fields_from_html(document, COMPANY_FIELDS)
+
+def company_profile_url(company_url_href, portal, site):
+    return NA if pd.isna(company_url_href) else f"https://{portal}.{site}.com{company_url_href}"
+
+async def lookup_company_profile(page, company_url, company_cache):
+    if pd.isna(company_url):
+        return {field: NA for field in COMPANY_PROFILE_FIELDS}
+
+    print(company_url)
+
+    # Reuse the profile when the same employer was already visited
+    return await company_cache.get_or_fetch(
+        company_url,
+        lambda: fetch_company_profile(page, company_url)
+    )
 
-        company_addresses = await parse_text_content(
-            page, 
-            "//h3[contains(text(), 'Primary location')]/parent::div/following-sibling::div//span"
-        )
+async def parse_job_fields(page, portal, site, salary_rules, date_normalizer):
+    # Per-field fallback: one browser round-trip per selector
+    location, is_remote, work_setup = await parse_location(page, JOB_FIELDS["location"])
+    salary_source, interval, min_amount, max_amount, currency = await parse_salary(page, JOB_FIELDS["salary"], salary_rules)
+    link_locator = page.locator(JOB_FIELDS["company_url"][0])
+    company_url_href = await link_locator.get_attribute("href") if await link_locator.count() > 0 else NA
+
+    return {
+        "title": await parse_text_content(page, JOB_FIELDS["title"]),
+        "company": await parse_text_content(page, JOB_FIELDS["company"]),
+        "location": location,
+        "is_remote": is_remote,
+        "work_setup": work_setup,
+        "date_posted": await parse_date_posted(page, JOB_FIELDS["date_posted"], date_normalizer),
+        "job_type": await parse_text_content(page, JOB_FIELDS["job_type"]),
+        "salary_source": salary_source,
+        "interval": interval,
+        "min_amount": min_amount,
+        "max_amount": max_amount,
+        "currency": currency,
+        "job_function": await parse_text_content(page, JOB_FIELDS["job_function"]),
+        "description": await parse_text_content(page, JOB_FIELDS["description"]),
+        "company_logo": await parse_company_logo(page, JOB_FIELDS["company_logo"][0]),
+        "company_url": company_profile_url(company_url_href, portal, site),
+    }
+
+def post_process_job_fields(raw, portal, site, salary_rules, date_normalizer):
+    location, is_remote, work_setup = split_location(raw["location"])
+    salary_source, interval, min_amount, max_amount, currency = parse_salary_text(raw["salary"], salary_rules)
+
+    return {
+        "title": raw["title"],
+        "company": raw["company"],
+        "location": location,
+        "is_remote": is_remote,
+        "work_setup": work_setup,
+        "date_posted": date_normalizer.normalize(raw["date_posted"]),
+        "job_type": raw["job_type"],
+        "salary_source": salary_source,
+        "interval": interval,
+        "min_amount": min_amount,
+        "max_amount": max_amount,
+        "currency": currency,
+        "job_function": raw["job_function"],
+        "description": raw["description"],
+        "company_logo": raw["company_logo"],
+        "company_url": company_profile_url(raw["company_url"], portal, site),
+    }
+
+async def extract_job_fields(page, portal, site, salary_rules, date_normalizer):
+    # Bulk extraction: every selector in JOB_FIELDS resolved by one page.evaluate
+    raw = await extract_raw_fields(page, JOB_FIELDS)
+    return post_process_job_fields(raw, portal, site, salary_rules, date_normalizer)
+
+async def has_no_results(page):
+    # Check if we've reached the end by looking for "no results" messages
+    no_results_indicators = [
+        "text=No jobs found",
+        "text=We couldn't find any jobs",
+        "text=Sorry, no jobs found",
+        "[data-automation='no-search-results']",
+        ".no-results"
+    ]
+    for indicator in no_results_indicators:
+        if await page.locator(indicator).count() > 0:
+            return True
+    return False
+
+async def harvest_result_page(page, url, page_number, cards=None):
+    await page.goto(url, timeout=30000)  # 30 second timeout
+
+    # Wait for the job cards to load
+    try:
+        await page.wait_for_selector("article", timeout=10000)
+    except Exception:
+        return None if await has_no_results(page) else []
+
+    # Locator for job card links
+    card_links = page.locator(
+        "//article[contains(@data-testid, 'job-card')]/div/a[@data-automation='job-list-view-job-link']"
+    )
 
-        company_num_emp = await parse_text_content(
-            page, 
-            "//h3[contains(text(), 'Company size')]/parent::div/following-sibling::div//span"
-        )
+    if await card_links.count() == 0:
+        return None if await has_no_results(page) else []
 
-        company_description = await parse_text_content(
-            page, 
-            "//h2[contains(text(), 'Company overview')]/ancestor::div[3]/following-sibling::div[1]/div/div[last()]"
-        )
+    await capture_page(page, "listing", portal_name_from_url(url), url)
+    return await harvest_cards(card_links, CARD_SELECTOR, CARD_FIELDS, cards)
 
+async def count_results(page):
+    # Total shown above the result list, e.g. "1,234 jobs"
+    total_text = await parse_text_content(page, "[data-automation='totalJobsCount']")
+    if pd.isna(total_text):
+        return None
+    total_digits = re.sub(r"[^\d]", "", total_text)
+    return int(total_digits) if total_digits else None
+
+def job_id_from_link(link):
+    return link.split("/job/")[1].split("?")[0] if "/job/" in link else link
+
+async def scrape_single_job(page, link, portal, site, salary_rules, date_normalizer, company_cache):
+    job_id = job_id_from_link(link)
+    job_url = f"https://{portal}.{site}.com{link}"
+    print(f"Job URL: {job_url}")
+    await page.goto(job_url, timeout=30000)
+    await capture_page(page, "job", f"{site}_{portal}", job_url, job_id)
+
+    if EXTRACTION_MODE == "per_field":
+        fields = await parse_job_fields(page, portal, site, salary_rules, date_normalizer)
     else:
-        return NA, NA, NA, NA, NA, NA
-
-    return company_industry, company_url, company_url_direct, company_addresses, company_num_emp, company_description
-    
-
-async def web_scraper(portal="my", site="jobstreet", location="", keyword="Data-Analyst", max_pages=2):
-    # Phase 1: Initiate
-    print("Initiating JobStreet Scraper")
-    print(f"{portal} {site} {location} {keyword} {max_pages}")
-    async with async_playwright() as pw:
-        browser = await pw.chromium.launch(headless=False,)
-
-        # Configuring the browser to be Incognito (to have clean cookies, cache, etc.)
-        context = await browser.new_context()
-        # Open new page
-        page = await context.new_page()
-
-        # Phase 2: Extract all job links with automatic page detection
-
-        # Initializing variables
-        job_links = []
-        seen_links = set()  # To avoid duplicate job links
-        current_page = 1
-        consecutive_empty_pages = 0
-        max_consecutive_empty = 3  # Stop if we encounter 3 consecutive empty pages
-
-        # Extracting job links
-        print("Extracting Job Links")
-        while current_page <= max_pages and consecutive_empty_pages < max_consecutive_empty:
-            loc_param = f"/in-{location}" if location else ""
-            url = f"https://{portal}.{site}.com/{keyword}-jobs{loc_param}?page={current_page}"
-            print(f"Scraping page {current_page}: {url}")
-
-            try:
-                await page.goto(url, timeout=30000)  # 30 second timeout
-
-                # Wait for the job cards to load
-                await page.wait_for_selector("article", timeout=10000)
-
-                # Locator for job card links
-                card_links = page.locator(
-                    "//article[contains(@data-testid, 'job-card')]/div/a[@data-automation='job-list-view-job-link']"
-                )
-
-                print(card_links)
-
-                # Get the count of job links on current page
-                link_count = await card_links.count()
-
-                if link_count == 0:
-                    consecutive_empty_pages += 1
-                    print(
-                        f"No job links found on page {current_page}. Empty pages count: {consecutive_empty_pages}")
-
-                    # Check if we've reached the end by looking for "no results" messages
-                    no_results_indicators = [
-                        "text=No jobs found",
-                        "text=We couldn't find any jobs",
-                        "text=Sorry, no jobs found",
-                        "[data-automation='no-search-results']",
-                        ".no-results"
-                    ]
-
-                    page_reached_end = False
-                    for indicator in no_results_indicators:
-                        if await page.locator(indicator).count() > 0:
-                            print(
-                                f"End of results detected on page {current_page}")
-                            page_reached_end = True
-                            break
-
-                    if page_reached_end:
-                        print("Reached end of job listings")
-                        break
-
-                else:
-                    consecutive_empty_pages = 0  # Reset counter if we found jobs
-                    page_job_links = []
-
-                    for link_index in range(link_count):
-                        link_href = await card_links.nth(link_index).get_attribute('href')
-                        if link_href and link_href not in seen_links:
-                            job_links.append(link_href)
-                            seen_links.add(link_href)
-                            page_job_links.append(link_href)
-
-                    print(
-                        f"Found {len(page_job_links)} new job links on page {current_page}")
-
-            except Exception as e:
-                print(f"Error scraping page {current_page}: {str(e)}")
-                consecutive_empty_pages += 1
-
-            current_page += 1
-
-        print(
-            f"\nTotal Job Links collected: {len(job_links)} from {current_page - 1} pages")
-        print(f"Unique job links: {len(set(job_links))}")
-
-        if not job_links:
-            print("No job links found. Exiting.")
-            await browser.close()
-            return
-        # Phase 3: Extract Job Details
-
-        # Initialize currency dictionary
-        currency_country_dictionary = {
-            "ph": ["PHP", "₱"],
-            "th": ["THB", "฿"],
-            "my": ["MYR", "RM"],
-            "id": ["IDR", "Rp"],
-            "sg": ["SGD", "$", "S$"],
-            "vn": ["VND", "₫"],
-        }
-        currency_values = currency_country_dictionary[portal]
-
-        currency_dictionary = {
-            "IDR": "IDR", "MYR": "MYR", "PHP": "PHP", "THB": "THB", "USD": "USD", "SGD": "SGD", "VND": "VND",
-            "Rp": "IDR", "RM": "MYR", "₱": "PHP", "฿": "THB", "$": "SGD", "S$": "SGD", "₫": "VND",
-        }
-
-        # Initialize data list
-        job_data = []
-
-        # Extract job details
-        print("\nExtracting Job Details")
-        for i, link in enumerate(job_links, 1):
-            print(f"Processing job {i}/{len(job_links)}")
-
-            try:
-                job_id = link.split("/job/")[1].split("?")[0]
-                
-                job_url = f"https://{portal}.{site}.com{link}"
-                print(f"Job URL: {job_url}")
-                await page.goto(job_url, timeout=30000)
-
-                title = await parse_text_content(
-                    page, 
-                    "//h1[@data-automation='job-detail-title']"
-                )
-
-                company = await parse_text_content(
-                    page, 
-                    "//span[@data-automation='advertiser-name']"
-                )
-
-                location, is_remote, work_setup = await parse_location(
-                    page, 
-                    "span[data-automation='job-detail-location']"
-                )
-                
-                date_posted = await parse_date_posted(
-                    page, 
-                    "xpath=(//span[contains(text(),'Posted')])[1]"
-                )
-                
-
-                job_type = await parse_text_content(
-                    page, 
-                    "//span[@data-automation='job-detail-work-type']"
-                )
-
-                salary_source, interval, min_amount, max_amount, currency = await parse_salary(
-                    page, 
-                    "span[data-automation='job-detail-salary']", 
-                    currency_values, 
-                    currency_dictionary,
-                    portal
-                )
-                
-
-                job_function = await parse_text_content(
-                    page, 
-                    "//span[@data-automation='job-detail-classifications']"
-                )
-
-                listing_type = link.split("type=")[1].split(
-                    "&")[0] if "type=" in link else NA
-                
-                description = await parse_text_content(
-                    page, 
-                    "//div[@data-automation='jobAdDetails']/div"
-                )
-
-                company_logo = await parse_company_logo(
-                    page, 
-                    "div[data-testid='bx-logo-image'] img"
-                )
-                
-                company_industry, company_url, company_url_direct, company_addresses, company_num_emp, company_description = await parse_company_info(
-                    portal, 
-                    site, 
-                    page
-                )
-                
-                job_data.append({
-                    "id": job_id,
-                    "site": site,
-                    "job_url": job_url,
-                    "job_url_direct": NA,
-                    "title": title,
-                    "company": company,
-                    "location": location,
-                    "date_posted": date_posted,
-                    "job_type": job_type,
-                    "salary_source": salary_source,
-                    "interval": interval,
-                    "min_amount": min_amount,
-                    "max_amount": max_amount,
-                    "currency": currency,
-                    "is_remote": is_remote,
-                    "work_setup": work_setup,
-                    "job_level": NA,
-                    "job_function": job_function,
-                    "listing_type": listing_type,
-                    "emails": NA,
-                    "description": description,
-                    "company_industry": company_industry,
-                    "company_url": company_url,
-                    "company_logo": company_logo,
-                    "company_url_direct": company_url_direct,
-                    "company_addresses": company_addresses,
-                    "company_num_emp": company_num_emp,
-                    "company_revenue": NA,
-                    "company_description": company_description,
-                })
-
-            except Exception as e:
-                print(f"Error processing job {i} ({link}): {str(e)}")
-                continue
-
-        await browser.close()
-
-        print("Extraction Completed")
-        print("Saving data to CSV")
-
-        # Phase 4: Save to CSV
-        data_frame = pd.DataFrame(job_data)
-
-        # Last cleanup
-        # for col in data_frame.columns:
-        #     if data_frame[col].dtype == "object":
-        #         data_frame[col] = data_frame[col].apply(
-        #             lambda x: x.replace("\n", " ").replace(
-        #                 "\r", " ") if isinstance(x, str) else x
-        #         )
-
-        # Save to CSV
-        data_frame.to_csv(
-            f"data/{site}_{portal}_{keyword}.csv", 
-            index=False,
-            quotechar='"', 
-            escapechar='\\', 
-            encoding='utf-8-sig'
+        fields = await extract_job_fields(page, portal, site, salary_rules, date_normalizer)
+        if EXTRACTION_MODE == "compare":
+            report_differences(job_url, fields, await parse_job_fields(page, portal, site, salary_rules, date_normalizer))
+
+    profile = await lookup_company_profile(page, fields["company_url"], company_cache)
+    return build_job_record(job_id, job_url, link, site, fields, profile)
+
+def build_job_record(job_id, job_url, link, site, fields, profile):
+    listing_type = link.split("type=")[1].split(
+        "&")[0] if "type=" in link else NA
+
+    return {
+        "id": job_id,
+        "site": site,
+        "job_url": job_url,
+        "job_url_direct": NA,
+        "title": fields["title"],
+        "company": fields["company"],
+        "location": fields["location"],
+        "date_posted": fields["date_posted"],
+        "job_type": fields["job_type"],
+        "salary_source": fields["salary_source"],
+        "interval": fields["interval"],
+        "min_amount": fields["min_amount"],
+        "max_amount": fields["max_amount"],
+        "currency": fields["currency"],
+        "is_remote": fields["is_remote"],
+        "work_setup": fields["work_setup"],
+        "job_level": NA,
+        "job_function": fields["job_function"],
+        "listing_type": listing_type,
+        "emails": NA,
+        "description": fields["description"],
+        "company_industry": profile["company_industry"],
+        "company_url": fields["company_url"],
+        "company_logo": fields["company_logo"],
+        "company_url_direct": profile["company_url_direct"],
+        "company_addresses": profile["company_addresses"],
+        "company_num_emp": profile["company_num_emp"],
+        "company_revenue": NA,
+        "company_description": profile["company_description"],
+    }
+
+async def scrape_single_job_http(fetcher, link, portal, site, salary_rules, date_normalizer, company_cache):
+    # Returns None when the page lacks the job fields, e.g. an expired posting
+    job_id = job_id_from_link(link)
+    job_url = f"https://{portal}.{site}.com{link}"
+    document = await fetcher.fetch_document(job_url, "job", f"{site}_{portal}", job_id)
+    if document is None:
+        return None
+    print(f"Job URL (HTTP): {job_url}")
+    raw = extract_raw_fields_from_html(document, JOB_FIELDS)
+    if not has_required_fields(raw, HTTP_REQUIRED_FIELDS):
+        print(f"Job page is missing its title or location: {job_url}")
+        return None
+    fields = post_process_job_fields(raw, portal, site, salary_rules, date_normalizer)
+    if pd.isna(fields["company_url"]):
+        profile = {field: NA for field in COMPANY_PROFILE_FIELDS}
+    else:
+        profile = await company_cache.get_or_fetch(
+            fields["company_url"],
+            lambda: fetch_company_profile_http(fetcher, fields["company_url"])
+        )
+    return build_job_record(job_id, job_url, link, site, fields, profile)
+
+class JobStreetAdapter(SiteAdapter):
+    """jobstreet.com / jobsdb.com: search pages with a result count, server-rendered job pages"""
+
+    short_date_units = True
+    reparses_archive = True
+
+    def __init__(self, portal="my", site="jobstreet", location="", keyword="Data-Analyst", max_pages=2):
+        super().__init__(f"{site}_{portal}", keyword, max_pages)
+        self.title = "JobsDB" if site == "jobsdb" else "JobStreet"
+        self.site = site
+        self.portal = portal
+        self.location = location
+        self.salary_rules = SALARY_RULES[portal]
+
+    def job_id_from_link(self, link):
+        return job_id_from_link(link)
+
+    def link_from_url(self, url):
+        return url.split(f"{self.site}.com", 1)[-1]
+
+    def search_url(self, page_number):
+        loc_param = f"/in-{self.location}" if self.location else ""
+        return f"https://{self.portal}.{self.site}.com/{self.keyword}-jobs{loc_param}?page={page_number}"
+
+    async def extract_job_links(self, context):
+        # Fetch the result pages concurrently, merging links in page order
+        cards = {}
+        job_links = await extract_paginated_links(
+            context,
+            self.search_url,
+            lambda page, url, page_number: harvest_result_page(page, url, page_number, cards),
+            self.max_pages,
+            count_results=count_results
         )
+        self.card_fingerprints = {link: card_fingerprint(texts, self.date_normalizer) for link, texts in cards.items()}
+        return job_links
+
+    async def job_fields(self, page):
+        return JOB_FIELDS
 
-        print(f"Data saved to CSV with {len(job_data)} job records")
+    async def parse_job_page(self, page, per_field=False):
+        parse = parse_job_fields if per_field else extract_job_fields
+        return await parse(page, self.portal, self.site, self.salary_rules, self.date_normalizer)
+
+    async def fetch_company_page(self, page, company_url):
+        return await fetch_company_profile(page, company_url)
+
+    async def harvest_listing(self, page, url):
+        return await harvest_result_page(page, url, 1)
+
+    async def scrape_job(self, page, link, company_cache):
+        return await scrape_single_job(page, link, self.portal, self.site, self.salary_rules, self.date_normalizer, company_cache)
+
+    async def scrape_job_http(self, fetcher, link, company_cache):
+        return await scrape_single_job_http(fetcher, link, self.portal, self.site, self.salary_rules, self.date_normalizer, company_cache)
+
+async def web_scraper(is_rescraping=False, link_file_name="", portal="my", site="jobstreet", location="", keyword="Data-Analyst", max_pages=2, max_retries=2, incremental=False, resume=False, shards=1, distributed=False):
+    engine = CrawlEngine(JobStreetAdapter(portal, site, location, keyword, max_pages), max_retries, incremental, resume, shards, distributed)
+    await engine.run(is_rescraping, link_file_name)
 
 # Run the Function
 if __name__ == "__main__":
@@ -476,10 +399,32 @@ if __name__ == "__main__":
     print("sg = Singapore (JobStreet)")
     print("ph = Philippines (JobStreet)")
     print("th = Thailand (JobsDB)")
-    portal = input("Choose a JobStreet Portal: ").lower().strip()
-    location = input("Location (optional): ").strip()
-    keyword = input("Job Position: ").strip().replace(" ", "-")
-    max_pages = int(input("Maximum pages to scrape (default 50): ") or "50")
+    rescrape_input = input("\nAre you here to rescrape? (Y/N): ").lower().strip()
+    is_rescraping = True if rescrape_input == "y" else False
+    if is_rescraping:
+        print("Note: The filename format is {site}_{portal}_{keyword}_errors.csv")
+        link_file_name = input("File name the CSV file from the data folder: ").strip()
+        parts = link_file_name.replace("_errors.csv", "").split("_")
+        portal = parts[1]
+        keyword = "_".join(parts[2:])
+        location = ""
+        max_pages = 0
+        incremental = False
+        max_retries = int(input("Maximum retry attempts (default 2): ") or "2")
+    else:
+        portal = input("Choose a JobStreet Portal: ").lower().strip()
+        location = input("Location (optional): ").strip()
+        keyword = input("Job Position: ").strip().replace(" ", "-")
+        max_pages = int(input("Maximum pages to scrape (default 50): ") or "50")
+        max_retries = int(input("Maximum retry attempts for failed links (default 2): ") or "2")
+        incremental_input = input("Only scrape new or stale postings? (Y/N): ").lower().strip()
+        incremental = True if incremental_input == "y" else False
+        link_file_name = ""
+    resume_input = input("Resume from the last run's journal? (Y/N): ").lower().strip()
+    resume = True if resume_input == "y" else False
+    shards = int(input("Worker processes for scraping (default 1): ") or "1")
+    distributed_input = input("Share the links through a work queue other workers can join? (Y/N): ").lower().strip()
+    distributed = True if distributed_input == "y" else False
 
     if portal == "th":
         site = "jobsdb"
@@ -487,4 +432,5 @@ if __name__ == "__main__":
         site = "jobstreet"
 
     # Proper Run
-    asyncio.run(web_scraper(portal, site, location, keyword, max_pages))
+    log_file = setup_logging(f"{site}_{portal}_{keyword}", is_rescraping)
+    asyncio.run(web_scraper(is_rescraping, link_file_name, portal, site, location, keyword, max_pages, max_retries, incremental, resume, shards, distributed))
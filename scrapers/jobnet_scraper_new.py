@@ -1,39 +1,67 @@
-# A Job Net Scraper with Batch Processing and Auto-Retry Logic
-from playwright.async_api import async_playwright
+# A Job Net Scraper -- site adapter for the shared crawl engine
 import asyncio
 import pandas as pd
 from pandas import NA
-from datetime import datetime, timedelta
-import re
-import sys
+import json
 import os
+import time
+import weakref
+from urllib.parse import urlparse
+from page_capture import capture_page
+from salary_parser import SalaryRules, parse_salary_text, portal_currencies
+from dom_extractor import EXTRACTION_MODE, extract_raw_fields, report_differences
+from http_fetcher import extract_raw_fields_from_html, has_required_fields
+from crawl_engine import CrawlEngine, SiteAdapter, setup_logging
 
-# --- Logging for terminal ---
-class Tee:
-    def __init__(self, *files):
-        self.files = files
-    def write(self, obj):
-        for f in self.files:
-            f.write(obj)
-            f.flush()
-    def flush(self):
-        for f in self.files:
-            f.flush()
-
-def setup_logging(is_rescraping, portal, keyword, retry_attempt=0):
-    os.makedirs("data", exist_ok=True)
-    if is_rescraping:
-        log_file_name = f"terminal_output_jobnet_{portal}_{keyword}_rescraped.txt"
-    elif retry_attempt > 0:
-        log_file_name = f"terminal_output_jobnet_{portal}_{keyword}_retry_{retry_attempt}.txt"
-    else:
-        log_file_name = f"terminal_output_jobnet_{portal}_{keyword}.txt"
-    log_file = open(f"data/{log_file_name}", "w", encoding="utf-8")
-    sys.stdout = sys.stderr = Tee(sys.stdout, log_file)
-    return log_file
+SESSION_STATE_PATH = "data/jobnet_{portal}_session.json"  # Logged-in storage state loaded into every new context
+SESSION_MAX_AGE = 12 * 60 * 60  # Seconds a saved session is trusted before a new context logs in again
+SESSION_LOCKS = {}  # Portal -> lock, so the contexts of one process log in one at a time
+LOGIN_FORM_SELECTOR = "input[id='BodyPlaceHolder_txtEmail']"
+
+CURRENCY_COUNTRY_DICTIONARY = {
+    "kh": ["KHR", "₭"],
+    "mm": ["MMK", "Ks", "Ḵ"],
+}
+CURRENCY_DICTIONARY = {
+    "IDR": "IDR", "MYR": "MYR", "PHP": "PHP", "THB": "THB", 
+    "USD": "USD", "SGD": "SGD", "VND": "VND", "KHR": "KHR", "MMK": "MMK",
+    "Rp": "IDR", "RM": "MYR", "₱": "PHP", "฿": "THB", "$": "SGD", "S$": "SGD", 
+    "₫": "VND", "Ks": "MMK", "Ḵ": "MMK", "₭": "KHR"
+}
+SALARY_RULES = {
+    portal: SalaryRules(portal_currencies(tokens, CURRENCY_DICTIONARY))
+    for portal, tokens in CURRENCY_COUNTRY_DICTIONARY.items()
+}
 
-CONCURRENCY_LIMIT = 10
-BATCH_LIMIT = 3000
+# Selectors for every field read from a job page, shared by the bulk and per-field extraction
+JOB_FIELDS = {
+    "title": "//div[@class='job-details__card-header']/div[1]/p[@class='job-details__card-title']",
+    "location": "//div[@class='job-details__card-footer']/div/div[1]/i[@class='icon-font icon-cursor']/following-sibling::span",
+    "date_posted": "//div[@class='job-details__card-footer']/div/div[2]/div[1]/i[@class='fa fa-calendar-check-o']/following-sibling::span",
+    "job_type": "//div[@class='job-details__showing']/div[2]/p[contains(., 'Job Type')]/following-sibling::span",
+    "salary": "//a[@class='job-details__card-login salary-no-link']/span",
+    "job_level": "//div[@class='job-details__showing']/div[2]/p[contains(., 'Experience level')]/following-sibling::span",
+    "job_function": "//div[@class='job-details__showing']/div[2]/p[contains(., 'Job Function')]/following-sibling::span",
+    "description": "//p[contains(., 'Job Description') and @class='job-details__description-title']/parent::div",
+    "requirement": "//p[contains(., 'Job Requirements') and @class='job-details__description-title']/parent::div",
+    "company": "//div[@class='job-details__card-header']/div[1]/a[@class='job-details__card-subtitle ClickTrack-EmpProfile']",
+    "company_url": ("//div[@class='job-details__card-header']/div[1]/a[@class='job-details__card-subtitle ClickTrack-EmpProfile']", "attr", "href"),
+}
+COMPANY_PROFILE_FIELDS = ["company_industry", "company_logo", "company_addresses", "company_num_emp", "company_description"]
+# Selectors for every field read from a company page
+COMPANY_FIELDS = {
+    "company_industry": "//div[@class='career-details__block-desc']/ul/li/span[contains(., 'Industry')]/following-sibling::span",
+    "company_logo": ("//div[@class='career-main__box-left']/img", "attr", "src"),
+    "company_addresses": "//p[contains(., 'Address')]/parent::div/following-sibling::div[@class='career-details__block-desc']/span",
+    "company_num_emp": "//div[@class='career-details__block-desc']/ul/li/span[contains(., 'No. Employees:')]/following-sibling::span",
+    "company_description": "//p[contains(., 'What we do')]/parent::div/following-sibling::span[@class='career-details__block-desc']",
+}
+# Fields a server-rendered job page must have, otherwise the link is scraped with the browser
+HTTP_REQUIRED_FIELDS = ["title", "company", "description"]
+
+def portal_name_from_url(url):
+    # "https://www.jobnet.com.mm/..." -> "jobnet_mm", the adapter name
+    return f"jobnet_{urlparse(url).hostname.rsplit('.', 1)[-1]}"
 
 async def parse_text_content(page, selector):
     locator = page.locator(selector).first
@@ -42,182 +70,94 @@ async def parse_text_content(page, selector):
     else:
         return NA
 
-async def parse_date_posted(page):
-    date_posted_text = await parse_text_content(
-        page, 
-        "//div[@class='job-details__card-footer']/div/div[2]/div[1]/i[@class='fa fa-calendar-check-o']/following-sibling::span"
-    )
-    if not pd.isna(date_posted_text):
-        date_posted_text = date_posted_text.lower()
-        try:
-            date_posted_object = datetime.strptime(date_posted_text, "%d %b %Y")
-            return date_posted_object.strftime("%Y-%m-%d")
-        except ValueError:
-            pass 
-        match = re.search(r"(\d+)\s*(second|minutes|day|week|month|year)", date_posted_text)
-        if match:
-            num = int(match.group(1))
-            unit = match.group(2)
-            match unit:
-                case "second":
-                    delta = timedelta(seconds = num)
-                case "minute":
-                    delta = timedelta(minutes = num)
-                case "hour":
-                    delta = timedelta(hours = num)
-                case "day":
-                    delta = timedelta(days = num)
-                case "week":
-                    delta = timedelta(weeks = num)
-                case "month":
-                    delta = timedelta(days = 30 * num)
-                case "year":
-                    delta = timedelta(days = 365 * num)
-            date_posted_object = datetime.today() - delta
-            return date_posted_object.strftime("%Y-%m-%d")
-        if "yesterday" in date_posted_text:
-            return (datetime.today() - timedelta(days = 1)).strftime("%Y-%m-%d")
-        elif "today" in date_posted_text:
-            return
-        return date_posted_text
-    else:
-        return NA
+async def parse_date_posted(page, date_normalizer):
+    return date_normalizer.normalize(await parse_text_content(page, JOB_FIELDS["date_posted"]))
 
-async def parse_salary(page, selector, currency_values, currency_dictionary):
-    salary_text = (await parse_text_content(page, selector)).lower()
-    print(salary_text)
-    if salary_text not in ["negotiable", "competitive"]:
-        salary_source = "direct_data"
-        numbers = re.findall(r"\d+(?:,\d+)*(?:\.\d+)?\s*(?:million|mil|m|k|thousand|thousands)?\b", salary_text, re.IGNORECASE)
-        parsed_numbers = []
-        for n in numbers:
-            n = n.replace(",","").strip()
-            if re.search(r"(million|mil|m)\b", n):
-                num_part = re.sub(r"(million|mil|m)\b", "", n).strip()
-                parsed_numbers.append(int(float(num_part) * 1_000_000))   
-            elif re.search(r"(k|thousand|thousands)\b", n):
-                num_part = re.sub(r"(k|thousand|thousands)\b", "", n).strip()
-                parsed_numbers.append(int(float(num_part) * 1_000))   
-            else:
-                parsed_numbers.append(int(float(n)))
-        if len(parsed_numbers) > 1:
-            min_amount = min(parsed_numbers)
-            max_amount = max(parsed_numbers)
-        elif "up to" in salary_text:
-            min_amount = 0
-            max_amount = parsed_numbers[0]
-        elif "starting from" in salary_text:
-            min_amount = parsed_numbers[0]
-            max_amount = 0
-        elif len(parsed_numbers) == 1:
-            min_amount = parsed_numbers[0]
-            max_amount = parsed_numbers[0]
-        else:
-            min_amount = NA
-            max_amount = NA
-        print(min_amount, max_amount)
-        currency = NA
-        for c in currency_values:
-            if re.search(c.lower(), salary_text):
-                currency = currency_values[0]
-                break
-        if "currency" not in locals():
-            for c in currency_dictionary:
-                if c.lower() in salary_text:
-                    currency = currency_dictionary[c]
-                    break
-        if "currency" not in locals():
-            currency = NA
-        if "year" in salary_text:
-            interval = "yearly"
-        elif "month" in salary_text:
-            interval = "monthly"
-        elif "week" in salary_text:
-            interval = "weekly"
-        elif "day" in salary_text:
-            interval = "daily"
-        elif "hour" in salary_text:
-            interval = "hourly"
-        else:
-            interval = NA
-        print(f"Salary: {salary_text}")
-        print(f"Min Amount: {min_amount}")
-        print(f"Max Amount: {max_amount}")
-        print(f"Currency: {currency}")
-        print(f"Interval: {interval}")
-    else:
-        return NA, NA, NA, NA, NA
-    return salary_source, interval, min_amount, max_amount, currency
+async def parse_salary(page, selector, salary_rules):
+    return parse_salary_text(await parse_text_content(page, selector), salary_rules)
 
-async def parse_company_info(page, portal):
-    company = await parse_text_content(
-        page, 
-        "//div[@class='job-details__card-header']/div[1]/a[@class='job-details__card-subtitle ClickTrack-EmpProfile']"
+async def fetch_company_profile(page, company_url):
+    await page.goto(company_url, wait_until="domcontentloaded", timeout=40000)
+    print(f"Company URL: {company_url}")
+    await capture_page(page, "company", portal_name_from_url(company_url), company_url)
+    company_logo_src = page.locator(COMPANY_FIELDS["company_logo"][0])
+    return {
+        "company_industry": await parse_text_content(page, COMPANY_FIELDS["company_industry"]),
+        "company_logo": await company_logo_src.first.get_attribute("src") if await company_logo_src.count() > 0 else NA,
+        "company_addresses": await parse_text_content(page, COMPANY_FIELDS["company_addresses"]),
+        "company_num_emp": await parse_text_content(page, COMPANY_FIELDS["company_num_emp"]),
+        "company_description": await parse_text_content(page, COMPANY_FIELDS["company_description"]),
+    }
+
+async def fetch_company_profile_http(fetcher, company_url):
+    document = await fetcher.fetch_document(company_url, "company", portal_name_from_url(company_url))
+    if document is None:
+        raise RuntimeError(f"Company page unavailable over HTTP: {company_url}")
+    print(f"Company URL: {company_url}")
+    return extract_raw_fields_from_html(document, COMPANY_FIELDS)
+
+def company_profile_url(partial_company_url, portal):
+    return NA if pd.isna(partial_company_url) else f"https://www.jobnet.com.{portal}{partial_company_url}"
+
+async def lookup_company_profile(page, company_url, company_cache):
+    if pd.isna(company_url):
+        return {field: NA for field in COMPANY_PROFILE_FIELDS}
+    return await company_cache.get_or_fetch(
+        company_url,
+        lambda: fetch_company_profile(page, company_url)
     )
-    if not pd.isna(company):
-        partial_company_url = await page.locator(
-            "//div[@class='job-details__card-header']/div[1]/a[@class='job-details__card-subtitle ClickTrack-EmpProfile']"
-        ).first.get_attribute("href")
-        company_url = f"https://www.jobnet.com.{portal}{partial_company_url}"
-        await page.goto(company_url, wait_until="domcontentloaded", timeout=40000)
-        print(f"Company URL: {company_url}")
-        company_logo_src = page.locator(
-            "//div[@class='career-main__box-left']/img"
-        )
-        company_logo = await company_logo_src.get_attribute("src") if await company_logo_src.count() > 0 else NA
-        company_addresses = await parse_text_content(
-            page, 
-            "//p[contains(., 'Address')]/parent::div/following-sibling::div[@class='career-details__block-desc']/span"
-        )
-        company_industry = await parse_text_content(
-            page, 
-            "//div[@class='career-details__block-desc']/ul/li/span[contains(., 'Industry')]/following-sibling::span"
-        )
-        company_num_emp = await parse_text_content(
-            page, 
-            "//div[@class='career-details__block-desc']/ul/li/span[contains(., 'No. Employees:')]/following-sibling::span"
-        )
-        company_description = await parse_text_content(
-            page, 
-            "//p[contains(., 'What we do')]/parent::div/following-sibling::span[@class='career-details__block-desc']"
-        )
-    else:
-        return NA, NA, NA, NA, NA, NA, NA
-    return company, company_industry, company_url, company_logo, company_addresses,  company_num_emp, company_description
 
-def save_error_links(error_links, portal, keyword, retry_attempt=0):
-    if not error_links:
-        return None
-    os.makedirs("data", exist_ok=True)
-    if retry_attempt > 0:
-        filename = f"data/jobnet_{portal}_{keyword}_retry_{retry_attempt}_errors.csv"
-    else:
-        filename = f"data/jobnet_{portal}_{keyword}_errors.csv"
-    error_df = pd.DataFrame(error_links, columns=['job_link'])
-    error_df.to_csv(filename, index=False, encoding='utf-8-sig')
-    print(f"Error links saved to: {filename}")
-    return filename
-
-def save_job_data(job_data, portal, keyword, retry_attempt=0, is_rescraping=False):
-    if not job_data:
-        print("No job data to save")
-        return None
-    data_frame = pd.DataFrame(job_data)
-    if is_rescraping:
-        filename = f"data/jobnet_{portal}_{keyword}_rescraped.csv"
-    elif retry_attempt > 0:
-        filename = f"data/jobnet_{portal}_{keyword}_retry_{retry_attempt}.csv"
-    else:
-        filename = f"data/jobnet_{portal}_{keyword}.csv"
-    data_frame.to_csv(
-        filename,
-        index=False,
-        quotechar='"',
-        escapechar='\\',
-        encoding='utf-8-sig'
+async def parse_job_fields(page, portal, salary_rules, date_normalizer):
+    # Per-field fallback: one browser round-trip per selector
+    salary_source, interval, min_amount, max_amount, currency = await parse_salary(
+        page,
+        JOB_FIELDS["salary"],
+        salary_rules
     )
-    print(f"Data saved to: {filename} ({len(job_data)} records)")
-    return filename
+    company = await parse_text_content(page, JOB_FIELDS["company"])
+    partial_company_url = await page.locator(JOB_FIELDS["company_url"][0]).first.get_attribute("href") if not pd.isna(company) else NA
+    return {
+        "title": await parse_text_content(page, JOB_FIELDS["title"]),
+        "location": await parse_text_content(page, JOB_FIELDS["location"]),
+        "date_posted": await parse_date_posted(page, date_normalizer),
+        "job_type": await parse_text_content(page, JOB_FIELDS["job_type"]),
+        "salary_source": salary_source,
+        "interval": interval,
+        "min_amount": min_amount,
+        "max_amount": max_amount,
+        "currency": currency,
+        "job_level": await parse_text_content(page, JOB_FIELDS["job_level"]),
+        "job_function": await parse_text_content(page, JOB_FIELDS["job_function"]),
+        "description": await parse_text_content(page, JOB_FIELDS["description"]),
+        "requirement": await parse_text_content(page, JOB_FIELDS["requirement"]),
+        "company": company,
+        "company_url": company_profile_url(partial_company_url, portal),
+    }
+
+def post_process_job_fields(raw, portal, salary_rules, date_normalizer):
+    salary_source, interval, min_amount, max_amount, currency = parse_salary_text(raw["salary"], salary_rules)
+    return {
+        "title": raw["title"],
+        "location": raw["location"],
+        "date_posted": date_normalizer.normalize(raw["date_posted"]),
+        "job_type": raw["job_type"],
+        "salary_source": salary_source,
+        "interval": interval,
+        "min_amount": min_amount,
+        "max_amount": max_amount,
+        "currency": currency,
+        "job_level": raw["job_level"],
+        "job_function": raw["job_function"],
+        "description": raw["description"],
+        "requirement": raw["requirement"],
+        "company": raw["company"],
+        "company_url": company_profile_url(raw["company_url"], portal) if not pd.isna(raw["company"]) else NA,
+    }
+
+async def extract_job_fields(page, portal, salary_rules, date_normalizer):
+    # Bulk extraction: every selector in JOB_FIELDS resolved by one page.evaluate
+    raw = await extract_raw_fields(page, JOB_FIELDS)
+    return post_process_job_fields(raw, portal, salary_rules, date_normalizer)
 
 async def login(page, portal):
     # Navigate to the login page
@@ -234,6 +174,14 @@ async def login(page, portal):
     await page.wait_for_load_state("domcontentloaded")
     await page.wait_for_selector("p[class='profile__main-name']", timeout=15000)
 
+class SessionExpired(Exception):
+    pass
+
+async def check_session(page):
+    # Logged-out visitors are sent to the login form
+    if "/login" in page.url.lower() or await page.locator(LOGIN_FORM_SELECTOR).count() > 0:
+        raise SessionExpired(f"JobNet session expired at {page.url}")
+
 async def extract_job_links(page, portal, keyword, max_pages):
     job_links = []
     seen_links = set()
@@ -242,6 +190,7 @@ async def extract_job_links(page, portal, keyword, max_pages):
     print(f"Extracting links from https://www.jobnet.com.{portal}/jobs?kw={keyword}")
     while current_page <= max_pages:
         await page.wait_for_selector("a.search__job-title.ClickTrack-JobDetail")
+        await capture_page(page, "listing", portal_name_from_url(page.url), page.url)
         job_item_links = page.locator("a.search__job-title.ClickTrack-JobDetail")
         link_count = await job_item_links.count()
         if link_count == 0:
@@ -272,209 +221,176 @@ async def extract_job_links(page, portal, keyword, max_pages):
     print(f"Unique job links: {len(set(job_links))} from {current_page} pages of {max_pages} pages")
     return job_links
 
-async def scrape_single_job(page, link, portal, currency_values, currency_dictionary):
-    try:
-        job_id = link.rsplit("/", 1)[1]
-        job_url = f"https://www.jobnet.com.{portal}{link}"
-        print(f"Job URL: {job_url}")
-        await page.goto(job_url, timeout=30000)
-        title = await parse_text_content(
-            page,
-            "//div[@class='job-details__card-header']/div[1]/p[@class='job-details__card-title']"
-        )
-        location = await parse_text_content(
-            page,
-            "//div[@class='job-details__card-footer']/div/div[1]/i[@class='icon-font icon-cursor']/following-sibling::span"
-        )
-        date_posted = await parse_date_posted(page)
-        job_type = await parse_text_content(
-            page,
-            "//div[@class='job-details__showing']/div[2]/p[contains(., 'Job Type')]/following-sibling::span"
-        )
-        salary_source, interval, min_amount, max_amount, currency = await parse_salary(
-            page,
-            "//a[@class='job-details__card-login salary-no-link']/span",
-            currency_values,
-            currency_dictionary
-        )
-        job_level = await parse_text_content(page,
-            "//div[@class='job-details__showing']/div[2]/p[contains(., 'Experience level')]/following-sibling::span"
-        )
-        job_function = await parse_text_content(page,
-            "//div[@class='job-details__showing']/div[2]/p[contains(., 'Job Function')]/following-sibling::span"
-        )
-        description = await parse_text_content(
-            page,
-            "//p[contains(., 'Job Description') and @class='job-details__description-title']/parent::div"
-        )
-        requirement = await parse_text_content(
-            page,
-            "//p[contains(., 'Job Requirements') and @class='job-details__description-title']/parent::div"
-        )
-        company, company_industry, company_url, company_logo, company_addresses, company_num_emp, company_description = await parse_company_info(
-            page,
-            portal
-        )
-        return {
-            "id": job_id,
-            "site": "jobnet",
-            "job_url": job_url,
-            "job_url_direct": NA,
-            "title": title,
-            "company": company,
-            "location": location,
-            "date_posted": date_posted,
-            "job_type": job_type,
-            "salary_source": salary_source,
-            "interval": interval,
-            "min_amount": min_amount,
-            "max_amount": max_amount,
-            "currency": currency,
-            "is_remote": NA,
-            "work_setup": NA,
-            "job_level": job_level,
-            "job_function": job_function,
-            "listing_type": NA,
-            "emails": NA,
-            "description": description,
-            "requirement": requirement,
-            "company_industry": company_industry,
-            "company_url": company_url,
-            "company_logo": company_logo,
-            "company_addresses": company_addresses,
-            "company_num_emp": company_num_emp,
-            "company_description": company_description
-        }
-    except Exception as e:
-        print(f"Error scraping {link}: {e}")
-        return None
+def job_id_from_link(link):
+    return link.split("?")[0].rstrip("/").rsplit("/", 1)[1]
 
-async def process_job_links(job_links, portal, currency_values, currency_dictionary, retry_attempt=0):
-    job_data = []
-    error_links = []
-    total_processed = 0
-    async with async_playwright() as pw:
-        async def start_browser():
-            browser = await pw.chromium.launch(headless=False)
-            context = await browser.new_context()
-            page = await context.new_page()
-            await login(page, portal)
-            return browser, context, page
-        browser, context, page = await start_browser()
-        while total_processed < len(job_links):
-            batch_links = job_links[total_processed: total_processed + BATCH_LIMIT]
-            print(f"\n--- Processing batch: {len(batch_links)} jobs ---")
-            sem = asyncio.Semaphore(CONCURRENCY_LIMIT)
-            async def bound_scrape(link):
-                async with sem:
-                    job_page = await context.new_page()
-                    data = await scrape_single_job(job_page, link, portal, currency_values, currency_dictionary)
-                    await job_page.close()
-                    if data:
-                        job_data.append(data)
-                    else:
-                        error_links.append(link)
-            await asyncio.gather(*(bound_scrape(link) for link in batch_links))
-            total_processed += len(batch_links)
-            await browser.close()
-            if total_processed < len(job_links):
-                print(f"\n--- Restarting browser after {total_processed} jobs ---")
-                browser, context, page = await start_browser()
-        await browser.close()
-    return job_data, error_links
-
-async def web_scraper(is_rescraping, link_file_name, portal="mm", keyword="data+analyst", max_pages=2, max_retries=2):
-    print("Initiating Job Net Scraper with Batch/Retry Logic")
-    print(f"Parameters: {portal} {keyword} {max_pages}")
-
-    currency_country_dictionary = {
-        "kh": ["KHR", "₭"],
-        "mm": ["MMK", "Ks", "Ḵ"],
-    }
-    currency_values = currency_country_dictionary[portal]
-    currency_dictionary = {
-        "IDR": "IDR", "MYR": "MYR", "PHP": "PHP", "THB": "THB", 
-        "USD": "USD", "SGD": "SGD", "VND": "VND", "KHR": "KHR", "MMK": "MMK",
-        "Rp": "IDR", "RM": "MYR", "₱": "PHP", "฿": "THB", "$": "SGD", "S$": "SGD", 
-        "₫": "VND", "Ks": "MMK", "Ḵ": "MMK", "₭": "KHR"
+async def scrape_single_job(page, link, portal, salary_rules, date_normalizer, company_cache):
+    job_id = job_id_from_link(link)
+    job_url = f"https://www.jobnet.com.{portal}{link}"
+    print(f"Job URL: {job_url}")
+    await page.goto(job_url, timeout=30000)
+    await check_session(page)
+    await capture_page(page, "job", f"jobnet_{portal}", job_url, job_id)
+    if EXTRACTION_MODE == "per_field":
+        fields = await parse_job_fields(page, portal, salary_rules, date_normalizer)
+    else:
+        fields = await extract_job_fields(page, portal, salary_rules, date_normalizer)
+        if EXTRACTION_MODE == "compare":
+            report_differences(job_url, fields, await parse_job_fields(page, portal, salary_rules, date_normalizer))
+    profile = await lookup_company_profile(page, fields["company_url"], company_cache)
+    return build_job_record(job_id, job_url, fields, profile)
+
+def build_job_record(job_id, job_url, fields, profile):
+    return {
+        "id": job_id,
+        "site": "jobnet",
+        "job_url": job_url,
+        "job_url_direct": NA,
+        "title": fields["title"],
+        "company": fields["company"],
+        "location": fields["location"],
+        "date_posted": fields["date_posted"],
+        "job_type": fields["job_type"],
+        "salary_source": fields["salary_source"],
+        "interval": fields["interval"],
+        "min_amount": fields["min_amount"],
+        "max_amount": fields["max_amount"],
+        "currency": fields["currency"],
+        "is_remote": NA,
+        "work_setup": NA,
+        "job_level": fields["job_level"],
+        "job_function": fields["job_function"],
+        "listing_type": NA,
+        "emails": NA,
+        "description": fields["description"],
+        "requirement": fields["requirement"],
+        "company_industry": profile["company_industry"],
+        "company_url": fields["company_url"],
+        "company_logo": profile["company_logo"],
+        "company_addresses": profile["company_addresses"],
+        "company_num_emp": profile["company_num_emp"],
+        "company_description": profile["company_description"]
     }
 
-    if is_rescraping:
-        job_links_df = pd.read_csv(f"data/{link_file_name}", header=None)
-        job_links = job_links_df[0].tolist()
-        print(f"Loaded {len(job_links)} links from file for rescraping")
+async def scrape_single_job_http(fetcher, link, portal, salary_rules, date_normalizer, company_cache):
+    # Returns None when the link has to be scraped with the browser instead
+    job_id = job_id_from_link(link)
+    job_url = f"https://www.jobnet.com.{portal}{link}"
+    document = await fetcher.fetch_document(job_url, "job", f"jobnet_{portal}", job_id)
+    if document is None:
+        return None
+    print(f"Job URL (HTTP): {job_url}")
+    raw = extract_raw_fields_from_html(document, JOB_FIELDS)
+    if not has_required_fields(raw, HTTP_REQUIRED_FIELDS):
+        print(f"Job page looks client-rendered, falling back to the browser: {job_url}")
+        return None
+    fields = post_process_job_fields(raw, portal, salary_rules, date_normalizer)
+    if pd.isna(fields["company_url"]):
+        profile = {field: NA for field in COMPANY_PROFILE_FIELDS}
     else:
-        # Login once and extract job links in a single context to stay authenticated
-        async with async_playwright() as pw:
-            browser = await pw.chromium.launch(headless=False)
-            context = await browser.new_context()
-            page = await context.new_page()
-            await login(page, portal)
-            job_links = await extract_job_links(page, portal, keyword, max_pages)
-            await browser.close()
-        if not job_links:
-            print("No job links found. Exiting.")
-            return
+        profile = await company_cache.get_or_fetch(
+            fields["company_url"],
+            lambda: fetch_company_profile_http(fetcher, fields["company_url"])
+        )
+    return build_job_record(job_id, job_url, fields, profile)
 
-    all_job_data = []
-    current_links = job_links
-    retry_attempt = 0
 
-    while current_links and retry_attempt <= max_retries:
-        print(f"\n{'='*60}")
-        if retry_attempt == 0:
-            print("INITIAL SCRAPING ATTEMPT")
-        else:
-            print(f"RETRY ATTEMPT {retry_attempt}")
-        print(f"{'='*60}")
-        job_data, error_links = await process_job_links(
-            current_links, portal, currency_values, currency_dictionary, retry_attempt
-        )
-        all_job_data.extend(job_data)
-        if job_data:
-            save_job_data(job_data, portal, keyword, retry_attempt, is_rescraping)
-        if error_links:
-            print(f"\nFound {len(error_links)} failed links")
-            error_file = save_error_links(error_links, portal, keyword, retry_attempt)
-            if retry_attempt < max_retries:
-                print(f"Will retry {len(error_links)} failed links in next attempt...")
-                current_links = error_links
-                retry_attempt += 1
+class JobNetAdapter(SiteAdapter):
+    """jobnet.com.mm / jobnet.com.kh: logged-in session, search pages paged with a "next" button"""
+
+    title = "Job Net"
+    site = "jobnet"
+    supports_http = True
+    # Context -> modification time of the session file its cookies came from. Kept on the class,
+    # not the instance, because the work queue pickles the instance's attributes
+    context_sessions = weakref.WeakKeyDictionary()
+
+    def __init__(self, portal="mm", keyword="data+analyst", max_pages=2):
+        super().__init__(f"jobnet_{portal}", keyword, max_pages)
+        self.portal = portal
+        self.salary_rules = SALARY_RULES[portal]
+        self.session_path = SESSION_STATE_PATH.format(portal=portal)
+        self.stats = {"logins": 0, "reused": 0, "shared": 0, "expired": 0}
+
+    def job_id_from_link(self, link):
+        return job_id_from_link(link)
+
+    def link_from_url(self, url):
+        return url.split(f"jobnet.com.{self.portal}", 1)[-1]
+
+    def session_is_fresh(self):
+        return os.path.exists(self.session_path) and time.time() - os.path.getmtime(self.session_path) < SESSION_MAX_AGE
+
+    def context_options(self):
+        return {"storage_state": self.session_path} if os.path.exists(self.session_path) else {}
+
+    async def prepare_context(self, context):
+        if self.session_is_fresh():
+            # The saved session came in through context_options, a page that finds it logged out renews it
+            self.context_sessions[context] = os.path.getmtime(self.session_path)
+            self.stats["reused"] += 1
+            return
+        await self.renew_session(context)
+
+    async def renew_session(self, context):
+        async with SESSION_LOCKS.setdefault(self.portal, asyncio.Lock()):
+            if self.session_is_fresh() and os.path.getmtime(self.session_path) > self.context_sessions.get(context, 0):
+                # Another context logged in while this one waited, its cookies are good for this one too
+                with open(self.session_path, "r", encoding="utf-8") as f:
+                    await context.add_cookies(json.load(f)["cookies"])
+                self.stats["shared"] += 1
             else:
-                print(f"Max retries ({max_retries}) reached. {len(error_links)} links still failed.")
-                break
-        else:
-            print("No error links found. All jobs processed successfully!")
-            break
+                page = await context.new_page()
+                try:
+                    await login(page, self.portal)
+                finally:
+                    await page.close()
+                state = await context.storage_state()
+                os.makedirs(os.path.dirname(self.session_path), exist_ok=True)
+                temp_path = f"{self.session_path}.{os.getpid()}.tmp"
+                with open(temp_path, "w", encoding="utf-8") as f:
+                    json.dump(state, f)
+                os.replace(temp_path, self.session_path)
+                self.stats["logins"] += 1
+                print(f"Logged in to jobnet.com.{self.portal}, session saved to {self.session_path}")
+            self.context_sessions[context] = os.path.getmtime(self.session_path)
 
-    if all_job_data:
-        print(f"\n{'='*60}")
-        print("FINAL CONSOLIDATION")
-        print(f"{'='*60}")
-        if is_rescraping:
-            final_filename = f"data/jobnet_{portal}_{keyword}_rescraped_final.csv"
-        else:
-            final_filename = f"data/jobnet_{portal}_{keyword}_final.csv"
-        final_df = pd.DataFrame(all_job_data)
-        final_df.to_csv(
-            final_filename,
-            index=False,
-            quotechar='"',
-            escapechar='\\',
-            encoding='utf-8-sig'
-        )
-        print(f"Final consolidated data saved to: {final_filename}")
-        print(f"Total successful jobs scraped: {len(all_job_data)}")
-        initial_links = len(job_links)
-        successful_jobs = len(all_job_data)
-        failed_jobs = initial_links - successful_jobs
-        success_rate = (successful_jobs / initial_links) * 100 if initial_links > 0 else 0
-        print(f"\nSCRAPING SUMMARY:")
-        print(f"Initial job links: {initial_links}")
-        print(f"Successfully scraped: {successful_jobs}")
-        print(f"Failed to scrape: {failed_jobs}")
-        print(f"Success rate: {success_rate:.1f}%")
-        print(f"Total retry attempts: {retry_attempt}")
+    async def extract_job_links(self, context):
+        page = await context.new_page()
+        job_links = await extract_job_links(page, self.portal, self.keyword, self.max_pages)
+        await page.close()
+        return job_links
+
+    async def job_fields(self, page):
+        return JOB_FIELDS
+
+    async def parse_job_page(self, page, per_field=False):
+        parse = parse_job_fields if per_field else extract_job_fields
+        return await parse(page, self.portal, self.salary_rules, self.date_normalizer)
+
+    async def fetch_company_page(self, page, company_url):
+        return await fetch_company_profile(page, company_url)
+
+    async def scrape_job(self, page, link, company_cache):
+        try:
+            return await scrape_single_job(page, link, self.portal, self.salary_rules, self.date_normalizer, company_cache)
+        except SessionExpired as e:
+            print(e)
+            self.stats["expired"] += 1
+            await self.renew_session(page.context)
+            return await scrape_single_job(page, link, self.portal, self.salary_rules, self.date_normalizer, company_cache)
+
+    async def scrape_job_http(self, fetcher, link, company_cache):
+        return await scrape_single_job_http(fetcher, link, self.portal, self.salary_rules, self.date_normalizer, company_cache)
+
+    def print_stats(self):
+        stats = self.stats
+        print(f"JobNet session: {stats['logins']} logins, {stats['reused']} contexts started from the saved session, "
+              f"{stats['shared']} took a session renewed by another context, {stats['expired']} expiries detected")
+
+async def web_scraper(is_rescraping, link_file_name, portal="mm", keyword="data+analyst", max_pages=2, max_retries=2, incremental=False, resume=False, shards=1, distributed=False):
+    engine = CrawlEngine(JobNetAdapter(portal, keyword, max_pages), max_retries, incremental, resume, shards, distributed)
+    await engine.run(is_rescraping, link_file_name)
 
 if __name__ == "__main__":
     print("| = | = | = | Job Net Scraper with Batch/Retry | = | = | = |")
@@ -486,16 +402,24 @@ if __name__ == "__main__":
     if is_rescraping:
         print("Note: The filename format is jobnet_{portal}_{keyword}_errors.csv")
         link_file_name = input("File name the CSV file from the data folder: ").strip()
-        parts = link_file_name.replace("jobnet_", "").replace("_errors.csv", "").replace("_retry_", "_").split("_")
+        parts = link_file_name.replace("jobnet_", "").replace("_errors.csv", "").split("_")
         portal = parts[0]
         keyword = "_".join(parts[1:])
         max_pages = 0
+        incremental = False
         max_retries = int(input("Maximum retry attempts (default 2): ") or "2")
     else:
         portal = input("Choose a JobNet Portal: ").lower().strip()
         keyword = input("Keyword (e.g., data analyst): ").strip().replace(" ", "+")
         max_pages = int(input("Maximum pages to scrape (default 50): ") or "50")
         max_retries = int(input("Maximum retry attempts for failed links (default 2): ") or "2")
+        incremental_input = input("Only scrape new or stale postings? (Y/N): ").lower().strip()
+        incremental = True if incremental_input == "y" else False
         link_file_name = ""
-    log_file = setup_logging(is_rescraping, portal, keyword)
-    asyncio.run(web_scraper(is_rescraping, link_file_name, portal, keyword, max_pages, max_retries))
\ No newline at end of file
+    resume_input = input("Resume from the last run's journal? (Y/N): ").lower().strip()
+    resume = True if resume_input == "y" else False
+    shards = int(input("Worker processes for scraping (default 1): ") or "1")
+    distributed_input = input("Share the links through a work queue other workers can join? (Y/N): ").lower().strip()
+    distributed = True if distributed_input == "y" else False
+    log_file = setup_logging(f"jobnet_{portal}_{keyword}", is_rescraping)
+    asyncio.run(web_scraper(is_rescraping, link_file_name, portal, keyword, max_pages, max_retries, incremental, resume, shards, distributed))
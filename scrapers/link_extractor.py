@@ -0,0 +1,138 @@
+# Concurrent Search-Result Pagination shared by the scrapers' extract_job_links
+import asyncio
+import hashlib
+import math
+
+PAGINATION_CONCURRENCY = 4
+MAX_CONSECUTIVE_EMPTY = 3
+CARD_FINGERPRINT_FIELDS = ["title", "company", "salary", "date_posted"]  # Card texts whose change means the posting changed
+# Every link's href and the texts of its card, read in one evaluate instead of a round trip per card field
+CARD_TEXTS_SCRIPT = """
+(links, [cardSelector, fields]) => links.map(link => {
+    const card = link.closest(cardSelector);
+    const texts = {};
+    for (const [field, selector] of Object.entries(fields)) {
+        const element = card ? card.querySelector(selector) : null;
+        texts[field] = element ? element.textContent.trim() : null;
+    }
+    return [link.getAttribute('href'), texts];
+})
+"""
+
+
+async def harvest_cards(links, card_selector, card_fields, cards=None):
+    """
+    Hrefs of the links located by links, keeping the texts of each link's card in cards
+
+    card_selector matches the card element around a link and card_fields maps
+    a field name to its selector inside the card.
+    """
+    card_texts = await links.evaluate_all(CARD_TEXTS_SCRIPT, [card_selector, card_fields])
+    if cards is not None:
+        for href, texts in card_texts:
+            if href:
+                cards[href] = texts
+    return [href for href, _ in card_texts]
+
+
+def card_fingerprint(texts, date_normalizer):
+    """Hash of a card's title, company, salary and posted date, None when the card showed none of them"""
+    values = []
+    for field in CARD_FINGERPRINT_FIELDS:
+        text = texts.get(field)
+        # "3 days ago" is resolved to a date so the fingerprint holds from day to day,
+        # an open-ended "30+ days ago" would move every day and is kept as it is
+        if field == "date_posted" and text and "+" not in text:
+            text = date_normalizer.normalize(text)
+        values.append(" ".join(text.split()).lower() if text else "")
+    if not any(values):
+        return None
+    return hashlib.sha1("\x1f".join(values).encode("utf-8")).hexdigest()
+
+
+async def extract_paginated_links(context, build_url, harvest_page, max_pages, count_results=None, concurrency=PAGINATION_CONCURRENCY):
+    """
+    Fetch search result pages concurrently and merge their links in page order
+
+    build_url(page_number) returns the result page URL.
+    harvest_page(page, url, page_number) returns the page's links, [] for an
+    empty page, or None when the page is the end of the results.
+    count_results(page) optionally returns the total result count shown on page 1.
+    """
+    pages = asyncio.Queue()
+    for _ in range(max(1, min(concurrency, max_pages))):
+        await pages.put(await context.new_page())
+    results = {}
+    state = {"end_page": max_pages, "total_results": None}
+    tasks = {}
+
+    async def fetch(page_number):
+        if page_number > state["end_page"]:
+            return
+        page = await pages.get()
+        try:
+            url = build_url(page_number)
+            print(f"Scraping page {page_number}: {url}")
+            try:
+                links = await harvest_page(page, url, page_number)
+            except Exception as e:
+                print(f"Error scraping page {page_number}: {str(e)}")
+                links = []
+            # The count is read while page 1 is still loaded, before the page goes back to the pool
+            if page_number == 1 and links and count_results is not None:
+                try:
+                    state["total_results"] = await count_results(page)
+                except Exception:
+                    state["total_results"] = None
+        finally:
+            pages.put_nowait(page)
+        results[page_number] = links
+        if links is None and page_number < state["end_page"]:
+            print(f"End of results detected on page {page_number}")
+            state["end_page"] = page_number
+            # Later pages are past the end of the results, stop them
+            for pending_number, task in tasks.items():
+                if pending_number > page_number:
+                    task.cancel()
+
+    # Probe the first page for the result count before fanning out
+    await fetch(1)
+    total_results = state["total_results"]
+    if total_results:
+        last_page = math.ceil(total_results / len(results[1]))
+        print(f"Found {total_results} results across {last_page} pages")
+        state["end_page"] = min(state["end_page"], last_page)
+
+    for page_number in range(2, state["end_page"] + 1):
+        tasks[page_number] = asyncio.create_task(fetch(page_number))
+    await asyncio.gather(*tasks.values(), return_exceptions=True)
+    while not pages.empty():
+        await pages.get_nowait().close()
+
+    # Merge in page order so the link order matches a sequential walk
+    job_links = []
+    seen_links = set()
+    consecutive_empty_pages = 0
+    pages_scraped = 0
+    for page_number in range(1, state["end_page"] + 1):
+        page_links = results.get(page_number)
+        if page_links is None:
+            break
+        pages_scraped = page_number
+        if not page_links:
+            consecutive_empty_pages += 1
+            print(f"No job links found on page {page_number}. Empty pages count: {consecutive_empty_pages}")
+            if consecutive_empty_pages >= MAX_CONSECUTIVE_EMPTY:
+                break
+            continue
+        consecutive_empty_pages = 0
+        page_job_links = []
+        for link in page_links:
+            if link and link not in seen_links:
+                job_links.append(link)
+                seen_links.add(link)
+                page_job_links.append(link)
+        print(f"Found {len(page_job_links)} new job links on page {page_number}")
+    print(f"\nTotal Job Links collected: {len(job_links)} from {pages_scraped} pages")
+    print(f"Unique Job Links collected: {len(seen_links)}")
+    return job_links
@@ -0,0 +1,20 @@
+# Page Capture -- the HTML of loaded listing, job and company pages handed to whatever records it
+PAGE_RECORDERS = []  # Objects with record(kind, site, url, html, job_id), e.g. a fixture corpus or the HTML archive
+
+
+async def capture_page(page, kind, site, url, job_id=None):
+    """Pass the page's current DOM to every registered recorder, kind is "listing", "job" or "company\""""
+    if not PAGE_RECORDERS:
+        return
+    try:
+        html = await page.content()
+    except Exception as e:
+        print(f"Could not capture {url}: {e}")
+        return
+    record_page(kind, site, url, html, job_id)
+
+
+def record_page(kind, site, url, html, job_id=None):
+    """Hand HTML that was fetched without a browser page to every registered recorder"""
+    for recorder in PAGE_RECORDERS:
+        recorder.record(kind, site, url, html, job_id)
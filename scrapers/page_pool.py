@@ -0,0 +1,87 @@
+# A Pool of warm browser pages, one per concurrency slot, reused across job links
+import asyncio
+import time
+
+PAGE_MAX_USES = 50  # Jobs served by one page before it is replaced with a fresh one
+
+
+class PagePool:
+    """Fixed set of pages handed out to workers and reset between jobs"""
+
+    def __init__(self, context, size, max_uses=PAGE_MAX_USES):
+        self.context = context
+        self.size = size
+        self.max_uses = max_uses
+        self.idle_pages = asyncio.Queue()
+        self.uses = {}
+        self.open_pages = 0
+        self.stats = {
+            "jobs_served": 0,
+            "pages_created": 0,
+            "replaced_after_error": 0,
+            "replaced_after_max_uses": 0,
+            "reset_failures": 0,
+            "acquire_wait_seconds": 0.0,
+        }
+
+    async def start(self, initial=None):
+        # Open `initial` pages now, the rest are opened on demand up to `size`
+        for _ in range(self.size if initial is None else min(initial, self.size)):
+            await self.idle_pages.put(await self.new_page())
+        return self
+
+    async def new_page(self):
+        self.open_pages += 1
+        page = await self.context.new_page()
+        self.uses[page] = 0
+        self.stats["pages_created"] += 1
+        return page
+
+    async def acquire(self):
+        start = time.perf_counter()
+        if self.idle_pages.empty() and self.open_pages < self.size:
+            page = await self.new_page()
+        else:
+            page = await self.idle_pages.get()
+        self.stats["acquire_wait_seconds"] += time.perf_counter() - start
+        return page
+
+    async def release(self, page, failed=False):
+        self.uses[page] += 1
+        self.stats["jobs_served"] += 1
+        replace = failed or page.is_closed() or self.uses[page] >= self.max_uses
+        if not replace:
+            try:
+                # Drop the previous job's DOM, timers and pending requests
+                await page.goto("about:blank")
+            except Exception:
+                self.stats["reset_failures"] += 1
+                replace = True
+        if replace:
+            if failed:
+                self.stats["replaced_after_error"] += 1
+            elif self.uses[page] >= self.max_uses:
+                self.stats["replaced_after_max_uses"] += 1
+            await self.discard(page)
+            page = await self.new_page()
+        await self.idle_pages.put(page)
+
+    async def discard(self, page):
+        del self.uses[page]
+        self.open_pages -= 1
+        try:
+            await page.close()
+        except Exception:
+            pass
+
+    async def close(self):
+        while not self.idle_pages.empty():
+            await self.discard(self.idle_pages.get_nowait())
+
+    def print_stats(self):
+        stats = self.stats
+        average_wait = stats["acquire_wait_seconds"] / stats["jobs_served"] if stats["jobs_served"] > 0 else 0
+        print(f"Page pool: {stats['jobs_served']} jobs on {stats['pages_created']} pages "
+              f"({stats['replaced_after_error']} replaced after errors, "
+              f"{stats['replaced_after_max_uses']} after {self.max_uses} uses, "
+              f"{stats['reset_failures']} failed resets), average wait {average_wait:.2f}s")
@@ -0,0 +1,202 @@
+# A Parser Benchmark -- every portal's extraction timed offline against the fixture corpus in a headless browser
+from playwright.async_api import async_playwright
+import asyncio
+import json
+import os
+import statistics
+import time
+import pandas as pd
+from campaign import CAMPAIGN_SITES
+from company_cache import CompanyCache
+from crawl_engine import CrawlEngine, setup_logging
+from dom_extractor import extract_raw_fields
+from fixture_corpus import FIXTURE_DIR, FIXTURES_PER_KIND, FixtureCorpus
+from page_capture import PAGE_RECORDERS
+from record_journal import RecordJournal
+
+BENCHMARK_BASELINE_PATH = "fixtures/benchmark_baseline.json"
+BENCHMARK_RESULTS_PATH = "data/parser_benchmark_results.json"
+BENCHMARK_ROUNDS = 5  # Timed passes over every job and company fixture, medians are reported
+BENCHMARK_TOLERANCE = 0.2  # Slowdown against the baseline reported as a regression
+
+
+async def capture_fixtures(site, keyword, jobs=FIXTURES_PER_KIND):
+    """Crawl a few live postings of one portal and keep their listing, job and company pages"""
+    adapter = CAMPAIGN_SITES[site](keyword, 1)
+    adapter.supports_http = False  # Pages are captured from the browser pass only
+    corpus = FixtureCorpus(adapter.name, limit=jobs)
+    PAGE_RECORDERS.append(corpus)
+    engine = CrawlEngine(adapter, max_retries=0)
+    # A cache that never hits, so every company page is loaded and captured
+    engine.company_cache = CompanyCache(adapter.name, ttl=0, cache_dir=corpus.directory)
+    engine.journal = RecordJournal(os.path.join(corpus.directory, "records.jsonl"), resume=True)
+    try:
+        job_links = await engine.extract_job_links()
+        await engine.process_job_links(job_links[:jobs])
+    finally:
+        PAGE_RECORDERS.remove(corpus)
+        engine.company_cache.save()
+    print(f"Fixtures of {adapter.name}: {len(corpus.entries('listing'))} listing, {len(corpus.entries('job'))} job "
+          f"and {len(corpus.entries('company'))} company pages in {corpus.directory}")
+
+
+def milliseconds(started):
+    return (time.perf_counter() - started) * 1000
+
+
+def median(values):
+    return round(statistics.median(values), 2) if values else None
+
+
+async def serve_fixtures(context, corpus):
+    # Fixture URLs are answered from disk, every other request is dropped, so the run never leaves the machine
+    pages = {entry["url"]: corpus.read(entry) for entry in corpus.entries()}
+    async def handle(route):
+        html = pages.get(route.request.url.split("#")[0])
+        if html is not None and route.request.resource_type == "document":
+            await route.fulfill(status=200, content_type="text/html; charset=utf-8", body=html)
+        else:
+            await route.abort()
+    await context.route("**/*", handle)
+
+
+async def benchmark_portal(browser, corpus, rounds=BENCHMARK_ROUNDS):
+    adapter = CAMPAIGN_SITES[corpus.name]("benchmark", 1)
+    context = await browser.new_context()
+    await serve_fixtures(context, corpus)
+    page = await context.new_page()
+    timings = {"job_load": [], "job_bulk": [], "job_per_field": [], "company": [], "listing": []}
+    field_timings = {}
+    field_hits = {}
+    failures = 0
+    for round_number in range(rounds):
+        for entry in corpus.entries("job"):
+            try:
+                started = time.perf_counter()
+                await page.goto(entry["url"], wait_until="domcontentloaded")
+                timings["job_load"].append(milliseconds(started))
+                started = time.perf_counter()
+                await adapter.parse_job_page(page)
+                timings["job_bulk"].append(milliseconds(started))
+                started = time.perf_counter()
+                await adapter.parse_job_page(page, per_field=True)
+                timings["job_per_field"].append(milliseconds(started))
+                for name, selector in (await adapter.job_fields(page)).items():
+                    started = time.perf_counter()
+                    raw = await extract_raw_fields(page, {name: selector})
+                    field_timings.setdefault(name, []).append(milliseconds(started))
+                    if round_number == 0:
+                        field_hits.setdefault(name, []).append(bool(raw[name]) if isinstance(raw[name], list) else not pd.isna(raw[name]))
+            except Exception as e:
+                failures += 1
+                print(f"Job fixture {entry['file']} failed: {e}")
+        for entry in corpus.entries("company"):
+            try:
+                started = time.perf_counter()
+                await adapter.fetch_company_page(page, entry["url"])
+                timings["company"].append(milliseconds(started))
+            except Exception as e:
+                failures += 1
+                print(f"Company fixture {entry['file']} failed: {e}")
+    # Listing harvesters scroll and wait like on the live site, so one pass is enough
+    for entry in corpus.entries("listing"):
+        try:
+            started = time.perf_counter()
+            links = await adapter.harvest_listing(page, entry["url"])
+            if links is not None:
+                timings["listing"].append(milliseconds(started))
+        except Exception as e:
+            failures += 1
+            print(f"Listing fixture {entry['file']} failed: {e}")
+    await context.close()
+    return {
+        "pages": {kind: len(corpus.entries(kind)) for kind in ("listing", "job", "company")},
+        "failures": failures,
+        "ms": {metric: median(values) for metric, values in timings.items()},
+        "fields": {
+            name: {"ms": median(values), "hit_rate": round(sum(field_hits.get(name, [])) / max(len(field_hits.get(name, [])), 1), 2)}
+            for name, values in field_timings.items()
+        },
+    }
+
+
+def compare(metric, current, baseline):
+    if current is None or baseline is None or baseline == 0:
+        return ""
+    change = current / baseline - 1
+    if change > BENCHMARK_TOLERANCE:
+        return f"  REGRESSION {change:+.0%} vs {baseline} ms"
+    if change < -BENCHMARK_TOLERANCE:
+        return f"  faster {change:+.0%} vs {baseline} ms"
+    return f"  {change:+.0%}"
+
+
+def print_results(results, baseline):
+    regressions = 0
+    for name, result in results.items():
+        portal_baseline = baseline.get(name, {})
+        print(f"\n--- {name}: {result['pages']['job']} job, {result['pages']['company']} company, "
+              f"{result['pages']['listing']} listing pages, {result['failures']} failures ---")
+        for metric, value in result["ms"].items():
+            note = compare(metric, value, portal_baseline.get("ms", {}).get(metric))
+            regressions += "REGRESSION" in note
+            print(f"{metric:>14}: {value} ms{note}")
+        print("Per field (median ms, share of pages where the selector matched):")
+        for field, timing in result["fields"].items():
+            note = compare(field, timing["ms"], portal_baseline.get("fields", {}).get(field, {}).get("ms"))
+            regressions += "REGRESSION" in note
+            print(f"{field:>22}: {timing['ms']} ms, {timing['hit_rate']:.0%} matched{note}")
+    print(f"\n{regressions} timings more than {BENCHMARK_TOLERANCE:.0%} slower than the baseline")
+    return regressions
+
+
+async def run_benchmark(names=None, rounds=BENCHMARK_ROUNDS):
+    if names is None:
+        names = sorted(name for name in os.listdir(FIXTURE_DIR) if name in CAMPAIGN_SITES)
+    baseline = {}
+    if os.path.exists(BENCHMARK_BASELINE_PATH):
+        with open(BENCHMARK_BASELINE_PATH, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+    results = {}
+    async with async_playwright() as pw:
+        browser = await pw.chromium.launch(headless=True)
+        for name in names:
+            corpus = FixtureCorpus(name)
+            if not corpus.entries():
+                print(f"No fixtures for {name}, capture some first")
+                continue
+            print(f"Benchmarking {name} ({rounds} rounds)")
+            results[name] = await benchmark_portal(browser, corpus, rounds)
+        await browser.close()
+    print_results(results, baseline)
+    os.makedirs(os.path.dirname(BENCHMARK_RESULTS_PATH), exist_ok=True)
+    with open(BENCHMARK_RESULTS_PATH, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=1)
+    print(f"Results saved to: {BENCHMARK_RESULTS_PATH}")
+    return results, baseline
+
+
+def save_baseline(results, baseline):
+    baseline.update(results)
+    with open(BENCHMARK_BASELINE_PATH, "w", encoding="utf-8") as f:
+        json.dump(baseline, f, indent=1)
+    print(f"Baseline saved to: {BENCHMARK_BASELINE_PATH}")
+
+
+if __name__ == "__main__":
+    print("| = | = | = | Parser Benchmark | = | = | = |")
+    print(f"Available portals: {', '.join(CAMPAIGN_SITES)}")
+    mode = input("Capture fixtures or run the benchmark? (C/B): ").lower().strip()
+    if mode == "c":
+        site = input("Portal: ").strip()
+        keyword = input("Keyword (e.g., data analyst): ").strip()
+        jobs = int(input(f"Job pages to capture (default {FIXTURES_PER_KIND}): ") or str(FIXTURES_PER_KIND))
+        log_file = setup_logging(f"fixtures_{site}")
+        asyncio.run(capture_fixtures(site, keyword, jobs))
+    else:
+        site_input = input("Portals, comma separated (blank for every captured portal): ").strip()
+        names = [site.strip() for site in site_input.split(",") if site.strip()] or None
+        rounds = int(input(f"Rounds (default {BENCHMARK_ROUNDS}): ") or str(BENCHMARK_ROUNDS))
+        results, baseline = asyncio.run(run_benchmark(names, rounds))
+        if input("Save these timings as the new baseline? (Y/N): ").lower().strip() == "y":
+            save_baseline(results, baseline)
@@ -0,0 +1,11 @@
+# A Work Queue Worker -- joins a distributed crawl from any process that can open the run's work queue
+import asyncio
+import os
+from crawl_engine import run_queue_worker, setup_logging
+
+if __name__ == "__main__":
+    print("| = | = | = | Work Queue Worker | = | = | = |")
+    print("Note: The queue name is the run name, e.g. vietnamworks_vn_data-analyst or jobstreet_ph_data-analyst")
+    queue_name = input("Queue name: ").strip()
+    log_file = setup_logging(f"{queue_name}_worker_{os.getpid()}")
+    asyncio.run(run_queue_worker(queue_name))
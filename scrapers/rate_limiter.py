@@ -0,0 +1,106 @@
+# A Per-Host Token-Bucket Rate Limiter shared by every scraper running in the process
+from urllib.parse import urlparse
+from request_blocker import host_matches
+import asyncio
+import threading
+import time
+
+# Requests per second and burst size per domain, kept just under each site's throttling threshold
+HOST_RATE_LIMITS = {
+    "vietnamworks.com": (5.0, 10),
+    "careerviet.vn": (5.0, 10),
+    "jobnet.com.mm": (2.0, 4),
+    "jobnet.com.kh": (2.0, 4),
+    "jobstreet.com": (3.0, 6),
+    "jobsdb.com": (3.0, 6),
+}
+DEFAULT_RATE_LIMIT = (5.0, 10)
+
+# Browser requests that count against a host's rate, sub-resources are not limited
+RATE_LIMITED_RESOURCE_TYPES = {"document"}
+
+
+class TokenBucket:
+    """Reservation-based bucket, safe to share between threads that each run their own event loop"""
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def reserve(self):
+        # Take a token now, possibly going into debt, and return how long to wait for it
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+
+class HostRateLimiter:
+    """One token bucket per configured domain, every navigation and HTTP fetch waits on its host's bucket"""
+
+    def __init__(self, limits=None, default=DEFAULT_RATE_LIMIT):
+        self.limits = HOST_RATE_LIMITS if limits is None else limits
+        self.default = default
+        self.buckets = {}
+        self.stats = {}
+        self.lock = threading.Lock()
+
+    def domain_for(self, host):
+        for domain in self.limits:
+            if host_matches(host, [domain]):
+                return domain
+        return host
+
+    def bucket_for(self, domain):
+        with self.lock:
+            if domain not in self.buckets:
+                self.buckets[domain] = TokenBucket(*self.limits.get(domain, self.default))
+                self.stats[domain] = {"requests": 0, "delayed": 0, "wait_seconds": 0.0}
+            return self.buckets[domain], self.stats[domain]
+
+    def share(self, parts):
+        # Split every host's rate between `parts` processes that crawl the same hosts
+        self.limits = {domain: (rate / parts, max(1, burst // parts)) for domain, (rate, burst) in self.limits.items()}
+        self.default = (self.default[0] / parts, max(1, self.default[1] // parts))
+        with self.lock:
+            self.buckets = {}
+            self.stats = {}
+
+    async def wait(self, url):
+        domain = self.domain_for(urlparse(url).hostname or "")
+        bucket, stats = self.bucket_for(domain)
+        delay = bucket.reserve()
+        with self.lock:
+            stats["requests"] += 1
+            if delay > 0:
+                stats["delayed"] += 1
+                stats["wait_seconds"] += delay
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+    async def install(self, context):
+        # Registered after the request blocker, so it runs first and then falls back to it
+        await context.route("**/*", self.handle_route)
+
+    async def handle_route(self, route):
+        request = route.request
+        if request.resource_type in RATE_LIMITED_RESOURCE_TYPES:
+            await self.wait(request.url)
+        await route.fallback()
+
+    def print_stats(self):
+        with self.lock:
+            for domain, stats in self.stats.items():
+                rate, burst = self.limits.get(domain, self.default)
+                print(f"Rate limit ({domain}, {rate:g}/s burst {burst}): {stats['requests']} requests, "
+                      f"{stats['delayed']} delayed, {stats['wait_seconds']:.1f}s spent waiting")
+
+
+# Shared by every scraper imported into the same process, e.g. several scrapers started from the GUI
+RATE_LIMITER = HostRateLimiter()
@@ -0,0 +1,99 @@
+# A Record Journal -- scraped jobs appended to a JSONL file as they complete, so a crash loses at most one flush
+from pandas import NA
+import pandas as pd
+import json
+import os
+
+JOURNAL_FLUSH_EVERY = 50  # Records buffered before they are written and synced to disk
+CSV_CHUNK_SIZE = 1000  # Records held in memory while the CSV is built from the journal
+
+
+def to_json_value(value):
+    if isinstance(value, list):
+        return value
+    return None if pd.isna(value) else value
+
+
+def read_entries(path):
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                yield json.loads(line)
+            except ValueError:
+                # A crash mid-write can leave the last line truncated
+                continue
+
+
+class RecordJournal:
+    """Append-only JSONL journal of {"job_link", "round", "record"} entries"""
+
+    def __init__(self, path, resume=False, flush_every=JOURNAL_FLUSH_EVERY):
+        self.path = path
+        self.flush_every = flush_every
+        self.buffer = []
+        self.links = set()
+        self.count = 0
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        if resume and os.path.exists(path):
+            for entry in self.entries():
+                self.links.add(entry["job_link"])
+                self.count += 1
+            print(f"Resuming from {path}: {self.count} records already journaled")
+        else:
+            open(path, "w", encoding="utf-8").close()
+
+    def append(self, job_link, record, round_number=0):
+        record = {key: to_json_value(value) for key, value in record.items()}
+        self.buffer.append({"job_link": job_link, "round": round_number, "record": record})
+        self.links.add(job_link)
+        self.count += 1
+        if len(self.buffer) >= self.flush_every:
+            self.flush()
+
+    def flush(self):
+        if not self.buffer:
+            return
+        with open(self.path, "a", encoding="utf-8") as f:
+            for entry in self.buffer:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        self.buffer = []
+
+    def entries(self):
+        return read_entries(self.path)
+
+    def pending_links(self, job_links):
+        remaining = [link for link in job_links if link not in self.links]
+        if len(remaining) < len(job_links):
+            print(f"Skipping {len(job_links) - len(remaining)} links already in the journal")
+        return remaining
+
+    def to_csv(self, filename, round_number=None):
+        """Write the journaled records (optionally one round only) to CSV in chunks, returning the record count"""
+        self.flush()
+        written = 0
+        chunk = []
+        for entry in self.entries():
+            if round_number is not None and entry["round"] != round_number:
+                continue
+            chunk.append({key: NA if value is None else value for key, value in entry["record"].items()})
+            if len(chunk) >= CSV_CHUNK_SIZE:
+                self.write_csv_chunk(filename, chunk, header=written == 0)
+                written += len(chunk)
+                chunk = []
+        if chunk:
+            self.write_csv_chunk(filename, chunk, header=written == 0)
+            written += len(chunk)
+        return written
+
+    def write_csv_chunk(self, filename, chunk, header):
+        pd.DataFrame(chunk).to_csv(
+            filename,
+            mode="w" if header else "a",
+            header=header,
+            index=False,
+            quotechar='"',
+            escapechar='\\',
+            encoding='utf-8-sig' if header else 'utf-8'
+        )
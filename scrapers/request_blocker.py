@@ -0,0 +1,92 @@
+# A Request Interception Profile that aborts images, fonts, media and third-party trackers
+from collections import Counter
+from urllib.parse import urlparse
+
+BLOCKED_RESOURCE_TYPES = {"image", "font", "media"}
+
+TRACKER_HOSTS = [
+    "google-analytics.com",
+    "googletagmanager.com",
+    "googlesyndication.com",
+    "googleadservices.com",
+    "doubleclick.net",
+    "adservice.google.com",
+    "facebook.net",
+    "connect.facebook.com",
+    "hotjar.com",
+    "clarity.ms",
+    "analytics.tiktok.com",
+    "criteo.com",
+    "criteo.net",
+    "scorecardresearch.com",
+    "nr-data.net",
+    "segment.io",
+    "mixpanel.com",
+]
+
+# Resource types or host names that must still load for a site, e.g. {"jobnet": ["image"]}
+REQUEST_BLOCKING_ALLOWLIST = {
+    "vietnamworks": [],
+    "careerviet": [],
+    "jobnet": [],
+    "jobstreet": [],
+    "jobsdb": [],
+}
+
+# Rough transfer size of an aborted request, used to estimate the bandwidth saved
+ESTIMATED_RESOURCE_BYTES = {
+    "image": 30_000,
+    "font": 40_000,
+    "media": 400_000,
+    "script": 50_000,
+}
+DEFAULT_ESTIMATED_BYTES = 5_000
+
+
+def host_matches(host, patterns):
+    return any(host == pattern or host.endswith(f".{pattern}") for pattern in patterns)
+
+
+class RequestBlocker:
+    """Per-site route interception installed on a browser context"""
+
+    def __init__(self, site, allowlist=None):
+        self.site = site
+        self.allowlist = REQUEST_BLOCKING_ALLOWLIST.get(site, []) if allowlist is None else allowlist
+        self.blocked_types = BLOCKED_RESOURCE_TYPES - set(self.allowlist)
+        self.blocked_counts = Counter()
+        self.allowed_count = 0
+
+    async def install(self, context):
+        await context.route("**/*", self.handle_route)
+
+    def should_block(self, resource_type, url):
+        host = urlparse(url).hostname or ""
+        if host_matches(host, self.allowlist):
+            return False
+        if resource_type in self.blocked_types:
+            return True
+        return host_matches(host, TRACKER_HOSTS)
+
+    async def handle_route(self, route):
+        request = route.request
+        if self.should_block(request.resource_type, request.url):
+            self.blocked_counts[request.resource_type] += 1
+            await route.abort("blockedbyclient")
+        else:
+            self.allowed_count += 1
+            await route.continue_()
+
+    def estimated_bytes_saved(self):
+        return sum(
+            count * ESTIMATED_RESOURCE_BYTES.get(resource_type, DEFAULT_ESTIMATED_BYTES)
+            for resource_type, count in self.blocked_counts.items()
+        )
+
+    def print_stats(self):
+        blocked_total = sum(self.blocked_counts.values())
+        breakdown = ", ".join(f"{resource_type}: {count}" for resource_type, count in self.blocked_counts.most_common())
+        print(f"Request blocking ({self.site}): {blocked_total} blocked, {self.allowed_count} allowed")
+        if breakdown:
+            print(f"Blocked by type: {breakdown}")
+        print(f"Estimated bandwidth saved: {self.estimated_bytes_saved() / 1_000_000:.1f} MB")
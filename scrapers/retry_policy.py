@@ -0,0 +1,43 @@
+# Per-Link Retry with Jittered Exponential Backoff, run inside the same worker pool and browser session
+import asyncio
+import random
+
+LINK_MAX_RETRIES = 2  # Retries after the first attempt, per link
+RETRY_BASE_DELAY = 2.0  # Seconds, doubled on every retry
+RETRY_MAX_DELAY = 60.0
+
+
+class RetryPolicy:
+    """Attempt budget and backoff shared by every link of a run"""
+
+    def __init__(self, max_retries=LINK_MAX_RETRIES, base_delay=RETRY_BASE_DELAY, max_delay=RETRY_MAX_DELAY):
+        self.max_attempts = max_retries + 1
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.stats = {"retries": 0, "recovered": 0, "exhausted": 0}
+
+    def backoff_delay(self, attempt):
+        # Full jitter spreads the retries of links that failed together
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+    async def run(self, link, attempt_once):
+        """Call attempt_once() until it returns a result, or None once the budget is spent"""
+        for attempt in range(1, self.max_attempts + 1):
+            result = await attempt_once()
+            if result is not None:
+                if attempt > 1:
+                    self.stats["recovered"] += 1
+                return result
+            if attempt < self.max_attempts:
+                delay = self.backoff_delay(attempt)
+                self.stats["retries"] += 1
+                print(f"Retrying {link} in {delay:.1f}s (attempt {attempt + 1} of {self.max_attempts})")
+                # The worker slot is free while waiting, other links keep running
+                await asyncio.sleep(delay)
+        self.stats["exhausted"] += 1
+        return None
+
+    def print_stats(self):
+        stats = self.stats
+        print(f"Retries: {stats['retries']} retried attempts, {stats['recovered']} links recovered, "
+              f"{stats['exhausted']} links failed after {self.max_attempts} attempts")
@@ -0,0 +1,359 @@
+# A Salary Parser Benchmark -- the shared salary parser against the per-row code it replaced, on synthetic columns
+import collections
+import random
+import re
+import time
+import pandas as pd
+from pandas import NA
+from salary_parser import SALARY_COLUMNS, UNDISCLOSED_SALARIES, parse_salary_column, parse_salary_text
+from vietnamworks_scraper_new import CURRENCY_VALUES, SALARY_RULES as VIETNAMWORKS_SALARY_RULES
+from job_street_scraper import CURRENCY_COUNTRY_DICTIONARY, CURRENCY_DICTIONARY, SALARY_RULES as JOB_STREET_SALARY_RULES
+
+BENCHMARK_ROWS = 1_000_000
+# Salary texts as each portal shows them, filled with random amounts
+SALARY_TEMPLATES = {
+    "vietnamworks_vn": [
+        "{low},000 - {high},000 USD/month",
+        "{low} - {high} million VND per month",
+        "Up to {high}m ₫",
+        "Starting from ${low},500",
+        "{low}k - {high}k / year",
+        "Negotiable",
+        "Competitive",
+        "{low},000,000 đ a month",
+        "From {low} to {high} thousand USD monthly",
+        None,
+    ],
+    # Periods separate thousands on the Indonesian portal
+    "jobstreet_id": [
+        "Rp {low}.000.000 – Rp {high}.000.000 per month",
+        "IDR {low}.500.000 - {high}.000.000 monthly",
+        "Up to Rp {high}.000.000",
+        "Starting from Rp {low}.000.000 per month",
+        "Rp {low}00.000 per day",
+        "Rp {low}.000.000 – Rp {high}.000.000 per month + Rp {bonus}00.000 bonus",
+        "Negotiable",
+        "Competitive",
+        "Up to attractive package",
+        None,
+    ],
+    "jobstreet_sg": [
+        "$ {low},000 – $ {high},000 per month",
+        "S$ {low},500 per month",
+        "SGD {low}k - {high}k a year",
+        "{low},000 - {high},000 per month",
+        "MYR {low},000 per month",
+        "$ {low}0 per day",
+        "Competitive",
+        None,
+    ],
+}
+
+
+def per_row_parse_salary_text(salary_text, currency_values):
+    """The per-row salary parser the scrapers used before salary_parser, kept as the benchmark reference"""
+    if pd.isna(salary_text):
+        return NA, NA, NA, NA, NA
+    salary_text = salary_text.strip().lower()
+    if salary_text != "negotiable" and salary_text != "competitive":
+        salary_source = "direct_data"
+        numbers = re.findall(
+            r"\d+(?:,\d+)*(?:\.\d+)?\s*(?:million|mil|m|k|thousand|thousands)?\b",
+            salary_text,
+            re.IGNORECASE
+        )
+        parsed_numbers = []
+        for n in numbers:
+            n = n.replace(",","").strip()
+            if re.search(r"(million|mil|m)\b", n):
+                num_part = re.sub(r"(million|mil|m)\b", "", n).strip()
+                parsed_numbers.append(int(float(num_part) * 1_000_000))
+            elif re.search(r"(k|thousand|thousands)\b", n):
+                num_part = re.sub(r"(k|thousand|thousands)\b", "", n).strip()
+                parsed_numbers.append(int(float(num_part) * 1_000))
+            else:
+                parsed_numbers.append(int(float(n)))
+        if len(parsed_numbers) > 1:
+            min_amount = min(parsed_numbers)
+            max_amount = max(parsed_numbers)
+        elif "up to" in salary_text:
+            min_amount = 0
+            max_amount = parsed_numbers[0]
+        elif "starting from" in salary_text:
+            min_amount = parsed_numbers[0]
+            max_amount = 0
+        elif len(parsed_numbers) == 1:
+            min_amount = parsed_numbers[0]
+            max_amount = parsed_numbers[0]
+        else:
+            min_amount = NA
+            max_amount = NA
+        currency = NA
+        for c in currency_values:
+            if c.lower() in salary_text:
+                currency = currency_values[c]
+                break
+        if "year" in salary_text:
+            interval = "yearly"
+        elif "month" in salary_text:
+            interval = "monthly"
+        elif "week" in salary_text:
+            interval = "weekly"
+        elif "day" in salary_text:
+            interval = "daily"
+        elif "hour" in salary_text:
+            interval = "hourly"
+        else:
+            interval = NA
+        return salary_source, interval, min_amount, max_amount, currency
+    else:
+        return NA, NA, NA, NA, NA
+
+
+def per_row_parse_job_street_salary_text(salary_text, currency_values, currency_dictionary, portal):
+    """The JobStreet salary parser before salary_parser, verbatim but for its per-number debug prints"""
+    # Checks if the salary is present on the page
+    if not pd.isna(salary_text):
+        salary_text = salary_text.lower()
+        salary_source = "direct_data"
+
+        # Select the salary value
+        if portal == "id":
+            # Designed for Indoensian Portal where the salary separator is a period or a comma -- does not consider decimal
+            numbers = re.findall(
+                r"(?:\d{1,3}(?:[.,]\d{3})*|\d+)\s*(?:million|mil|m|k|thousand|thousands)?\b",
+                salary_text,
+                re.IGNORECASE
+            )
+
+            # Parse the numbers (conversion & formatting)
+            parsed_numbers = []
+            for n in numbers:
+                n = n.replace(",","").replace(".","").strip()
+
+                if re.search(r"(million|mil|m)\b", n):
+                    num_part = re.sub(r"(million|mil|m)\b", "", n).strip()
+                    parsed_numbers.append(int(float(num_part) * 1_000_000))
+                elif re.search(r"(k|thousand|thousands)\b", n):
+                    num_part = re.sub(r"(k|thousand|thousands)\b", "", n).strip()
+                    parsed_numbers.append(int(float(num_part) * 1_000))
+                else:
+                    parsed_numbers.append(int(float(n)))
+
+        else:
+            # Designed for Others Portals where the salary separator is a comma -- considers decimal (if present)
+            numbers = re.findall(
+                r"\d+(?:,\d+)*(?:\.\d+)?\s*(?:million|mil|m|k|thousand|thousands)?\b",
+                salary_text,
+                re.IGNORECASE
+            )
+
+            # Parse the numbers (conversion & formatting)
+            parsed_numbers = []
+            for n in numbers:
+                n = n.replace(",","").strip()
+
+                if re.search(r"(million|mil|m)\b", n):
+                    num_part = re.sub(r"(million|mil|m)\b", "", n).strip()
+                    parsed_numbers.append(int(float(num_part) * 1_000_000))
+                elif re.search(r"(k|thousand|thousands)\b", n):
+                    num_part = re.sub(r"(k|thousand|thousands)\b", "", n).strip()
+                    parsed_numbers.append(int(float(num_part) * 1_000))
+                else:
+                    parsed_numbers.append(int(float(n)))
+
+        # Assigning min and max sallary:
+        if len(parsed_numbers) > 1:
+            min_amount = parsed_numbers[0] if parsed_numbers[0] < parsed_numbers[1] else parsed_numbers[1]
+            max_amount = parsed_numbers[0] if parsed_numbers[0] > parsed_numbers[1] else parsed_numbers[1]
+        elif "up to" in salary_text:
+            min_amount = 0
+            max_amount = parsed_numbers[0]
+        elif "starting from" in salary_text:
+            min_amount = parsed_numbers[0]
+            max_amount = 0
+        elif len(parsed_numbers) == 1:
+            min_amount = parsed_numbers[0]
+            max_amount = parsed_numbers[0]
+        else:
+            min_amount = NA
+            max_amount = NA
+
+        # Setting the currency
+        for c in currency_values:
+            if re.search(c.lower(), salary_text):
+                currency = currency_values[0]
+                break
+
+        # Fallback if the currency of the country portal is not found
+        if "currency" not in locals():
+            for c in currency_dictionary:
+                if c.lower() in salary_text:
+                    currency = currency_dictionary[c]
+                    break
+
+        # Last Falback for currency
+        if "currency" not in locals():
+            currency = NA
+
+        # Determining salary interval
+        if re.search("year", salary_text):
+            interval = "yearly"
+        elif re.search("month", salary_text):
+            interval = "monthly"
+        elif re.search("week", salary_text):
+            interval = "weekly"
+        elif re.search("hour", salary_text):
+            interval = "hourly"
+        else:
+            interval = NA
+    else:
+        return NA, NA, NA, NA, NA
+
+    return salary_source, interval, min_amount, max_amount, currency
+
+
+def job_street_case(portal):
+    tokens = CURRENCY_COUNTRY_DICTIONARY[portal]
+    return {
+        "before": lambda text: per_row_parse_job_street_salary_text(text, tokens, CURRENCY_DICTIONARY, portal),
+        "rules": JOB_STREET_SALARY_RULES[portal],
+        "tokens": tokens,
+    }
+
+
+# Per portal: the per-row parser it used before, its shared rules and its own currency tokens
+BENCHMARK_CASES = {
+    "vietnamworks_vn": {
+        "before": lambda text: per_row_parse_salary_text(text, CURRENCY_VALUES),
+        "rules": VIETNAMWORKS_SALARY_RULES,
+        "tokens": None,
+    },
+    "jobstreet_id": job_street_case("id"),
+    "jobstreet_sg": job_street_case("sg"),
+}
+
+
+def intended_difference(case, salary_text, column, before, after):
+    """
+    The behaviour change of the shared parser that explains one differing value, None when none does
+
+    VietnamWorks kept its rules and has none. The JobStreet ones are the
+    changes listed when salary_parser replaced the per-portal copies.
+    """
+    if case["tokens"] is None:
+        return None
+    text = salary_text.strip().lower()
+    if text in UNDISCLOSED_SALARIES:
+        return "Negotiable/Competitive read as undisclosed"
+    if isinstance(before, str) and before.startswith("error"):
+        if "up to" in text and not re.search(r"\d", text):
+            return '"up to" without an amount no longer raises'
+        return None
+    if column == "interval" and pd.isna(before) and after == "daily":
+        return "daily interval recognised"
+    if column in ["min_amount", "max_amount"] and len(case["rules"].number_pattern.findall(text)) > 2:
+        return "min/max over all numbers"
+    if column == "currency" and "$" in case["tokens"] and "$" not in text and before == case["tokens"][0]:
+        return '"$" matched as a substring, not an end-of-text anchor'
+    return None
+
+
+def salary_column(rows, templates, seed=0):
+    generator = random.Random(seed)
+    texts = []
+    for _ in range(rows):
+        template = generator.choice(templates)
+        low = generator.randint(1, 50)
+        texts.append(template if template is None else template.format(
+            low=low, high=low + generator.randint(1, 50), bonus=generator.randint(1, 9)))
+    return pd.Series(texts, dtype=object)
+
+
+def per_row_columns(texts, parse):
+    parsed = []
+    for text in texts:
+        try:
+            parsed.append(parse(text))
+        except Exception as e:
+            # The old JobStreet parser raised on some texts, the row records the error instead
+            parsed.append((f"error: {type(e).__name__}", NA, NA, NA, NA))
+    return pd.DataFrame(parsed, columns=SALARY_COLUMNS)
+
+
+def timed(label, rows, parse):
+    started = time.perf_counter()
+    parsed = parse()
+    seconds = time.perf_counter() - started
+    print(f"{label:>28}: {seconds:8.2f}s ({rows / seconds:,.0f} rows/s)")
+    return parsed, seconds
+
+
+def same_values(first, second):
+    return (first.isna() & second.isna()) | (first.astype(object) == second.astype(object)).fillna(False)
+
+
+def same_value(first, second):
+    if pd.isna(first) or pd.isna(second):
+        return pd.isna(first) and pd.isna(second)
+    return first == second
+
+
+def explain_differences(case, texts, before, after):
+    """Rows the shared parser reads differently, counted by the intended change behind them or as unexplained"""
+    reasons = collections.Counter()
+    unexplained = []
+    differing = pd.Series(False, index=texts.index)
+    for column in SALARY_COLUMNS:
+        differing |= ~same_values(before[column], after[column])
+    for row in texts.index[differing]:
+        row_reasons = set()
+        for column in SALARY_COLUMNS:
+            before_value, after_value = before.at[row, column], after.at[row, column]
+            if same_value(before_value, after_value):
+                continue
+            reason = intended_difference(case, texts[row], column, before_value, after_value)
+            if reason is None:
+                unexplained.append((texts[row], column, before_value, after_value))
+            else:
+                row_reasons.add(reason)
+        reasons.update(row_reasons)
+    return int(differing.sum()), reasons, unexplained
+
+
+def run_case(name, rows):
+    case = BENCHMARK_CASES[name]
+    texts = salary_column(rows, SALARY_TEMPLATES[name])
+    rules = case["rules"]
+    print(f"\n{name}: parsing {rows:,} salary texts")
+    per_row, per_row_seconds = timed("per-row code (before)", rows, lambda: per_row_columns(texts, case["before"]))
+    scalar, scalar_seconds = timed("parse_salary_text per row", rows, lambda: pd.DataFrame(
+        [parse_salary_text(text, rules) for text in texts], columns=SALARY_COLUMNS))
+    vectorized, vectorized_seconds = timed("parse_salary_column", rows, lambda: parse_salary_column(texts, rules))
+    print(f"Speed-up over the per-row code: {per_row_seconds / scalar_seconds:.1f}x per row, "
+          f"{per_row_seconds / vectorized_seconds:.1f}x vectorized")
+    for column in SALARY_COLUMNS:
+        scalar_differences = (~same_values(scalar[column], vectorized[column])).sum()
+        print(f"{column:>14}: {scalar_differences} rows differ between the scalar and vectorized parser")
+    vectorized = vectorized.reset_index(drop=True)
+    differing_rows, reasons, unexplained = explain_differences(case, texts, per_row, vectorized)
+    print(f"{differing_rows} rows differ from the per-row code")
+    for reason, count in reasons.most_common():
+        print(f"  {count:>8} rows: {reason}")
+    if unexplained:
+        print(f"  {len(unexplained)} values differ for no intended reason, e.g. {unexplained[0]}")
+    elif differing_rows:
+        print("  every difference is an intended behaviour change")
+    return unexplained
+
+
+def run_benchmark(rows=BENCHMARK_ROWS):
+    unexplained = {name: run_case(name, rows) for name in BENCHMARK_CASES}
+    regressions = [name for name, values in unexplained.items() if values]
+    print(f"\nUnexplained differences in: {', '.join(regressions)}" if regressions else "\nNo unexplained differences")
+
+
+if __name__ == "__main__":
+    print("| = | = | = | Salary Parser Benchmark | = | = | = |")
+    rows = int(input(f"Rows to parse per portal (default {BENCHMARK_ROWS}): ") or str(BENCHMARK_ROWS))
+    run_benchmark(rows)
@@ -0,0 +1,69 @@
+# A Salary Parser -- one precompiled salary-text parser for every portal, per job or over a whole column at once
+import re
+import pandas as pd
+from pandas import NA
+
+# Number formats of the portals' salary texts, each followed by an optional unit
+NUMBER_FORMATS = {
+    "comma": r"(\d+(?:,\d+)*(?:\.\d+)?)",  # Comma thousands separator and optional decimals, e.g. "4,500.50" or "4.5m"
+    "dotted": r"(\d{1,3}(?:[.,]\d{3})*|\d+)",  # Period or comma thousands separator and no decimals, e.g. "Rp 5.000.000"
+}
+NUMBER_SEPARATORS = {"comma": ",", "dotted": ",."}  # Characters dropped from a number before it is converted
+UNIT_PATTERN = r"\s*(million|mil|m|k|thousand|thousands)?\b"
+UNIT_MULTIPLIERS = {"million": 1_000_000, "mil": 1_000_000, "m": 1_000_000, "k": 1_000, "thousand": 1_000, "thousands": 1_000}
+UNDISCLOSED_SALARIES = ["negotiable", "competitive"]
+# Pay interval named by the first of these words found in the text
+SALARY_INTERVALS = [("year", "yearly"), ("month", "monthly"), ("week", "weekly"), ("day", "daily"), ("hour", "hourly")]
+SALARY_COLUMNS = ["salary_source", "interval", "min_amount", "max_amount", "currency"]
+
+
+def portal_currencies(portal_tokens, currency_dictionary):
+    """Currency tokens of a portal's own currency first, then every other known currency as a fallback"""
+    return [(token, portal_tokens[0]) for token in portal_tokens] + list(currency_dictionary.items())
+
+
+class SalaryRules:
+    """Number format and currency tokens of one portal, with the number pattern compiled once"""
+
+    def __init__(self, currencies, number_format="comma"):
+        self.currencies = [(token.lower(), code) for token, code in currencies]  # Checked in order, first found wins
+        self.number_format = number_format
+        self.number_pattern = re.compile(NUMBER_FORMATS[number_format] + UNIT_PATTERN, re.IGNORECASE)
+        self.separators = str.maketrans("", "", NUMBER_SEPARATORS[number_format])
+
+
+def parse_salary_text(salary_text, rules):
+    """(salary_source, interval, min_amount, max_amount, currency) of one salary text"""
+    if pd.isna(salary_text):
+        return NA, NA, NA, NA, NA
+    salary_text = salary_text.strip().lower()
+    if salary_text in UNDISCLOSED_SALARIES:
+        return NA, NA, NA, NA, NA
+    amounts = [
+        int(float(number.translate(rules.separators)) * UNIT_MULTIPLIERS.get(unit.lower(), 1))
+        for number, unit in rules.number_pattern.findall(salary_text)
+    ]
+    if len(amounts) > 1:
+        min_amount, max_amount = min(amounts), max(amounts)
+    elif not amounts:
+        min_amount, max_amount = NA, NA
+    elif "up to" in salary_text:
+        min_amount, max_amount = 0, amounts[0]
+    elif "starting from" in salary_text:
+        min_amount, max_amount = amounts[0], 0
+    else:
+        min_amount, max_amount = amounts[0], amounts[0]
+    currency = next((code for token, code in rules.currencies if token in salary_text), NA)
+    interval = next((name for word, name in SALARY_INTERVALS if word in salary_text), NA)
+    return "direct_data", interval, min_amount, max_amount, currency
+
+
+def parse_salary_column(salary_texts, rules):
+    """The salary columns of a whole Series of salary texts, each distinct text parsed once and broadcast to its rows"""
+    codes, distinct_texts = pd.factorize(salary_texts)
+    parsed = [parse_salary_text(salary_text, rules) for salary_text in distinct_texts]
+    parsed.append((NA, NA, NA, NA, NA))  # Missing texts have code -1, the last row
+    table = pd.DataFrame(parsed, columns=SALARY_COLUMNS).astype({"min_amount": "Int64", "max_amount": "Int64"})
+    columns = table.iloc[codes]
+    columns.index = salary_texts.index
+    return columns
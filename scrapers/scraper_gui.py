@@ -15,10 +15,9 @@ from datetime import datetime
 # Import the scrapers
 try:
     from job_street_scraper import web_scraper as jobstreet_scraper
-    from job_street_scraper_new import web_scraper as jobstreet_new_scraper
-    from jobnet_scraper import web_scraper as jobnet_scraper
-    from vietnamworks_scraper import web_scraper as vietnamworks_scraper
-    from careerviet_scraper import web_scraper as careerviet_scraper
+    from jobnet_scraper_new import web_scraper as jobnet_scraper
+    from vietnamworks_scraper_new import web_scraper as vietnamworks_scraper
+    from careerviet_scraper_new import web_scraper as careerviet_scraper
 except ImportError as e:
     print(f"Error importing scrapers: {e}")
     print("Make sure all scraper files are in the same directory as this interface.")
@@ -55,9 +54,8 @@ class ScraperGUI:
             tk.W, tk.E, tk.N, tk.S), pady=(0, 10))
         main_frame.rowconfigure(1, weight=1)
 
-        # Create tabs for each scraper
+        # Create tabs for each scraper, all of them run on the shared crawl engine
         self.create_jobstreet_tab()
-        self.create_jobstreet_new_tab()
         self.create_jobnet_tab()
         self.create_vietnamworks_tab()
         self.create_careerviet_tab()
@@ -109,54 +107,9 @@ class ScraperGUI:
         self.root.update()
 
     def create_jobstreet_tab(self):
-        """Create JobStreet scraper tab (original)"""
+        """Create JobStreet scraper tab"""
         frame = ttk.Frame(self.notebook, padding="10")
-        self.notebook.add(frame, text="JobStreet (Original)")
-
-        # Portal selection
-        ttk.Label(frame, text="Portal:").grid(
-            row=0, column=0, sticky=tk.W, pady=2)
-        self.js_portal_var = tk.StringVar()
-        portal_combo = ttk.Combobox(frame, textvariable=self.js_portal_var,
-                                    values=["id - Indonesia", "my - Malaysia", "sg - Singapore",
-                                            "ph - Philippines", "th - Thailand"],
-                                    state="readonly", width=25)
-        portal_combo.grid(row=0, column=1, sticky=(
-            tk.W, tk.E), padx=(5, 0), pady=2)
-        portal_combo.current(0)
-
-        # Location
-        ttk.Label(frame, text="Location (optional):").grid(
-            row=1, column=0, sticky=tk.W, pady=2)
-        self.js_location_var = tk.StringVar()
-        ttk.Entry(frame, textvariable=self.js_location_var, width=30).grid(
-            row=1, column=1, sticky=(tk.W, tk.E), padx=(5, 0), pady=2)
-
-        # Keyword
-        ttk.Label(frame, text="Job Position:").grid(
-            row=2, column=0, sticky=tk.W, pady=2)
-        self.js_keyword_var = tk.StringVar(value="Data-Analyst")
-        ttk.Entry(frame, textvariable=self.js_keyword_var, width=30).grid(
-            row=2, column=1, sticky=(tk.W, tk.E), padx=(5, 0), pady=2)
-
-        # Max pages
-        ttk.Label(frame, text="Max Pages:").grid(
-            row=3, column=0, sticky=tk.W, pady=2)
-        self.js_pages_var = tk.StringVar(value="5")
-        ttk.Entry(frame, textvariable=self.js_pages_var, width=30).grid(
-            row=3, column=1, sticky=(tk.W, tk.E), padx=(5, 0), pady=2)
-
-        # Run button
-        self.js_run_btn = ttk.Button(frame, text="Run JobStreet Scraper",
-                                     command=self.run_jobstreet)
-        self.js_run_btn.grid(row=4, column=0, columnspan=2, pady=20)
-
-        frame.columnconfigure(1, weight=1)
-
-    def create_jobstreet_new_tab(self):
-        """Create JobStreet NEW scraper tab"""
-        frame = ttk.Frame(self.notebook, padding="10")
-        self.notebook.add(frame, text="JobStreet (Enhanced)")
+        self.notebook.add(frame, text="JobStreet")
 
         # Rescraping option
         self.jsn_rescrape_var = tk.BooleanVar()
@@ -224,8 +177,8 @@ class ScraperGUI:
         self.jsn_normal_frame.columnconfigure(1, weight=1)
 
         # Run button
-        self.jsn_run_btn = ttk.Button(frame, text="Run Enhanced JobStreet Scraper",
-                                      command=self.run_jobstreet_new)
+        self.jsn_run_btn = ttk.Button(frame, text="Run JobStreet Scraper",
+                                      command=self.run_jobstreet)
         self.jsn_run_btn.grid(row=4, column=0, columnspan=2, pady=20)
 
         frame.columnconfigure(1, weight=1)
@@ -320,7 +273,7 @@ class ScraperGUI:
         frame.columnconfigure(1, weight=1)
 
     def toggle_rescrape_mode(self):
-        """Toggle between rescraping and normal mode for JobStreet New"""
+        """Toggle between rescraping and normal mode for JobStreet"""
         if self.jsn_rescrape_var.get():
             self.jsn_file_frame.grid()
             self.jsn_normal_frame.grid_remove()
@@ -341,7 +294,6 @@ class ScraperGUI:
 
     def disable_all_buttons(self):
         """Disable all run buttons"""
-        self.js_run_btn.config(state='disabled')
         self.jsn_run_btn.config(state='disabled')
         self.jn_run_btn.config(state='disabled')
         self.vw_run_btn.config(state='disabled')
@@ -349,7 +301,6 @@ class ScraperGUI:
 
     def enable_all_buttons(self):
         """Enable all run buttons"""
-        self.js_run_btn.config(state='normal')
         self.jsn_run_btn.config(state='normal')
         self.jn_run_btn.config(state='normal')
         self.vw_run_btn.config(state='normal')
@@ -386,40 +337,7 @@ class ScraperGUI:
         thread.start()
 
     def run_jobstreet(self):
-        """Run JobStreet scraper (original)"""
-        if not self.validate_input(self.js_pages_var.get(), "JobStreet"):
-            return
-
-        portal = self.js_portal_var.get().split(" - ")[0]
-        location = self.js_location_var.get().strip()
-        keyword = self.js_keyword_var.get().strip().replace(" ", "-")
-        max_pages = int(self.js_pages_var.get())
-        site = "jobsdb" if portal == "th" else "jobstreet"
-
-        self.disable_all_buttons()
-        self.update_status("Running JobStreet scraper...")
-        self.log_message(
-            f"Starting JobStreet scraper - Portal: {portal}, Keyword: {keyword}, Pages: {max_pages}")
-
-        async def run_scraper():
-            try:
-                await jobstreet_scraper(portal=portal, site=site, location=location,
-                                        keyword=keyword, max_pages=max_pages)
-                self.log_message("JobStreet scraper completed successfully!")
-                messagebox.showinfo(
-                    "Success", "JobStreet scraper completed successfully!\nCheck the 'data' directory for output files.")
-            except Exception as e:
-                error_msg = f"JobStreet scraper failed: {str(e)}"
-                self.log_message(error_msg)
-                messagebox.showerror("Error", error_msg)
-            finally:
-                self.root.after(0, self.enable_all_buttons)
-                self.root.after(0, lambda: self.update_status("Ready"))
-
-        self.run_scraper_async(run_scraper, "JobStreet")
-
-    def run_jobstreet_new(self):
-        """Run JobStreet NEW scraper"""
+        """Run JobStreet scraper"""
         is_rescraping = self.jsn_rescrape_var.get()
 
         if is_rescraping:
@@ -432,23 +350,22 @@ class ScraperGUI:
 
             # Extract parameters from filename
             try:
-                file_parts = link_file_name.replace("_error.csv", "").replace(
-                    "_link_errors.csv", "").split("_")
-                if len(file_parts) >= 4:
+                file_parts = link_file_name.replace("_errors.csv", "").split("_")
+                if len(file_parts) >= 3:
                     site = file_parts[0]
                     portal = file_parts[1]
-                    job_location = file_parts[2]
-                    keyword = file_parts[3]
+                    job_location = ""
+                    keyword = "_".join(file_parts[2:])
                     max_pages = 0
                 else:
                     raise ValueError("Invalid filename format")
             except Exception:
                 messagebox.showerror("Invalid Input",
-                                     "Invalid filename format. Expected format: site_portal_location_keyword_error.csv")
+                                     "Invalid filename format. Expected format: site_portal_keyword_errors.csv")
                 return
         else:
             # Validate normal input
-            if not self.validate_input(self.jsn_pages_var.get(), "JobStreet New"):
+            if not self.validate_input(self.jsn_pages_var.get(), "JobStreet"):
                 return
 
             portal = self.jsn_portal_var.get().split(" - ")[0]
@@ -460,39 +377,39 @@ class ScraperGUI:
 
         self.disable_all_buttons()
         mode_text = "rescraping" if is_rescraping else "scraping"
-        self.update_status(f"Running JobStreet Enhanced {mode_text}...")
+        self.update_status(f"Running JobStreet {mode_text}...")
 
         if is_rescraping:
             self.log_message(
-                f"Starting JobStreet Enhanced rescraping - File: {link_file_name}")
+                f"Starting JobStreet rescraping - File: {link_file_name}")
         else:
             self.log_message(
-                f"Starting JobStreet Enhanced scraping - Portal: {portal}, Keyword: {keyword}, Pages: {max_pages}")
+                f"Starting JobStreet scraping - Portal: {portal}, Keyword: {keyword}, Pages: {max_pages}")
 
         async def run_scraper():
             try:
-                await jobstreet_new_scraper(
+                await jobstreet_scraper(
                     is_rescraping=is_rescraping,
                     link_file_name=link_file_name,
                     portal=portal,
                     site=site,
-                    job_location=job_location,
+                    location=job_location,
                     keyword=keyword,
                     max_pages=max_pages
                 )
                 self.log_message(
-                    "JobStreet Enhanced scraper completed successfully!")
+                    "JobStreet scraper completed successfully!")
                 messagebox.showinfo(
-                    "Success", "JobStreet Enhanced scraper completed successfully!\nCheck the 'data' directory for output files.")
+                    "Success", "JobStreet scraper completed successfully!\nCheck the 'data' directory for output files.")
             except Exception as e:
-                error_msg = f"JobStreet Enhanced scraper failed: {str(e)}"
+                error_msg = f"JobStreet scraper failed: {str(e)}"
                 self.log_message(error_msg)
                 messagebox.showerror("Error", error_msg)
             finally:
                 self.root.after(0, self.enable_all_buttons)
                 self.root.after(0, lambda: self.update_status("Ready"))
 
-        self.run_scraper_async(run_scraper, "JobStreet Enhanced")
+        self.run_scraper_async(run_scraper, "JobStreet")
 
     def run_jobnet(self):
         """Run JobNet scraper"""
@@ -510,7 +427,7 @@ class ScraperGUI:
 
         async def run_scraper():
             try:
-                await jobnet_scraper(portal=portal, keyword=keyword, max_pages=max_pages)
+                await jobnet_scraper(is_rescraping=False, link_file_name="", portal=portal, keyword=keyword, max_pages=max_pages)
                 self.log_message("JobNet scraper completed successfully!")
                 messagebox.showinfo(
                     "Success", "JobNet scraper completed successfully!\nCheck the 'data' directory for output files.")
@@ -539,7 +456,7 @@ class ScraperGUI:
 
         async def run_scraper():
             try:
-                await vietnamworks_scraper(keyword=keyword, max_pages=max_pages)
+                await vietnamworks_scraper(is_rescraping=False, link_file_name="", keyword=keyword, max_pages=max_pages)
                 self.log_message(
                     "VietnamWorks scraper completed successfully!")
                 messagebox.showinfo(
@@ -569,7 +486,7 @@ class ScraperGUI:
 
         async def run_scraper():
             try:
-                await careerviet_scraper(keyword=keyword, max_pages=max_pages)
+                await careerviet_scraper(is_rescraping=False, link_file_name="", keyword=keyword, max_pages=max_pages)
                 self.log_message("CareerViet scraper completed successfully!")
                 messagebox.showinfo(
                     "Success", "CareerViet scraper completed successfully!\nCheck the 'data' directory for output files.")
@@ -1,42 +1,64 @@
-# A VietnamWorks Scraper with Batch Processing and Auto-Retry Logic
-from playwright.async_api import async_playwright
+# A VietnamWorks Scraper -- site adapter for the shared crawl engine
 import asyncio
 import pandas as pd
 from pandas import NA
-from datetime import datetime, timedelta
 import re
-import sys
-import os
-
-# -----------------------------
-# Logging setup for cmd terminal
-class Tee:
-    def __init__(self, *files):
-        self.files = files
-    def write(self, obj):
-        for f in self.files:
-            f.write(obj)
-            f.flush()
-    def flush(self):
-        for f in self.files:
-            f.flush()
-
-def setup_logging(is_rescraping, keyword, retry_attempt=0):
-    os.makedirs("data", exist_ok=True)
-    if is_rescraping:
-        log_file_name = f"terminal_output_vietnamworks_vn_{keyword}_rescraped.txt"
-    elif retry_attempt > 0:
-        log_file_name = f"terminal_output_vietnamworks_vn_{keyword}_retry_{retry_attempt}.txt"
-    else:
-        log_file_name = f"terminal_output_vietnamworks_vn_{keyword}.txt"
-    log_file = open(f"data/{log_file_name}", "w", encoding="utf-8")
-    sys.stdout = sys.stderr = Tee(sys.stdout, log_file)
-    return log_file
+from link_extractor import card_fingerprint, extract_paginated_links, harvest_cards
+from content_expander import expand_content
+from page_capture import capture_page
+from salary_parser import SalaryRules, parse_salary_text
+from dom_extractor import EXTRACTION_MODE, extract_raw_fields, report_differences
+from http_fetcher import extract_raw_fields_from_html, has_required_fields
+from crawl_engine import CrawlEngine, SiteAdapter, setup_logging
 
-# -----------------------------
+CURRENCY_VALUES = {
+    "đ": "VND",
+    "₫": "VND",
+    "VND": "VND",
+    "$": "USD",
+    "USD": "USD"
+}
+SALARY_RULES = SalaryRules(CURRENCY_VALUES.items())
 
-CONCURRENCY_LIMIT = 10
-BATCH_LIMIT = 3000
+# Selectors for every field read from a job page, shared by the bulk and per-field extraction
+JOB_FIELDS = {
+    "title": "h1[name='title']",
+    "location": ("//h2[contains(., 'Job Locations')]/following-sibling::div[1]/div/p", "texts"),
+    "date_posted": "//label[contains(., 'POSTED DATE')]/following-sibling::p[1]",
+    "job_type": "//label[contains(., 'WORKING TYPE')]/following-sibling::p[1]",
+    "salary": "//h1[@name='title']/parent::div/parent::div/following-sibling::div[1]/div/span",
+    "job_level": "//label[contains(., 'JOB LEVEL')]/following-sibling::p[1]",
+    "job_function": "//label[contains(., 'JOB FUNCTION')]/following-sibling::p[1]",
+    "year_of_experience": "//label[contains(., 'YEAR OF EXPERIENCE')]/following-sibling::p[1]",
+    "education_level": "//label[contains(., 'EDUCATION LEVEL')]/following-sibling::p[1]",
+    "age_preference": "//label[contains(., 'AGE PREFERENCE')]/following-sibling::p[1]",
+    "skill": "//label[contains(., 'SKILL')]/following-sibling::p[1]",
+    "preferred_language": "//label[contains(., 'PREFERRED LANGUAGE')]/following-sibling::p[1]",
+    "nationality": "//label[contains(., 'NATIONALITY')]/following-sibling::p[1]",
+    "description": "//h2[contains(., 'Job description')]/parent::div",
+    "requirement": "//h2[contains(., 'Job requirements')]/parent::div",
+    "company": "//p[contains(., 'Scam detection')]/parent::div/parent::div/preceding-sibling::div[1]/div[2]/a",
+    "company_logo": ("//p[contains(., 'Scam detection')]/parent::div/parent::div/preceding-sibling::div[1]/div[1]/div[2]/span/img", "attr", "src"),
+    "company_url": ("//p[contains(., 'Scam detection')]/parent::div/parent::div/preceding-sibling::div[1]/div[2]/a", "attr", "href"),
+}
+OTHER_JOB_DATA_FIELDS = ["year_of_experience", "education_level", "age_preference", "skill", "preferred_language", "nationality"]
+# Search result card texts fingerprinted to tell whether a posting changed since the last crawl
+CARD_SELECTOR = ".view_job_item"
+CARD_FIELDS = {
+    "title": "h2",
+    "company": "a[href*='/nha-tuyen-dung/']",
+    "salary": ".salary",
+    "date_posted": ".time",
+}
+COMPANY_FIELDS = {
+    "company_industry": "//p[contains(@class, 'type') and contains(., 'Industry')]/following-sibling::p[1]",
+    "company_addresses": "//p[contains(@class, 'type') and contains(., 'Address')]/following-sibling::div/div",
+    "company_num_emp": "//p[contains(@class, 'type') and contains(., 'Size')]/following-sibling::p[1]",
+    "company_description": "//h2[contains(., 'About Us')]/following-sibling::div[1]/div/p",
+}
+COMPANY_PROFILE_FIELDS = ["company_industry", "company_addresses", "company_num_emp", "company_description"]
+# Job pages are client-rendered, only archived pages captured from the browser carry these
+HTTP_REQUIRED_FIELDS = ["title", "date_posted", "job_type"]
 
 async def scroll_to_bottom(page, pause=1):
     last_height = await page.evaluate("document.body.scrollHeight")
@@ -67,464 +89,309 @@ async def parse_location(page, selector):
     else:
         return NA
 
-async def parse_date_posted(page, selector):
-    date_posted_text = await parse_text_content(page, selector)
-    if not pd.isna(date_posted_text):
-        date_posted_text = date_posted_text.lower()
-        try:
-            date_posted_object = datetime.strptime(date_posted_text, "%d %b %Y")
-            return date_posted_object.strftime("%Y-%m-%d")
-        except ValueError:
-            pass
-        match = re.search(
-            r"(\d+)\s*(second|minute|hour|day|week|month|year)",
-            date_posted_text
-        )
-        if match:
-            num = int(match.group(1))
-            unit = match.group(2)
-            delta = timedelta()
-            if unit == "second":
-                delta = timedelta(seconds = num)
-            elif unit == "minute":
-                delta = timedelta(minutes = num)
-            elif unit == "hour":
-                delta = timedelta(hours = num)
-            elif unit == "day":
-                delta = timedelta(days = num)
-            elif unit == "week":
-                delta = timedelta(weeks = num)
-            elif unit == "month":
-                delta = timedelta(days = 30 * num)
-            elif unit == "year":
-                delta = timedelta(days = 365 * num)
-            date_posted_object = datetime.today() - delta
-            return date_posted_object.strftime("%Y-%m-%d")
-        if "yesterday" in date_posted_text:
-            return (datetime.today() - timedelta(days = 1)).strftime("%Y-%m-%d")
-        elif "today" in date_posted_text:
-            return datetime.today().strftime("%Y-%m-%d")
-        return date_posted_text
-    else:
-        return NA
+async def parse_date_posted(page, selector, date_normalizer):
+    return date_normalizer.normalize(await parse_text_content(page, selector))
 
-async def parse_salary(page, currency_values):
+async def parse_salary(page, salary_rules):
     try:
-        salary_text = (await page.locator(
-            "//h1[@name='title']/parent::div/parent::div/following-sibling::div[1]/div/span"
-        ).text_content()).strip().lower()
+        salary_text = await parse_text_content(page, JOB_FIELDS["salary"])
     except Exception:
         return NA, NA, NA, NA, NA
+    return parse_salary_text(salary_text, salary_rules)
 
-    if salary_text != "negotiable" and salary_text != "competitive":
-        salary_source = "direct_data"
-        numbers = re.findall(
-            r"\d+(?:,\d+)*(?:\.\d+)?\s*(?:million|mil|m|k|thousand|thousands)?\b",
-            salary_text,
-            re.IGNORECASE
-        )
-        parsed_numbers = []
-        for n in numbers:
-            n = n.replace(",","").strip()
-            if re.search(r"(million|mil|m)\b", n):
-                num_part = re.sub(r"(million|mil|m)\b", "", n).strip()
-                parsed_numbers.append(int(float(num_part) * 1_000_000))
-            elif re.search(r"(k|thousand|thousands)\b", n):
-                num_part = re.sub(r"(k|thousand|thousands)\b", "", n).strip()
-                parsed_numbers.append(int(float(num_part) * 1_000))
-            else:
-                parsed_numbers.append(int(float(n)))
-        if len(parsed_numbers) > 1:
-            min_amount = min(parsed_numbers)
-            max_amount = max(parsed_numbers)
-        elif "up to" in salary_text:
-            min_amount = 0
-            max_amount = parsed_numbers[0]
-        elif "starting from" in salary_text:
-            min_amount = parsed_numbers[0]
-            max_amount = 0
-        elif len(parsed_numbers) == 1:
-            min_amount = parsed_numbers[0]
-            max_amount = parsed_numbers[0]
-        else:
-            min_amount = NA
-            max_amount = NA
-        currency = NA
-        for c in currency_values:
-            if c.lower() in salary_text:
-                currency = currency_values[c]
-                break
-        if "year" in salary_text:
-            interval = "yearly"
-        elif "month" in salary_text:
-            interval = "monthly"
-        elif "week" in salary_text:
-            interval = "weekly"
-        elif "day" in salary_text:
-            interval = "daily"
-        elif "hour" in salary_text:
-            interval = "hourly"
-        else:
-            interval = NA
-        return salary_source, interval, min_amount, max_amount, currency
-    else:
-        return NA, NA, NA, NA, NA
+def clean_not_shown(text):
+    return NA if pd.isna(text) or text == "Not shown" else text
 
 async def parse_other_job_data(page):
     try:
-        year_of_experience_text = (await page.locator(
-            "//label[contains(., 'YEAR OF EXPERIENCE')]/following-sibling::p[1]"
-        ).text_content()).strip()
-        year_of_experience = year_of_experience_text if year_of_experience_text != "Not shown" else NA
-
-        education_level_text = (await page.locator(
-            "//label[contains(., 'EDUCATION LEVEL')]/following-sibling::p[1]"
-        ).text_content()).strip()
-        education_level = education_level_text if education_level_text != "Not shown"  else NA
-
-        age_preference_text = (await page.locator(
-            "//label[contains(., 'AGE PREFERENCE')]/following-sibling::p[1]"
-        ).text_content()).strip()
-        age_preference = age_preference_text if age_preference_text != "Not shown" else NA
-
-        skill_text = (await page.locator(
-            "//label[contains(., 'SKILL')]/following-sibling::p[1]"
-        ).text_content()).strip()
-        skill = skill_text if skill_text != "Not shown" or pd.isna(skill_text) else NA
-
-        preferred_language_text = (await page.locator(
-            "//label[contains(., 'PREFERRED LANGUAGE')]/following-sibling::p[1]"
-        ).text_content()).strip()
-        preferred_language = preferred_language_text if preferred_language_text != "Not shown" else NA
-
-        nationality_text = (await page.locator(
-            "//label[contains(., 'NATIONALITY')]/following-sibling::p[1]"
-        ).text_content()).strip()
-        nationality = nationality_text if nationality_text != "Not shown" else NA
+        other_job_data = []
+        for field in OTHER_JOB_DATA_FIELDS:
+            text = (await page.locator(JOB_FIELDS[field]).text_content()).strip()
+            other_job_data.append(clean_not_shown(text))
     except Exception:
-        year_of_experience = education_level = age_preference = skill = preferred_language = nationality = NA
-    return year_of_experience, education_level, age_preference, skill, preferred_language, nationality
+        other_job_data = [NA] * len(OTHER_JOB_DATA_FIELDS)
+    return tuple(other_job_data)
 
-async def parse_company_info(page):
-    company_locator = page.locator(
-        "//p[contains(., 'Scam detection')]/parent::div/parent::div/preceding-sibling::div[1]/div[2]/a")
+async def fetch_company_profile(page, company_url):
+    await page.goto(company_url)
+    await expand_content(
+        page,
+        "//h2[contains(., 'About Us')]/following-sibling::div[1]/div/span[contains(., 'Read more')]",
+        "vietnamworks",
+        full_text_selector=COMPANY_FIELDS["company_description"]
+    )
+    await capture_page(page, "company", "vietnamworks_vn", company_url)
+    company_industry = await parse_text_content(page, COMPANY_FIELDS["company_industry"])
+    company_addresses = await parse_text_content(page, COMPANY_FIELDS["company_addresses"])
+    company_num_emp = await parse_text_content(page, COMPANY_FIELDS["company_num_emp"])
+    company_description = await parse_text_content(page, COMPANY_FIELDS["company_description"])
+    return {
+        "company_industry": company_industry,
+        "company_addresses": company_addresses,
+        "company_num_emp": company_num_emp,
+        "company_description": company_description,
+    }
+
+async def fetch_company_profile_http(fetcher, company_url):
+    document = await fetcher.fetch_document(company_url, "company", "vietnamworks_vn")
+    if document is None:
+        raise RuntimeError(f"Company page unavailable over HTTP: {company_url}")
+    print(f"Company URL: {company_url}")
+    return extract_raw_fields_from_html(document, COMPANY_FIELDS)
+
+async def lookup_company_profile(page, company_url, company_cache):
+    if pd.isna(company_url):
+        return {field: NA for field in COMPANY_PROFILE_FIELDS}
+    return await company_cache.get_or_fetch(
+        company_url,
+        lambda: fetch_company_profile(page, company_url)
+    )
+
+def company_logo_url(company_logo_src):
+    return NA if pd.isna(company_logo_src) else "https://www.vietnamworks.com" + company_logo_src
+
+async def parse_company_link(page):
+    company_locator = page.locator(JOB_FIELDS["company"])
     if await company_locator.count() > 0:
         company = (await company_locator.text_content()).strip()
-        company_logo = "https://www.vietnamworks.com" + (await page.locator(
-            "//p[contains(., 'Scam detection')]/parent::div/parent::div/preceding-sibling::div[1]/div[1]/div[2]/span/img"
-        ).get_attribute("src"))
-        company_url = await page.locator(
-            "//p[contains(., 'Scam detection')]/parent::div/parent::div/preceding-sibling::div[1]/div[2]/a"
-        ).get_attribute("href")
-        await page.goto(company_url)
-        read_more_button = page.locator(
-            "//h2[contains(., 'About Us')]/following-sibling::div[1]/div/span[contains(., 'Read more')]")
-        while await read_more_button.count() > 0:
-            await read_more_button.click(force=True)
-            await page.wait_for_timeout(500)
-        company_industry = await parse_text_content(
-            page,
-            "//p[contains(@class, 'type') and contains(., 'Industry')]/following-sibling::p[1]"
-        )
-        company_addresses = await parse_text_content(
-            page,
-            "//p[contains(@class, 'type') and contains(., 'Address')]/following-sibling::div/div"
-        )
-        company_num_emp = await parse_text_content(
-            page,
-            "//p[contains(@class, 'type') and contains(., 'Size')]/following-sibling::p[1]"
-        )
-        company_description = await parse_text_content(
-            page,
-            "//h2[contains(., 'About Us')]/following-sibling::div[1]/div/p"
-        )
+        company_logo = company_logo_url(await page.locator(JOB_FIELDS["company_logo"][0]).get_attribute("src"))
+        company_url = await page.locator(JOB_FIELDS["company_url"][0]).get_attribute("href")
+        return company, company_logo, company_url
+    return NA, NA, NA
+
+async def parse_job_fields(page, salary_rules, date_normalizer):
+    # Per-field fallback: one browser round-trip per selector
+    salary_source, interval, min_amount, max_amount, currency = await parse_salary(page, salary_rules)
+    year_of_experience, education_level, age_preference, skill, preferred_language, nationality = await parse_other_job_data(page)
+    company, company_logo, company_url = await parse_company_link(page)
+    return {
+        "title": await parse_text_content(page, JOB_FIELDS["title"]),
+        "location": await parse_location(page, "//h2[contains(., 'Job Locations')]/following-sibling::div[1]/div"),
+        "date_posted": await parse_date_posted(page, JOB_FIELDS["date_posted"], date_normalizer),
+        "job_type": await parse_text_content(page, JOB_FIELDS["job_type"]),
+        "salary_source": salary_source,
+        "interval": interval,
+        "min_amount": min_amount,
+        "max_amount": max_amount,
+        "currency": currency,
+        "job_level": await parse_text_content(page, JOB_FIELDS["job_level"]),
+        "job_function": await parse_text_content(page, JOB_FIELDS["job_function"]),
+        "year_of_experience": year_of_experience,
+        "education_level": education_level,
+        "age_preference": age_preference,
+        "skill": skill,
+        "preferred_language": preferred_language,
+        "nationality": nationality,
+        "description": await parse_text_content(page, JOB_FIELDS["description"]),
+        "requirement": await parse_text_content(page, JOB_FIELDS["requirement"]),
+        "company": company,
+        "company_logo": company_logo,
+        "company_url": company_url,
+    }
+
+def post_process_job_fields(raw, salary_rules, date_normalizer):
+    salary_source, interval, min_amount, max_amount, currency = parse_salary_text(raw["salary"], salary_rules)
+    fields = {
+        "title": raw["title"],
+        "location": raw["location"],
+        "date_posted": date_normalizer.normalize(raw["date_posted"]),
+        "job_type": raw["job_type"],
+        "salary_source": salary_source,
+        "interval": interval,
+        "min_amount": min_amount,
+        "max_amount": max_amount,
+        "currency": currency,
+        "job_level": raw["job_level"],
+        "job_function": raw["job_function"],
+    }
+    for field in OTHER_JOB_DATA_FIELDS:
+        fields[field] = clean_not_shown(raw[field])
+    fields["description"] = raw["description"]
+    fields["requirement"] = raw["requirement"]
+    fields["company"] = raw["company"]
+    fields["company_logo"] = company_logo_url(raw["company_logo"])
+    fields["company_url"] = raw["company_url"]
+    return fields
+
+async def extract_job_fields(page, salary_rules, date_normalizer):
+    # Bulk extraction: every selector in JOB_FIELDS resolved by one page.evaluate
+    raw = await extract_raw_fields(page, JOB_FIELDS)
+    return post_process_job_fields(raw, salary_rules, date_normalizer)
+
+def job_id_from_link(link):
+    match = re.search(r"-(\d+)-jd", link)
+    return match.group(1) if match else link
+
+async def scrape_single_job(page, link, salary_rules, date_normalizer, company_cache):
+    job_id = job_id_from_link(link)
+    job_url = f"https://www.vietnamworks.com/{link}"
+    print(job_url)
+    await page.goto(job_url, wait_until="domcontentloaded")
+
+    # Ensure page is fully loaded
+    await scroll_to_bottom(page, pause=2)
+    await page.wait_for_selector("//h2[contains(., 'Job Information')]/following-sibling::div[last()]/div[1]//button[contains(., 'View more')]")
+
+    await expand_content(
+        page,
+        "//h2[contains(., 'Job Information')]/following-sibling::div[last()]/div[1]//button[contains(., 'View more')]",
+        "vietnamworks",
+        hover=True
+    )
+    await expand_content(
+        page,
+        "//button[contains(., 'View full job description')]",
+        "vietnamworks",
+        full_text_selector=JOB_FIELDS["description"],
+        hover=True
+    )
+
+    # Ensure key data are loaded
+    await page.wait_for_selector(JOB_FIELDS["date_posted"], timeout=15000)
+    await page.wait_for_selector(JOB_FIELDS["job_type"], timeout=15000)
+    await capture_page(page, "job", "vietnamworks_vn", job_url, job_id)
+
+    if EXTRACTION_MODE == "per_field":
+        fields = await parse_job_fields(page, salary_rules, date_normalizer)
     else:
-        return NA, NA, NA, NA, NA, NA, NA
-    return company, company_industry, company_url, company_logo, company_addresses, company_num_emp, company_description
+        fields = await extract_job_fields(page, salary_rules, date_normalizer)
+        if EXTRACTION_MODE == "compare":
+            report_differences(job_url, fields, await parse_job_fields(page, salary_rules, date_normalizer))
+    profile = await lookup_company_profile(page, fields["company_url"], company_cache)
+    return build_job_record(job_id, job_url, fields, profile)
+
+def build_job_record(job_id, job_url, fields, profile):
+    return {
+        "id": job_id,
+        "site": "vietnamworks",
+        "job_url": job_url,
+        "job_url_direct": NA,
+        "title": fields["title"],
+        "company": fields["company"],
+        "location": fields["location"],
+        "date_posted": fields["date_posted"],
+        "job_type": fields["job_type"],
+        "salary_source": fields["salary_source"],
+        "interval": fields["interval"],
+        "min_amount": fields["min_amount"],
+        "max_amount": fields["max_amount"],
+        "currency": fields["currency"],
+        "is_remote": NA,
+        "work_setup": NA,
+        "job_level": fields["job_level"],
+        "job_function": fields["job_function"],
+        "year_of_experience": fields["year_of_experience"],
+        "education_level": fields["education_level"],
+        "age_preference": fields["age_preference"],
+        "skill": fields["skill"],
+        "preferred_language": fields["preferred_language"],
+        "nationality": fields["nationality"],
+        "listing_type": NA,
+        "emails": NA,
+        "description": fields["description"],
+        "requirement": fields["requirement"],
+        "company_industry": profile["company_industry"],
+        "company_url": fields["company_url"],
+        "company_logo": fields["company_logo"],
+        "company_url_direct": NA,
+        "company_addresses": profile["company_addresses"],
+        "company_num_emp": profile["company_num_emp"],
+        "company_description": profile["company_description"],
+    }
 
-def save_error_links(error_links, keyword, retry_attempt=0):
-    if not error_links:
+async def scrape_single_job_http(fetcher, link, salary_rules, date_normalizer, company_cache):
+    # Reads archived pages, the live ones only fill in once the browser runs their scripts
+    job_id = job_id_from_link(link)
+    job_url = f"https://www.vietnamworks.com/{link}"
+    document = await fetcher.fetch_document(job_url, "job", "vietnamworks_vn", job_id)
+    if document is None:
         return None
-    os.makedirs("data", exist_ok=True)
-    if retry_attempt > 0:
-        filename = f"data/vietnamworks_vn_{keyword}_retry_{retry_attempt}_errors.csv"
-    else:
-        filename = f"data/vietnamworks_vn_{keyword}_errors.csv"
-    error_df = pd.DataFrame(error_links, columns=['job_link'])
-    error_df.to_csv(filename, index=False, encoding='utf-8-sig')
-    print(f"Error links saved to: {filename}")
-    return filename
-
-def save_job_data(job_data, keyword, retry_attempt=0, is_rescraping=False):
-    if not job_data:
-        print("No job data to save")
+    print(f"Job URL (HTTP): {job_url}")
+    raw = extract_raw_fields_from_html(document, JOB_FIELDS)
+    if not has_required_fields(raw, HTTP_REQUIRED_FIELDS):
+        print(f"Job page was not rendered: {job_url}")
         return None
-    data_frame = pd.DataFrame(job_data)
-    if is_rescraping:
-        filename = f"data/vietnamworks_vn_{keyword}_rescraped.csv"
-    elif retry_attempt > 0:
-        filename = f"data/vietnamworks_vn_{keyword}_retry_{retry_attempt}.csv"
+    fields = post_process_job_fields(raw, salary_rules, date_normalizer)
+    if pd.isna(fields["company_url"]):
+        profile = {field: NA for field in COMPANY_PROFILE_FIELDS}
     else:
-        filename = f"data/vietnamworks_vn_{keyword}.csv"
-    data_frame.to_csv(
-        filename,
-        index=False,
-        quotechar='"',
-        escapechar='\\',
-        encoding='utf-8-sig'
-    )
-    print(f"Data saved to: {filename} ({len(job_data)} records)")
-    return filename
+        profile = await company_cache.get_or_fetch(
+            fields["company_url"],
+            lambda: fetch_company_profile_http(fetcher, fields["company_url"])
+        )
+    return build_job_record(job_id, job_url, fields, profile)
 
-async def scrape_single_job(page, link, currency_values):
+async def harvest_result_page(page, url, page_number, cards=None):
+    await page.goto(url, timeout = 30000)
+    await scroll_to_bottom(page, pause=2)
     try:
-        job_id = re.search(r"-(\d+)-jd", link).group(1)
-        job_url = f"https://www.vietnamworks.com/{link}"
-        print(job_url)
-        await page.goto(job_url, wait_until="domcontentloaded")
-        
-        # Ensure page is fully loaded
-        await scroll_to_bottom(page, pause=2)
-        await page.wait_for_selector("//h2[contains(., 'Job Information')]/following-sibling::div[last()]/div[1]//button[contains(., 'View more')]")
-
-        site_buttons = [
-            page.locator("//h2[contains(., 'Job Information')]/following-sibling::div[last()]/div[1]//button[contains(., 'View more')]"),
-            page.locator("//button[contains(., 'View full job description')]")
-        ]
-        for button in site_buttons:
-            while await button.is_visible():
-                await button.hover()
-                await button.click(force=True)
-                await page.wait_for_timeout(500)
-
-        title = await parse_text_content(page, "h1[name='title']")
-        location = await parse_location(page, "//h2[contains(., 'Job Locations')]/following-sibling::div[1]/div")
-
-        # Ensure key data are loaded
-        await page.wait_for_selector("//label[contains(., 'POSTED DATE')]/following-sibling::p[1]", timeout=15000)
-        await page.wait_for_selector("//label[contains(., 'WORKING TYPE')]/following-sibling::p[1]", timeout=15000)
-
-        date_posted = await parse_date_posted(page, "//label[contains(., 'POSTED DATE')]/following-sibling::p[1]")
-        job_type = await parse_text_content(page, "//label[contains(., 'WORKING TYPE')]/following-sibling::p[1]")
-        salary_source, interval, min_amount, max_amount, currency = await parse_salary(page, currency_values)
-        job_level = await parse_text_content(page, "//label[contains(., 'JOB LEVEL')]/following-sibling::p[1]")
-        job_function = await parse_text_content(page, "//label[contains(., 'JOB FUNCTION')]/following-sibling::p[1]")
-        year_of_experience, education_level, age_preference, skill, preferred_language, nationality = await parse_other_job_data(page)
-        description = await parse_text_content(page, "//h2[contains(., 'Job description')]/parent::div")
-        requirement = await parse_text_content(page, "//h2[contains(., 'Job requirements')]/parent::div")
-        company, company_industry, company_url, company_logo, company_addresses, company_num_emp, company_description = await parse_company_info(page)
-        return {
-            "id": job_id,
-            "site": "vietnamworks",
-            "job_url": job_url,
-            "job_url_direct": NA,
-            "title": title,
-            "company": company,
-            "location": location,
-            "date_posted": date_posted,
-            "job_type": job_type,
-            "salary_source": salary_source,
-            "interval": interval,
-            "min_amount": min_amount,
-            "max_amount": max_amount,
-            "currency": currency,
-            "is_remote": NA,
-            "work_setup": NA,
-            "job_level": job_level,
-            "job_function": job_function,
-            "year_of_experience": year_of_experience,
-            "education_level": education_level,
-            "age_preference": age_preference,
-            "skill": skill,
-            "preferred_language": preferred_language,
-            "nationality": nationality,
-            "listing_type": NA,
-            "emails": NA,
-            "description": description,
-            "requirement": requirement,
-            "company_industry": company_industry,
-            "company_url": company_url,
-            "company_logo": company_logo,
-            "company_url_direct": NA,
-            "company_addresses": company_addresses,
-            "company_num_emp": company_num_emp,
-            "company_description": company_description,
-        }
-    except Exception as e:
-        print(f"Error scraping {link}: {e}")
-        return None
-
-async def process_job_links(job_links, currency_values, retry_attempt=0):
-    job_data = []
-    error_links = []
-    total_processed = 0
-    async with async_playwright() as pw:
-        async def start_browser():
-            browser = await pw.chromium.launch(headless=False)
-            context = await browser.new_context()
-            return browser, context
-        browser, context = await start_browser()
-        while total_processed < len(job_links):
-            batch_links = job_links[total_processed: total_processed + BATCH_LIMIT]
-            print(f"\n--- Processing batch: {len(batch_links)} jobs ---")
-            sem = asyncio.Semaphore(CONCURRENCY_LIMIT)
-            async def bound_scrape(link):
-                async with sem:
-                    page = await context.new_page()
-                    data = await scrape_single_job(page, link, currency_values)
-                    await page.close()
-                    if data:
-                        job_data.append(data)
-                    else:
-                        error_links.append(link)
-            await asyncio.gather(*(bound_scrape(link) for link in batch_links))
-            total_processed += len(batch_links)
-            await browser.close()
-            if total_processed < len(job_links):
-                print(f"\n--- Restarting browser after {total_processed} jobs ---")
-                browser, context = await start_browser()
-        await browser.close()
-    return job_data, error_links
-
-async def extract_job_links(keyword, max_pages):
-    async with async_playwright() as pw:
-        browser = await pw.chromium.launch(headless=False)
-        context = await browser.new_context()
-        page = await context.new_page()
-        job_links = []
-        seen_links = set()
-        current_page = 1
-        consecutive_empty_pages = 0
-        max_consecutive_empty = 3
-        print("Extracting Job Links")
-        while current_page <= max_pages and consecutive_empty_pages < max_consecutive_empty:
-            url = f"https://www.vietnamworks.com/jobs?q={keyword}&page={current_page}&sorting=relevant"
-            print(f"Scraping page {current_page}: {url}")
-            try:
-                await page.goto(url, timeout = 30000)
-                await scroll_to_bottom(page, pause=2)
-                try:
-                    await page.wait_for_selector(
-                        "a.img_job_card",
-                        timeout=10000
-                    )
-                except Exception:
-                    print(f"Timeout waiting for results on page {current_page}")
-                    consecutive_empty_pages += 1
-                    current_page += 1
-                    continue
-                card_links = page.locator("a.img_job_card")
-                link_count = await card_links.count()
-                if link_count == 0:
-                    consecutive_empty_pages += 1
-                    print(f"No job links found on page {current_page}. Empty pages count: {consecutive_empty_pages}")
-                    no_result_indicator = page.locator(
-                        "//div[@class='noResultWrapper animated fadeIn']/div/h2[contains(., 'We have not found jobs for this search at the moment')]"
-                    )
-                    page_reached_end = False
-                    if await no_result_indicator.count() > 0:
-                        consecutive_empty_pages += 1
-                        print(f"End of results detected on page {current_page}")
-                        page_reached_end = True
-                    if page_reached_end:
-                        print("Reached end of job listings")
-                        break
-                else:
-                    consecutive_empty_pages = 0
-                    page_job_links = []
-                    for link_index in range(link_count):
-                        link_href = await card_links.nth(link_index).get_attribute("href")
-                        if link_href and link_href not in seen_links:
-                            job_links.append(link_href)
-                            seen_links.add(link_href)
-                            page_job_links.append(link_href)
-                    print(f"Found {len(page_job_links)} new job links on page {current_page}")
-            except Exception as e:
-                print(f"Error scraping page {current_page}: {str(e)}")
-                consecutive_empty_pages += 1
-            current_page += 1
-        print(f"\nTotal Job Links collected: {len(job_links)} from {current_page - 1} pages")
-        print(f"Unique Job Links collected: {len(seen_links)}")
-        await browser.close()
-    return job_links
-
-async def web_scraper(is_rescraping, link_file_name, keyword="data-analyst", max_pages=2, max_retries=2):
-    print("Initiating VietnamWorks Scraper with Batch/Retry Logic")
-    print(f"{keyword} {max_pages}")
-    os.makedirs("data", exist_ok=True)
-    currency_values = {
-        "đ": "VND",
-        "₫": "VND",
-        "VND": "VND",
-        "$": "USD",
-        "USD": "USD"
-    }
-    if is_rescraping:
-        job_links_df = pd.read_csv(f"data/{link_file_name}", header=None)
-        job_links = job_links_df[0].tolist()
-        print(f"Loaded {len(job_links)} links from file for re-scraping")
-    else:
-        job_links = await extract_job_links(keyword, max_pages)
-        if not job_links:
-            print("No job links found. Exiting.")
-            return
-    all_job_data = []
-    current_links = job_links
-    retry_attempt = 0
-    while current_links and retry_attempt <= max_retries:
-        print(f"\n{'='*60}")
-        if retry_attempt == 0:
-            print("INITIAL SCRAPING ATTEMPT")
-        else:
-            print(f"RETRY ATTEMPT {retry_attempt}")
-        print(f"{'='*60}")
-        job_data, error_links = await process_job_links(
-            current_links, currency_values, retry_attempt
+        await page.wait_for_selector(
+            "a.img_job_card",
+            timeout=10000
         )
-        all_job_data.extend(job_data)
-        if job_data:
-            save_job_data(job_data, keyword, retry_attempt, is_rescraping)
-        if error_links:
-            print(f"\nFound {len(error_links)} failed links")
-            error_file = save_error_links(error_links, keyword, retry_attempt)
-            if retry_attempt < max_retries:
-                print(f"Will retry {len(error_links)} failed links in next attempt...")
-                current_links = error_links
-                retry_attempt += 1
-            else:
-                print(f"Max retries ({max_retries}) reached. {len(error_links)} links still failed.")
-                break
-        else:
-            print("No error links found. All jobs processed successfully!")
-            break
-    if all_job_data:
-        print(f"\n{'='*60}")
-        print("FINAL CONSOLIDATION")
-        print(f"{'='*60}")
-        if is_rescraping:
-            final_filename = f"data/vietnamworks_vn_{keyword}_rescraped_final.csv"
-        else:
-            final_filename = f"data/vietnamworks_vn_{keyword}_final.csv"
-        final_df = pd.DataFrame(all_job_data)
-        final_df.to_csv(
-            final_filename,
-            index=False,
-            quotechar='"',
-            escapechar='\\',
-            encoding='utf-8-sig'
+    except Exception:
+        no_result_indicator = page.locator(
+            "//div[@class='noResultWrapper animated fadeIn']/div/h2[contains(., 'We have not found jobs for this search at the moment')]"
+        )
+        if await no_result_indicator.count() > 0:
+            return None
+        print(f"Timeout waiting for results on page {page_number}")
+        return []
+    await capture_page(page, "listing", "vietnamworks_vn", url)
+    return await harvest_cards(page.locator("a.img_job_card"), CARD_SELECTOR, CARD_FIELDS, cards)
+
+
+class VietnamWorksAdapter(SiteAdapter):
+    """vietnamworks.com: keyword search pages and client-rendered job pages with collapsed sections"""
+
+    title = "VietnamWorks"
+    site = "vietnamworks"
+    reparses_archive = True
+
+    def __init__(self, keyword="data-analyst", max_pages=2):
+        super().__init__("vietnamworks_vn", keyword, max_pages)
+
+    def job_id_from_link(self, link):
+        return job_id_from_link(link)
+
+    def link_from_url(self, url):
+        return url.split("vietnamworks.com/", 1)[-1]
+
+    def search_url(self, page_number):
+        return f"https://www.vietnamworks.com/jobs?q={self.keyword}&page={page_number}&sorting=relevant"
+
+    async def extract_job_links(self, context):
+        cards = {}
+        job_links = await extract_paginated_links(
+            context,
+            self.search_url,
+            lambda page, url, page_number: harvest_result_page(page, url, page_number, cards),
+            self.max_pages
         )
-        print(f"Final consolidated data saved to: {final_filename}")
-        print(f"Total successful jobs scraped: {len(all_job_data)}")
-        initial_links = len(job_links)
-        successful_jobs = len(all_job_data)
-        failed_jobs = initial_links - successful_jobs
-        success_rate = (successful_jobs / initial_links) * 100 if initial_links > 0 else 0
-        print(f"\nSCRAPING SUMMARY:")
-        print(f"Initial job links: {initial_links}")
-        print(f"Successfully scraped: {successful_jobs}")
-        print(f"Failed to scrape: {failed_jobs}")
-        print(f"Success rate: {success_rate:.1f}%")
-        print(f"Total retry attempts: {retry_attempt}")
+        self.card_fingerprints = {link: card_fingerprint(texts, self.date_normalizer) for link, texts in cards.items()}
+        return job_links
+
+    async def job_fields(self, page):
+        return JOB_FIELDS
+
+    async def parse_job_page(self, page, per_field=False):
+        return await (parse_job_fields if per_field else extract_job_fields)(page, SALARY_RULES, self.date_normalizer)
+
+    async def fetch_company_page(self, page, company_url):
+        return await fetch_company_profile(page, company_url)
+
+    async def harvest_listing(self, page, url):
+        return await harvest_result_page(page, url, 1)
+
+    async def scrape_job(self, page, link, company_cache):
+        return await scrape_single_job(page, link, SALARY_RULES, self.date_normalizer, company_cache)
+
+    async def scrape_job_http(self, fetcher, link, company_cache):
+        return await scrape_single_job_http(fetcher, link, SALARY_RULES, self.date_normalizer, company_cache)
+
+async def web_scraper(is_rescraping, link_file_name, keyword="data-analyst", max_pages=2, max_retries=2, incremental=False, resume=False, shards=1, distributed=False):
+    engine = CrawlEngine(VietnamWorksAdapter(keyword, max_pages), max_retries, incremental, resume, shards, distributed)
+    await engine.run(is_rescraping, link_file_name)
 
 if __name__ == "__main__":
     print("| = | = | = | Vietnam Works Web Scraper with Batch/Retry | = | = | = |")
@@ -533,13 +400,21 @@ if __name__ == "__main__":
     if is_rescraping:
         print("Note: The filename format is vietnamworks_vn_{keyword}_errors.csv")
         link_file_name = input("File name the CSV file from the data folder: ").strip()
-        keyword = link_file_name.replace("vietnamworks_vn_", "").replace("_errors.csv", "").replace("_retry_", "_")
+        keyword = link_file_name.replace("vietnamworks_vn_", "").replace("_errors.csv", "")
         max_pages = 0
+        incremental = False
         max_retries = int(input("Maximum retry attempts (default 2): ") or "2")
     else:
         keyword = input("Keyword (e.g., data analyst): ").strip().replace(" ", "-")
         max_pages = int(input("Maximum pages to scrape (default 50): ") or "50")
         max_retries = int(input("Maximum retry attempts for failed links (default 2): ") or "2")
+        incremental_input = input("Only scrape new or stale postings? (Y/N): ").lower().strip()
+        incremental = True if incremental_input == "y" else False
         link_file_name = ""
-    log_file = setup_logging(is_rescraping, keyword)
-    asyncio.run(web_scraper(is_rescraping, link_file_name, keyword, max_pages, max_retries))
\ No newline at end of file
+    resume_input = input("Resume from the last run's journal? (Y/N): ").lower().strip()
+    resume = True if resume_input == "y" else False
+    shards = int(input("Worker processes for scraping (default 1): ") or "1")
+    distributed_input = input("Share the links through a work queue other workers can join? (Y/N): ").lower().strip()
+    distributed = True if distributed_input == "y" else False
+    log_file = setup_logging(f"vietnamworks_vn_{keyword}", is_rescraping)
+    asyncio.run(web_scraper(is_rescraping, link_file_name, keyword, max_pages, max_retries, incremental, resume, shards, distributed))
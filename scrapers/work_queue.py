@@ -0,0 +1,244 @@
+# A Work Queue for Distributed Crawling -- job links leased to any number of workers, acknowledged on success
+import importlib
+import json
+import os
+import pickle
+import socket
+import sqlite3
+import sys
+import time
+from record_journal import to_json_value
+
+WORK_QUEUE_BACKEND = "sqlite"
+WORK_QUEUE_PATH = "data/work_queue.sqlite3"
+LEASE_TIMEOUT = 600  # Seconds a worker holds its leased links before anyone may reclaim them
+LEASE_BATCH_SIZE = 50  # Links leased at a time by one worker
+LEASE_MAX = 3  # Leases a link may expire before it is failed instead of crashing yet another worker
+QUEUE_POLL_INTERVAL = 15  # Seconds an idle worker waits for other workers' leases to finish or expire
+
+
+def worker_id():
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def adapter_module(adapter):
+    # A scraper run as a script defines its adapter in __main__, which other processes know by file name
+    module = type(adapter).__module__
+    if module == "__main__":
+        module = os.path.splitext(os.path.basename(sys.modules["__main__"].__file__))[0]
+    return module
+
+
+class WorkQueue:
+    """Backend interface: links are put once, leased to a worker, then acked, failed or released"""
+
+    def __init__(self, name, lease_timeout=LEASE_TIMEOUT):
+        self.name = name  # One queue per run, e.g. "vietnamworks_vn_data-analyst"
+        self.lease_timeout = lease_timeout
+        self.stats = {"queued": 0, "leased": 0, "acked": 0, "failed": 0, "released": 0, "reclaimed": 0}
+
+    def publish(self, adapter, max_retries):
+        # Stores what a joining worker needs to build the same adapter
+        raise NotImplementedError
+
+    def load_adapter(self):
+        # Returns (adapter, max_retries) as published by the run that created the queue
+        raise NotImplementedError
+
+    def clear(self):
+        raise NotImplementedError
+
+    def put(self, job_links):
+        raise NotImplementedError
+
+    def lease(self, worker, count=LEASE_BATCH_SIZE):
+        raise NotImplementedError
+
+    def extend(self, worker, job_links):
+        raise NotImplementedError
+
+    def ack(self, worker, job_link, record):
+        raise NotImplementedError
+
+    def fail(self, worker, job_link):
+        raise NotImplementedError
+
+    def release(self, worker, job_links):
+        raise NotImplementedError
+
+    def counts(self):
+        raise NotImplementedError
+
+    def results(self):
+        # Yields (job_link, record) for every acknowledged link
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+    def print_stats(self):
+        stats = self.stats
+        counts = self.counts()
+        print(f"Work queue {self.name}: {stats['queued']} queued, {stats['leased']} leased, {stats['acked']} acked, "
+              f"{stats['failed']} failed, {stats['released']} released, {stats['reclaimed']} reclaimed from expired leases "
+              f"(now {counts.get('pending', 0)} pending, {counts.get('leased', 0)} leased, "
+              f"{counts.get('done', 0)} done, {counts.get('failed', 0)} failed)")
+
+
+class SqliteWorkQueue(WorkQueue):
+    """Single-host backend: every worker process opens the same SQLite file"""
+
+    def __init__(self, name, path=WORK_QUEUE_PATH, lease_timeout=LEASE_TIMEOUT):
+        super().__init__(name, lease_timeout)
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        # Autocommit, transactions that lease links are opened explicitly with BEGIN IMMEDIATE
+        self.connection = sqlite3.connect(path, timeout=60, isolation_level=None)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("""
+            CREATE TABLE IF NOT EXISTS queues (
+                name TEXT PRIMARY KEY,
+                adapter_module TEXT NOT NULL,
+                adapter_class TEXT NOT NULL,
+                adapter_state BLOB NOT NULL,
+                max_retries INTEGER NOT NULL,
+                created REAL NOT NULL
+            )
+        """)
+        self.connection.execute("""
+            CREATE TABLE IF NOT EXISTS tasks (
+                queue TEXT NOT NULL,
+                job_link TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT 'pending',
+                worker TEXT,
+                lease_expires REAL,
+                leases INTEGER NOT NULL DEFAULT 0,
+                record TEXT,
+                updated REAL NOT NULL,
+                PRIMARY KEY (queue, job_link)
+            )
+        """)
+        self.connection.execute("CREATE INDEX IF NOT EXISTS tasks_status ON tasks (queue, status)")
+
+    def publish(self, adapter, max_retries):
+        self.connection.execute("""
+            INSERT INTO queues (name, adapter_module, adapter_class, adapter_state, max_retries, created) VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT (name) DO UPDATE SET adapter_module = excluded.adapter_module, adapter_class = excluded.adapter_class,
+                adapter_state = excluded.adapter_state, max_retries = excluded.max_retries
+        """, (self.name, adapter_module(adapter), type(adapter).__name__, pickle.dumps(vars(adapter)), max_retries, time.time()))
+
+    def load_adapter(self):
+        row = self.connection.execute(
+            "SELECT adapter_module, adapter_class, adapter_state, max_retries FROM queues WHERE name = ?", (self.name,)
+        ).fetchone()
+        if row is None:
+            raise KeyError(f"No crawl has published the work queue {self.name}")
+        adapter_class = getattr(importlib.import_module(row[0]), row[1])
+        adapter = adapter_class.__new__(adapter_class)
+        vars(adapter).update(pickle.loads(row[2]))
+        return adapter, row[3]
+
+    def clear(self):
+        self.connection.execute("DELETE FROM tasks WHERE queue = ?", (self.name,))
+
+    def put(self, job_links):
+        """Queue new links and give failed ones another go, returning the number now pending"""
+        now = time.time()
+        self.connection.execute("BEGIN IMMEDIATE")
+        try:
+            self.connection.executemany("""
+                INSERT INTO tasks (queue, job_link, updated) VALUES (?, ?, ?)
+                ON CONFLICT (queue, job_link) DO UPDATE SET status = 'pending', worker = NULL, lease_expires = NULL,
+                    leases = 0, updated = excluded.updated
+                WHERE tasks.status = 'failed'
+            """, [(self.name, link, now) for link in job_links])
+            self.connection.execute("COMMIT")
+        except BaseException:
+            self.connection.execute("ROLLBACK")
+            raise
+        pending = self.counts().get("pending", 0)
+        self.stats["queued"] += pending
+        return pending
+
+    def reclaim(self, now):
+        # Leases of crashed or stuck workers go back to pending, links that keep expiring are failed
+        cursor = self.connection.execute("""
+            UPDATE tasks SET status = CASE WHEN leases >= ? THEN 'failed' ELSE 'pending' END,
+                worker = NULL, lease_expires = NULL, updated = ?
+            WHERE queue = ? AND status = 'leased' AND lease_expires < ?
+        """, (LEASE_MAX, now, self.name, now))
+        if cursor.rowcount > 0:
+            self.stats["reclaimed"] += cursor.rowcount
+            print(f"Reclaimed {cursor.rowcount} links from expired leases in {self.name}")
+
+    def lease(self, worker, count=LEASE_BATCH_SIZE):
+        now = time.time()
+        self.connection.execute("BEGIN IMMEDIATE")
+        try:
+            self.reclaim(now)
+            job_links = [row[0] for row in self.connection.execute(
+                "SELECT job_link FROM tasks WHERE queue = ? AND status = 'pending' ORDER BY rowid LIMIT ?",
+                (self.name, count)
+            )]
+            self.connection.executemany("""
+                UPDATE tasks SET status = 'leased', worker = ?, lease_expires = ?, leases = leases + 1, updated = ?
+                WHERE queue = ? AND job_link = ?
+            """, [(worker, now + self.lease_timeout, now, self.name, link) for link in job_links])
+            self.connection.execute("COMMIT")
+        except BaseException:
+            self.connection.execute("ROLLBACK")
+            raise
+        self.stats["leased"] += len(job_links)
+        return job_links
+
+    def extend(self, worker, job_links):
+        now = time.time()
+        self.connection.executemany("""
+            UPDATE tasks SET lease_expires = ?, updated = ?
+            WHERE queue = ? AND job_link = ? AND worker = ? AND status = 'leased'
+        """, [(now + self.lease_timeout, now, self.name, link, worker) for link in job_links])
+
+    def ack(self, worker, job_link, record):
+        # Accepted even after the lease expired, the record is just as good as a second worker's
+        record = json.dumps({key: to_json_value(value) for key, value in record.items()}, ensure_ascii=False)
+        self.connection.execute("""
+            UPDATE tasks SET status = 'done', worker = ?, lease_expires = NULL, record = ?, updated = ?
+            WHERE queue = ? AND job_link = ? AND status != 'done'
+        """, (worker, record, time.time(), self.name, job_link))
+        self.stats["acked"] += 1
+
+    def fail(self, worker, job_link):
+        self.connection.execute("""
+            UPDATE tasks SET status = 'failed', lease_expires = NULL, updated = ?
+            WHERE queue = ? AND job_link = ? AND worker = ? AND status = 'leased'
+        """, (time.time(), self.name, job_link, worker))
+        self.stats["failed"] += 1
+
+    def release(self, worker, job_links):
+        # Handing links back on shutdown does not count against their lease budget
+        cursor = self.connection.executemany("""
+            UPDATE tasks SET status = 'pending', worker = NULL, lease_expires = NULL, leases = MAX(leases - 1, 0), updated = ?
+            WHERE queue = ? AND job_link = ? AND worker = ? AND status = 'leased'
+        """, [(time.time(), self.name, link, worker) for link in job_links])
+        self.stats["released"] += max(cursor.rowcount, 0)
+
+    def counts(self):
+        return dict(self.connection.execute(
+            "SELECT status, COUNT(*) FROM tasks WHERE queue = ? GROUP BY status", (self.name,)
+        ).fetchall())
+
+    def results(self):
+        cursor = self.connection.execute(
+            "SELECT job_link, record FROM tasks WHERE queue = ? AND status = 'done' ORDER BY rowid", (self.name,)
+        )
+        for job_link, record in cursor:
+            yield job_link, json.loads(record)
+
+    def close(self):
+        self.connection.close()
+
+
+WORK_QUEUE_BACKENDS = {"sqlite": SqliteWorkQueue}
+
+
+def open_work_queue(name, backend=WORK_QUEUE_BACKEND, **options):
+    return WORK_QUEUE_BACKENDS[backend](name, **options)